@@ -201,17 +201,17 @@ Actions:
   mod:stick_thread  Stick or unstick a thread (MyBB-native)
                     --tid=<thread_id> [--sticky=0|1]
 
-  mod:approve_thread Approve or unapprove a thread (MyBB-native)
-                    --tid=<thread_id> [--approve=0|1]
+  mod:approve_thread Approve or unapprove threads (MyBB-native)
+                    --tid=<thread_id> | --tids=<id,id,...> [--approve=0|1]
 
   mod:approve_post  Approve or unapprove a post (MyBB-native)
                     --pid=<post_id> [--approve=0|1]
 
-  mod:soft_delete_thread Soft delete a thread (MyBB-native)
-                    --tid=<thread_id>
+  mod:soft_delete_thread Soft delete threads (MyBB-native)
+                    --tid=<thread_id> | --tids=<id,id,...>
 
-  mod:restore_thread Restore a soft-deleted thread (MyBB-native)
-                    --tid=<thread_id>
+  mod:restore_thread Restore soft-deleted threads (MyBB-native)
+                    --tid=<thread_id> | --tids=<id,id,...>
 
   mod:soft_delete_post Soft delete a post (MyBB-native)
                     --pid=<post_id>
@@ -224,6 +224,10 @@ Actions:
                     [--fid=<forum_id>] [--tid=<thread_id>] [--pid=<post_id>]
                     [--data=<extra>] [--ipaddress=<ip>]
 
+  modlog:add_bulk   Add several moderator log entries in one INSERT
+                    --entries_json=<JSON array of {uid, logaction, fid?,
+                    tid?, pid?, data?, ipaddress?}>
+
   thread:create     Create a new thread (MyBB-native)
                     --fid=<forum_id> --subject=<text> --message=<text>
                     [--uid=<uid>] [--username=<name>]
@@ -333,38 +337,25 @@ function mcp_upsert_template($title, $template, $sid)
         'dateline' => TIME_NOW
     );
 
-    $existing_tid = 0;
     $created = false;
     $sid = (int)$sid;
 
-    if ($sid === -2 || $sid === -1) {
-        $query = $db->simple_select(
-            "templates",
-            "tid",
-            "title='".$db->escape_string($title)."' AND sid='{$sid}'",
-            array('limit' => 1)
-        );
-        $existing_tid = (int)$db->fetch_field($query, "tid");
-        if ($existing_tid > 0) {
-            $db->update_query("templates", $template_array, "tid='{$existing_tid}'");
-        } else {
-            $existing_tid = (int)$db->insert_query("templates", $template_array);
-            $created = true;
-        }
+    // MyBB only indexes templates on (sid, title) without UNIQUE, so
+    // INSERT ... ON DUPLICATE KEY UPDATE cannot replace this probe. The probe
+    // itself is a single indexed lookup, the same for master, global and
+    // custom sets.
+    $query = $db->simple_select(
+        "templates",
+        "tid",
+        "title='".$db->escape_string($title)."' AND sid='{$sid}'",
+        array('limit' => 1)
+    );
+    $existing_tid = (int)$db->fetch_field($query, "tid");
+    if ($existing_tid > 0) {
+        $db->update_query("templates", $template_array, "tid='{$existing_tid}'");
     } else {
-        $query = $db->simple_select(
-            "templates",
-            "tid",
-            "title='".$db->escape_string($title)."' AND sid='{$sid}'",
-            array('limit' => 1)
-        );
-        $existing_tid = (int)$db->fetch_field($query, "tid");
-        if ($existing_tid > 0) {
-            $db->update_query("templates", $template_array, "tid='{$existing_tid}'");
-        } else {
-            $existing_tid = (int)$db->insert_query("templates", $template_array);
-            $created = true;
-        }
+        $existing_tid = (int)$db->insert_query("templates", $template_array);
+        $created = true;
     }
 
     return array(
@@ -400,6 +391,32 @@ function log_mod_action($action, $data, $uid) {
     log_moderator_action($data, $action);
 }
 
+function thread_ids_option($options) {
+    // --tids=1,2,3 moderates several threads in one call; --tid a single one
+    if (isset($options['tids'])) {
+        $tids = array_map('intval', explode(',', $options['tids']));
+        return array_values(array_unique(array_filter($tids, function ($tid) {
+            return $tid > 0;
+        })));
+    }
+    $tid = isset($options['tid']) ? (int)$options['tid'] : 0;
+    return $tid > 0 ? [$tid] : [];
+}
+
+function log_thread_mod_actions($action, $tids, $uid) {
+    global $db;
+
+    // One lookup for every thread instead of get_thread() per tid
+    $query = $db->simple_select("threads", "tid, fid, subject", "tid IN (" . implode(',', $tids) . ")");
+    while ($thread = $db->fetch_array($query)) {
+        log_mod_action($action, [
+            "tid" => (int)$thread['tid'],
+            "fid" => (int)$thread['fid'],
+            "subject" => $thread['subject'],
+        ], $uid);
+    }
+}
+
 // ============================================================================
 // Bootstrap MyBB
 // ============================================================================
@@ -2033,32 +2050,27 @@ switch ($action) {
         break;
 
     case 'mod:approve_thread':
-        $tid = isset($options['tid']) ? (int)$options['tid'] : 0;
+        $tids = thread_ids_option($options);
         $approve = isset($options['approve']) ? (int)$options['approve'] : 1;
         $mod_uid = isset($options['uid']) ? (int)$options['uid'] : 1;
 
-        if ($tid <= 0) {
-            respond(false, [], "Required: --tid");
+        if (empty($tids)) {
+            respond(false, [], "Required: --tid or --tids");
         }
 
         require_once MYBB_ROOT . "inc/class_moderation.php";
         $moderation = new Moderation();
-        $success = $approve ? $moderation->approve_threads($tid) : $moderation->unapprove_threads($tid);
+        $success = $approve ? $moderation->approve_threads($tids) : $moderation->unapprove_threads($tids);
 
         if (!$success) {
-            respond(false, ["tid" => $tid], "Failed to update thread approval state");
+            respond(false, ["tids" => $tids], "Failed to update thread approval state");
         }
 
-        $thread = get_thread($tid);
-        $log_data = [
-            "tid" => $tid,
-            "fid" => $thread['fid'] ?? 0,
-            "subject" => $thread['subject'] ?? '',
-        ];
-        log_mod_action($approve ? "Thread approved" : "Thread unapproved", $log_data, $mod_uid);
+        log_thread_mod_actions($approve ? "Thread approved" : "Thread unapproved", $tids, $mod_uid);
 
         respond(true, [
-            "tid" => $tid,
+            "tid" => $tids[0],
+            "tids" => $tids,
             "actions_taken" => [$approve ? "thread_approved" : "thread_unapproved"]
         ]);
         break;
@@ -2095,59 +2107,49 @@ switch ($action) {
         break;
 
     case 'mod:soft_delete_thread':
-        $tid = isset($options['tid']) ? (int)$options['tid'] : 0;
+        $tids = thread_ids_option($options);
         $mod_uid = isset($options['uid']) ? (int)$options['uid'] : 1;
-        if ($tid <= 0) {
-            respond(false, [], "Required: --tid");
+        if (empty($tids)) {
+            respond(false, [], "Required: --tid or --tids");
         }
 
         require_once MYBB_ROOT . "inc/class_moderation.php";
         $moderation = new Moderation();
-        $success = $moderation->soft_delete_threads($tid);
+        $success = $moderation->soft_delete_threads($tids);
 
         if (!$success) {
-            respond(false, ["tid" => $tid], "Failed to soft delete thread");
+            respond(false, ["tids" => $tids], "Failed to soft delete threads");
         }
 
-        $thread = get_thread($tid);
-        $log_data = [
-            "tid" => $tid,
-            "fid" => $thread['fid'] ?? 0,
-            "subject" => $thread['subject'] ?? '',
-        ];
-        log_mod_action("Thread soft deleted", $log_data, $mod_uid);
+        log_thread_mod_actions("Thread soft deleted", $tids, $mod_uid);
 
         respond(true, [
-            "tid" => $tid,
+            "tid" => $tids[0],
+            "tids" => $tids,
             "actions_taken" => ["thread_soft_deleted"]
         ]);
         break;
 
     case 'mod:restore_thread':
-        $tid = isset($options['tid']) ? (int)$options['tid'] : 0;
+        $tids = thread_ids_option($options);
         $mod_uid = isset($options['uid']) ? (int)$options['uid'] : 1;
-        if ($tid <= 0) {
-            respond(false, [], "Required: --tid");
+        if (empty($tids)) {
+            respond(false, [], "Required: --tid or --tids");
         }
 
         require_once MYBB_ROOT . "inc/class_moderation.php";
         $moderation = new Moderation();
-        $success = $moderation->restore_threads($tid);
+        $success = $moderation->restore_threads($tids);
 
         if (!$success) {
-            respond(false, ["tid" => $tid], "Failed to restore thread");
+            respond(false, ["tids" => $tids], "Failed to restore threads");
         }
 
-        $thread = get_thread($tid);
-        $log_data = [
-            "tid" => $tid,
-            "fid" => $thread['fid'] ?? 0,
-            "subject" => $thread['subject'] ?? '',
-        ];
-        log_mod_action("Thread restored", $log_data, $mod_uid);
+        log_thread_mod_actions("Thread restored", $tids, $mod_uid);
 
         respond(true, [
-            "tid" => $tid,
+            "tid" => $tids[0],
+            "tids" => $tids,
             "actions_taken" => ["thread_restored"]
         ]);
         break;
@@ -2259,6 +2261,45 @@ switch ($action) {
         ]);
         break;
 
+    case 'modlog:add_bulk':
+        $entries = json_decode($options['entries_json'] ?? '', true);
+
+        if (!is_array($entries) || !$entries) {
+            respond(false, [], "Required: --entries_json (array of {uid, logaction})");
+        }
+
+        // Validate every entry first so a bad one inserts nothing
+        $rows = [];
+        foreach ($entries as $i => $entry) {
+            $uid = isset($entry['uid']) ? (int)$entry['uid'] : 0;
+            $log_action = isset($entry['logaction']) ? (string)$entry['logaction'] : '';
+            if ($uid <= 0 || $log_action === '') {
+                respond(false, ["index" => $i], "Each entry requires uid and logaction");
+            }
+            $data = isset($entry['data']) ? (string)$entry['data'] : '';
+            $ipaddress = isset($entry['ipaddress']) && $entry['ipaddress'] !== '' ? (string)$entry['ipaddress'] : '127.0.0.1';
+
+            // Same columns log_moderator_action() writes for modlog:add
+            $rows[] = [
+                "uid" => $uid,
+                "dateline" => TIME_NOW,
+                "fid" => isset($entry['fid']) ? (int)$entry['fid'] : 0,
+                "tid" => isset($entry['tid']) ? (int)$entry['tid'] : 0,
+                "pid" => isset($entry['pid']) ? (int)$entry['pid'] : 0,
+                "action" => $db->escape_string($log_action),
+                "data" => $db->escape_string(my_serialize($data !== '' ? ["data" => $data] : [])),
+                "ipaddress" => $db->escape_binary(my_inet_pton($ipaddress)),
+            ];
+        }
+
+        $db->insert_query_multiple("moderatorlog", $rows);
+
+        respond(true, [
+            "count" => count($rows),
+            "actions_taken" => ["modlog_added"]
+        ]);
+        break;
+
     // ========================================================================
     // Content Actions (MyBB-native)
     // ========================================================================
@@ -2712,6 +2753,7 @@ switch ($action) {
             'mod:soft_delete_post',
             'mod:restore_post',
             'modlog:add',
+            'modlog:add_bulk',
             'thread:create',
             'thread:edit',
             'thread:delete',
@@ -2946,6 +2988,7 @@ switch ($action) {
                 'mod:soft_delete_post',
                 'mod:restore_post',
                 'modlog:add',
+                'modlog:add_bulk',
                 'thread:create',
                 'thread:edit',
                 'thread:delete',
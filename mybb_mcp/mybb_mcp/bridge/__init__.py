@@ -4,7 +4,7 @@ This module is intentionally small and transport-focused: it invokes the CLI
 bridge (`mcp_bridge.php`) and returns parsed, structured results.
 """
 
-from .client import BridgeResult, MyBBBridgeClient
+from .client import BridgeResult, MyBBBridgeClient, get_bridge
 
-__all__ = ["BridgeResult", "MyBBBridgeClient"]
+__all__ = ["BridgeResult", "MyBBBridgeClient", "get_bridge"]
 
@@ -3,11 +3,15 @@ from __future__ import annotations
 import asyncio
 import json
 import subprocess
+import time
 import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+# How long a successful `info` response (and its supported_actions) is reused
+INFO_CACHE_TTL = 60.0
+
 
 @dataclass(slots=True)
 class BridgeResult:
@@ -29,6 +33,9 @@ class MyBBBridgeClient:
     reimplementing MyBB behavior via direct SQL.
     """
 
+    # Successful `info` responses shared across clients, keyed by bridge path
+    _info_cache: dict[Path, tuple[float, BridgeResult]] = {}
+
     def __init__(self, mybb_root: Path, php_binary: str = "php", timeout: int = 30):
         self.mybb_root = Path(mybb_root).resolve()
         self.php_binary = php_binary
@@ -129,3 +136,59 @@ class MyBBBridgeClient:
     async def call_async(self, action: str, request_id: str | None = None, **kwargs: Any) -> BridgeResult:
         return await asyncio.to_thread(self.call, action, request_id, **kwargs)
 
+    def call_batch(self, actions: list[tuple[str, dict[str, Any]]]) -> list[BridgeResult]:
+        """Invoke several actions one after another.
+
+        Each action is still its own bridge process; this only saves callers
+        a worker-thread hop per action. A failed action does not stop the rest.
+
+        Returns:
+            One BridgeResult per action, in the order given
+        """
+        return [self.call(action, **params) for action, params in actions]
+
+    async def call_batch_async(self, actions: list[tuple[str, dict[str, Any]]]) -> list[BridgeResult]:
+        return await asyncio.to_thread(self.call_batch, actions)
+
+    def _cached_info(self) -> BridgeResult | None:
+        cached = self._info_cache.get(self.bridge_path)
+        if cached is None or time.monotonic() - cached[0] >= INFO_CACHE_TTL:
+            return None
+        return cached[1]
+
+    def _store_info(self, result: BridgeResult) -> None:
+        if result.success:
+            self._info_cache[self.bridge_path] = (time.monotonic(), result)
+
+    def info(self) -> BridgeResult:
+        """Return the bridge `info` response, reusing it for INFO_CACHE_TTL seconds."""
+        cached = self._cached_info()
+        if cached is not None:
+            return cached
+        result = self.call("info")
+        self._store_info(result)
+        return result
+
+    async def info_async(self) -> BridgeResult:
+        cached = self._cached_info()
+        if cached is not None:
+            return cached
+        result = await self.call_async("info")
+        self._store_info(result)
+        return result
+
+    def invalidate_info(self) -> None:
+        """Drop the cached `info` response so the next check hits the bridge."""
+        self._info_cache.pop(self.bridge_path, None)
+
+
+_clients: dict[Path, MyBBBridgeClient] = {}
+
+
+def get_bridge(mybb_root: Path) -> MyBBBridgeClient:
+    """Return the shared MyBBBridgeClient for a MyBB root, creating it on first use."""
+    root = Path(mybb_root).resolve()
+    client = _clients.get(root)
+    if client is None:
+        client = _clients[root] = MyBBBridgeClient(root)
+    return client
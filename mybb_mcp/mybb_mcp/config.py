@@ -29,6 +29,7 @@ class MyBBConfig:
     mybb_root: Path
     mybb_url: str
     port: int = 8022
+    sync_enabled: bool = True  # Start DiskSync + file watcher with the server
 
 
 def load_config(env_path: Path | None = None) -> MyBBConfig:
@@ -77,4 +78,5 @@ def load_config(env_path: Path | None = None) -> MyBBConfig:
         mybb_root=mybb_root,
         mybb_url=os.getenv("MYBB_URL", f"http://localhost:{os.getenv('MYBB_PORT', '8022')}"),
         port=int(os.getenv("MYBB_PORT", "8022")),
+        sync_enabled=os.getenv("MYBB_SYNC_ENABLED", "true").lower() in ("true", "1", "yes"),
     )
@@ -1,7 +1,9 @@
 """MySQL database connection for MyBB."""
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Any, Generator
+from typing import Any, Generator, Iterator
+import sys
 import time
 import logging
 import threading
@@ -32,8 +34,22 @@ def _track_connection_acquired(conn_id: int, caller: str):
             "thread": threading.current_thread().name
         }
         if len(_active_connections) > 3:  # Warn if holding many connections
-            logger.warning(f"High connection count: {len(_active_connections)} active. "
-                          f"Callers: {[v['caller'] for v in _active_connections.values()]}")
+            logger.warning("High connection count: %s active. Callers: %s",
+                           len(_active_connections), [v['caller'] for v in _active_connections.values()])
+
+
+def _describe_callers(frame, count: int = 2) -> str:
+    """Describe ``frame`` and its callers (innermost first) without reading source lines.
+
+    Cheap stand-in for traceback.format_stack(), which formats the whole stack
+    and looks up source text on every call.
+    """
+    parts = []
+    while frame is not None and len(parts) < count:
+        code = frame.f_code
+        parts.append(f'File "{code.co_filename}", line {frame.f_lineno}, in {code.co_name}')
+        frame = frame.f_back
+    return "\n".join(parts)
 
 
 def _track_connection_released(conn_id: int):
@@ -42,11 +58,33 @@ def _track_connection_released(conn_id: int):
         if conn_id in _active_connections:
             held_time = time.time() - _active_connections[conn_id]["acquired_at"]
             if held_time > 5:  # Warn if held for more than 5 seconds
-                logger.warning(f"Connection {conn_id} held for {held_time:.1f}s by "
-                              f"{_active_connections[conn_id]['caller']}")
+                logger.warning("Connection %s held for %.1fs by %s",
+                               conn_id, held_time, _active_connections[conn_id]['caller'])
             del _active_connections[conn_id]
 
 
+def _drain_pool(pool: MySQLConnectionPool) -> int:
+    """Disconnect a pool's idle connections and return how many there were.
+
+    Uses the connector's private _remove_connections() when it exists;
+    otherwise checks each idle connection out and disconnects it, which also
+    keeps it from going back into the pool.
+    """
+    remove = getattr(pool, '_remove_connections', None)
+    if remove is not None:
+        return remove()
+
+    removed = 0
+    while True:
+        try:
+            cnx = pool.get_connection()
+        except PoolError:
+            return removed
+        # PooledMySQLConnection forwards disconnect() to the real connection
+        cnx.disconnect()
+        removed += 1
+
+
 class MyBBDatabase:
     """Database wrapper for MyBB operations with connection pooling."""
 
@@ -61,17 +99,27 @@ class MyBBDatabase:
         self.config = config
         self._connection: MySQLConnection | None = None
         self._pool: MySQLConnectionPool | None = None
+        # Guards pool creation - prewarm() may race the first tool call
+        self._pool_lock = threading.Lock()
 
         # Use explicit parameters or fall back to config values
         self._pool_size = pool_size if pool_size is not None else config.pool_size
         self._pool_name = pool_name if pool_name is not None else config.pool_name
         self._use_pooling = self._pool_size > 1
 
+        # One slot per connection: callers on other threads wait for a free one
+        # instead of exhausting the pool (or sharing the single direct connection)
+        self._slots = threading.BoundedSemaphore(self._pool_size)
+        self._slot_depth = threading.local()
+
         # Retry configuration
         self._max_retries = 3
         self._base_retry_delay = 0.5  # seconds
         self._max_retry_delay = 5.0  # seconds
 
+        # (table, column) -> whether a FULLTEXT index covers it
+        self._fulltext_cache: dict[tuple[str, str], bool] = {}
+
     @property
     def prefix(self) -> str:
         return self.config.prefix
@@ -90,21 +138,94 @@ class MyBBDatabase:
             'pool_reset_session': True,
         }
 
-    def _init_pool(self) -> MySQLConnectionPool:
-        """Initialize connection pool if not already initialized."""
+    def _init_pool(self, parallel: bool = False) -> MySQLConnectionPool:
+        """Initialize connection pool if not already initialized.
+
+        Args:
+            parallel: Open the pool's connections concurrently (see _build_pool_parallel)
+        """
         if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    try:
+                        if parallel:
+                            self._pool = self._build_pool_parallel()
+                        else:
+                            config = self._get_connection_config()
+                            self._pool = MySQLConnectionPool(
+                                pool_name=self._pool_name,
+                                pool_size=self._pool_size,
+                                **config
+                            )
+                        logger.info("Connection pool initialized: %s (size=%s)", self._pool_name, self._pool_size)
+                    except MySQLError as e:
+                        logger.error("Failed to initialize connection pool: %s", e)
+                        raise
+        return self._pool
+
+    def _build_pool_parallel(self) -> MySQLConnectionPool:
+        """Build the connection pool with all connections opened concurrently.
+
+        MySQLConnectionPool's constructor connects one at a time under a global
+        lock. Opening each connection from its own thread overlaps the TCP and
+        auth round trips; the finished connections are then queued into the pool.
+        """
+        config = self._get_connection_config()
+        reset_session = config.pop('pool_reset_session')
+        pool = MySQLConnectionPool(
+            pool_name=self._pool_name,
+            pool_size=self._pool_size,
+            pool_reset_session=reset_session,
+        )
+        pool.set_config(**config)
+
+        with ThreadPoolExecutor(max_workers=self._pool_size, thread_name_prefix="mybb-db-connect") as executor:
+            futures = [executor.submit(MySQLConnection, **config) for _ in range(self._pool_size)]
+
+        connections = []
+        error: MySQLError | None = None
+        for future in futures:
             try:
-                config = self._get_connection_config()
-                self._pool = MySQLConnectionPool(
-                    pool_name=self._pool_name,
-                    pool_size=self._pool_size,
-                    **config
-                )
-                logger.info(f"Connection pool initialized: {self._pool_name} (size={self._pool_size})")
+                connections.append(future.result())
             except MySQLError as e:
-                logger.error(f"Failed to initialize connection pool: {e}")
-                raise
-        return self._pool
+                error = error or e
+        if error is not None:
+            for conn in connections:
+                conn.close()
+            raise error
+
+        # Marking each connection with the pool's (private) config version stops
+        # get_connection() from reconfiguring and reconnecting it. Connector
+        # releases without that attribute just take the public add_connection().
+        config_version = getattr(pool, '_config_version', None)
+        for conn in connections:
+            if config_version is not None:
+                conn.pool_config_version = config_version
+            pool.add_connection(conn)
+        return pool
+
+    def prewarm(self) -> bool:
+        """Open the connection pool (or direct connection) ahead of the first query.
+
+        Pool connections are opened in parallel rather than one after another.
+
+        Safe to run in a background thread at startup. Failures are logged, not
+        raised - the first real query retries as usual.
+
+        Returns:
+            True if the database was reachable, False otherwise
+        """
+        started = time.monotonic()
+        try:
+            if self._use_pooling:
+                self._init_pool(parallel=True)
+            else:
+                self.connect()
+        except MySQLError as e:
+            logger.warning("Database prewarm failed: %s", e)
+            return False
+        logger.info("Database prewarmed in %.2fs", time.monotonic() - started)
+        return True
 
     def _get_connection_with_timeout(self, pool: MySQLConnectionPool, timeout: float) -> MySQLConnection:
         """Get connection from pool with timeout to prevent indefinite blocking.
@@ -130,7 +251,7 @@ class MyBBDatabase:
             return conn
         except PoolError as e:
             # Pool exhaustion or timeout
-            logger.error(f"Pool error getting connection: {e}")
+            logger.error("Pool error getting connection: %s", e)
             raise MySQLError(f"Connection pool error: {e}. "
                            f"Consider increasing MYBB_DB_POOL_SIZE (current: {self._pool_size})")
 
@@ -143,11 +264,11 @@ class MyBBDatabase:
                 if self._use_pooling:
                     pool = self._init_pool()
                     conn = self._get_connection_with_timeout(pool, POOL_ACQUIRE_TIMEOUT)
-                    logger.debug(f"Got connection from pool (attempt {attempt + 1})")
+                    logger.debug("Got connection from pool (attempt %s)", attempt + 1)
                 else:
                     config = self._get_connection_config()
                     conn = mysql.connector.connect(**config)
-                    logger.debug(f"Created direct connection (attempt {attempt + 1})")
+                    logger.debug("Created direct connection (attempt %s)", attempt + 1)
 
                 # Verify connection is healthy
                 if conn.is_connected():
@@ -161,12 +282,11 @@ class MyBBDatabase:
                     # Exponential backoff: 0.5s, 1s, 2s (capped at max_retry_delay)
                     delay = min(self._base_retry_delay * (2 ** attempt), self._max_retry_delay)
                     logger.warning(
-                        f"Database connection attempt {attempt + 1}/{self._max_retries} failed: {e}. "
-                        f"Retrying in {delay}s..."
+                        "Database connection attempt %s/%s failed: %s. Retrying in %ss...", attempt + 1, self._max_retries, e, delay
                     )
                     time.sleep(delay)
                 else:
-                    logger.error(f"All {self._max_retries} connection attempts failed: {e}")
+                    logger.error("All %s connection attempts failed: %s", self._max_retries, e)
 
         # All retries exhausted
         raise MySQLError(f"Failed to connect after {self._max_retries} attempts: {last_error}")
@@ -227,48 +347,93 @@ class MyBBDatabase:
                     self._connection.close()
                     logger.debug("Direct connection closed")
                 except MySQLError as e:
-                    logger.warning(f"Error closing connection: {e}")
+                    logger.warning("Error closing connection: %s", e)
                 finally:
                     self._connection = None
 
+    def close_pool(self):
+        """Close idle pooled connections and forget the pool.
+
+        Connections checked out at the time are closed by their holders as
+        usual. The next query builds a fresh pool.
+        """
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            try:
+                removed = _drain_pool(pool)
+                logger.debug("Connection pool drained: %s (%s connections)", self._pool_name, removed)
+            except MySQLError as e:
+                logger.warning("Error draining connection pool: %s", e)
+        self.close()
+
+    @contextmanager
+    def _connection_slot(self) -> Generator[None, None, None]:
+        """Hold a connection slot; nested cursors on the same thread reuse it.
+
+        Raises:
+            MySQLError: If no slot frees up within POOL_ACQUIRE_TIMEOUT
+        """
+        depth = getattr(self._slot_depth, 'value', 0)
+        if depth == 0 and not self._slots.acquire(timeout=POOL_ACQUIRE_TIMEOUT):
+            raise MySQLError(f"Timed out after {POOL_ACQUIRE_TIMEOUT}s waiting for a database connection. "
+                             f"Consider increasing MYBB_DB_POOL_SIZE (current: {self._pool_size})")
+        self._slot_depth.value = depth + 1
+        try:
+            yield
+        finally:
+            self._slot_depth.value = depth
+            if depth == 0:
+                self._slots.release()
+
     @contextmanager
-    def cursor(self, dictionary: bool = True) -> Generator[MySQLCursor, None, None]:
+    def cursor(self, dictionary: bool = True, streaming: bool = False) -> Generator[MySQLCursor, None, None]:
         """Get a database cursor with automatic connection management.
 
         For pooled connections, acquires a connection from the pool and returns it
         after use. For non-pooled connections, uses the persistent connection.
+        Safe to call from worker threads (asyncio.to_thread): at most pool_size
+        cursors are open at once and further callers wait for a free slot.
 
         Args:
             dictionary: If True, return rows as dictionaries (default: True)
+            streaming: If True, return an unbuffered cursor whose rows are read
+                from the server while iterating instead of all at execute time
 
         Yields:
             MySQLCursor: Database cursor for executing queries
         """
-        import traceback
-        caller = ''.join(traceback.format_stack()[-4:-2])  # Get caller info
+        with self._connection_slot():
+            conn = self.connect()
+            conn_id = id(conn)
 
-        conn = self.connect()
-        conn_id = id(conn)
-
-        if self._use_pooling:
-            _track_connection_acquired(conn_id, caller[:200])  # Truncate long traces
-
-        cursor = conn.cursor(dictionary=dictionary)
-        try:
-            yield cursor
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            cursor.close()
-            # Return pooled connections to the pool
             if self._use_pooling:
-                _track_connection_released(conn_id)
-                try:
-                    conn.close()
-                except MySQLError as e:
-                    logger.warning(f"Error returning connection to pool: {e}")
+                # Frame 2 is the caller (0 = this generator, 1 = contextmanager.__enter__)
+                caller = _describe_callers(sys._getframe(2))
+                _track_connection_acquired(conn_id, caller[:200])  # Truncate long traces
+
+            if streaming:
+                cursor = conn.cursor(dictionary=dictionary, buffered=False)
+            else:
+                cursor = conn.cursor(dictionary=dictionary)
+            try:
+                yield cursor
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                if streaming:
+                    # Rows left unread (early exit) would block the next query
+                    conn.consume_results()
+                cursor.close()
+                # Return pooled connections to the pool
+                if self._use_pooling:
+                    _track_connection_released(conn_id)
+                    try:
+                        conn.close()
+                    except MySQLError as e:
+                        logger.warning("Error returning connection to pool: %s", e)
 
     def table(self, name: str) -> str:
         """Get prefixed table name."""
@@ -310,6 +475,18 @@ class MyBBDatabase:
             )
             return cur.fetchall()
 
+    def iter_template_groups(self) -> Iterator[dict[str, Any]]:
+        """Yield template groups (gid, prefix, title) as they arrive from the server.
+
+        Uses a streaming cursor, so the connection is held until the generator
+        is exhausted or closed; consume it in one go on a worker thread.
+        """
+        with self.cursor(streaming=True) as cur:
+            cur.execute(
+                f"SELECT gid, prefix, title FROM {self.table('templategroups')} ORDER BY title"
+            )
+            yield from cur
+
     def list_templates(self, sid: int | None = None, search: str | None = None) -> list[dict[str, Any]]:
         """List templates, optionally filtered by set ID or search term."""
         query = f"SELECT tid, title, sid, version, status FROM {self.table('templates')}"
@@ -343,6 +520,54 @@ class MyBBDatabase:
             )
             return cur.fetchone()
 
+    def get_templates_bulk(self, titles: list[str], sid: int = -1) -> dict[str, dict[str, Any]]:
+        """Get several templates from one set in a single query.
+
+        Args:
+            titles: Template titles to fetch
+            sid: Template set ID
+
+        Returns:
+            Dict mapping lowercased title to template row (MySQL compares
+            titles case-insensitively); missing titles are absent
+        """
+        titles = list(dict.fromkeys(titles))
+        if not titles:
+            return {}
+        placeholders = ','.join(['%s'] * len(titles))
+        with self.cursor() as cur:
+            cur.execute(
+                f"SELECT tid, title, template, sid, version, status, dateline "
+                f"FROM {self.table('templates')} WHERE sid = %s AND title IN ({placeholders})",
+                (sid, *titles)
+            )
+            return {row['title'].lower(): row for row in cur.fetchall()}
+
+    def get_templates_for_title(self, title: str, sids: list[int]) -> dict[int, dict[str, Any]]:
+        """Get one template from several sets (e.g. master and custom) in a single query.
+
+        Args:
+            title: Template title
+            sids: Template set IDs to look in
+
+        Returns:
+            Dict mapping sid to template row; sets without the template are absent
+        """
+        sids = list(dict.fromkeys(sids))
+        if not sids:
+            return {}
+        placeholders = ','.join(['%s'] * len(sids))
+        with self.cursor() as cur:
+            cur.execute(
+                f"SELECT tid, title, template, sid, version, status, dateline "
+                f"FROM {self.table('templates')} WHERE title = %s AND sid IN ({placeholders})",
+                (title, *sids)
+            )
+            rows: dict[int, dict[str, Any]] = {}
+            for row in cur.fetchall():
+                rows.setdefault(row['sid'], row)
+            return rows
+
     def get_template_by_tid(self, tid: int) -> dict[str, Any] | None:
         """Get a specific template by ID."""
         with self.cursor() as cur:
@@ -407,6 +632,10 @@ class MyBBDatabase:
         - A master template exists with the same title (sid=-2)
         - The custom version number < master version number
 
+        The comparison runs entirely in SQL, so only the version columns of
+        outdated rows are returned. Both sides of the join are served by MyBB's
+        (sid, title) index on the templates table.
+
         Args:
             sid: Template set ID to check (must be > 0)
 
@@ -1176,6 +1405,47 @@ class MyBBDatabase:
 
     # ==================== Search Operations ====================
 
+    def has_fulltext_index(self, table: str, column: str) -> bool:
+        """Check whether a FULLTEXT index covers a column (cached per instance).
+
+        Stock MyBB creates FULLTEXT indexes on posts.message and threads.subject
+        when the server supports them; boards converted from other software may
+        not have them.
+
+        Args:
+            table: Unprefixed table name (e.g., 'posts')
+            column: Column name (e.g., 'message')
+        """
+        key = (table, column)
+        if key not in self._fulltext_cache:
+            with self.cursor() as cur:
+                cur.execute(
+                    "SELECT 1 FROM information_schema.STATISTICS "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s "
+                    "AND COLUMN_NAME = %s AND INDEX_TYPE = 'FULLTEXT' LIMIT 1",
+                    (self.table(table), column)
+                )
+                self._fulltext_cache[key] = cur.fetchone() is not None
+        return self._fulltext_cache[key]
+
+    def _keyset_after(self, table: str, id_col: str, sort_col: str, after_id: int,
+                      alias: str = "", descending: bool = True) -> tuple[str, list[Any]]:
+        """Build a keyset condition for rows listed after ``after_id``.
+
+        Results are ordered by ``(sort_col, id_col)``; the cursor row's sort value
+        is looked up by primary key inside the query, so paging seeks via the
+        index instead of scanning and discarding ``offset`` rows. If the cursor
+        row no longer exists the condition matches nothing.
+
+        Returns:
+            Tuple of (" AND ..." SQL fragment, params)
+        """
+        op = "<" if descending else ">"
+        cursor_key = f"(SELECT {sort_col} FROM {self.table(table)} WHERE {id_col} = %s)"
+        sql = (f" AND ({alias}{sort_col} {op} {cursor_key}"
+               f" OR ({alias}{sort_col} = {cursor_key} AND {alias}{id_col} {op} %s))")
+        return sql, [after_id, after_id, after_id]
+
     def search_posts(
         self,
         query: str,
@@ -1184,10 +1454,23 @@ class MyBBDatabase:
         date_from: int | None = None,
         date_to: int | None = None,
         limit: int = 25,
-        offset: int = 0
+        offset: int = 0,
+        after_pid: int | None = None,
+        sort_by: str = "date",
+        peek: bool = False
     ) -> list[dict[str, Any]]:
         """Search post content with optional filters.
 
+        Posts are ordered newest first. Passing ``after_pid`` (the last PID of
+        the previous page) switches to keyset pagination.
+
+        With ``sort_by="relevance"`` and a FULLTEXT index on posts.message, the
+        search uses MATCH ... AGAINST in natural language mode (whole words; the
+        query's +, -, " and other characters are plain text, not operators)
+        and ranks by relevance. Relevance pages are offset-based: a keyset
+        cursor has no score to seek on, so ``after_pid`` is ignored. Without
+        the index it falls back to the substring LIKE search.
+
         Args:
             query: Search term to find in post message
             forums: Optional list of forum IDs to search within
@@ -1195,13 +1478,17 @@ class MyBBDatabase:
             date_from: Optional start timestamp
             date_to: Optional end timestamp
             limit: Maximum results (default 25, max 100)
-            offset: Pagination offset
+            offset: Pagination offset (ignored when after_pid is given)
+            after_pid: Only return posts listed after this PID (date order only)
+            sort_by: "date" or "relevance"
+            peek: Fetch one row past ``limit`` so callers can tell whether
+                another page exists without a COUNT query
 
         Returns:
             List of posts with thread info (no sensitive data)
         """
         # Sanitize limit
-        limit = min(max(1, limit), 100)
+        limit = min(max(1, limit), 100) + int(peek)
 
         # Build query - exclude sensitive ipaddress field
         sql = f"""
@@ -1215,11 +1502,17 @@ class MyBBDatabase:
         """
         params = []
 
-        # Add search condition - use LIKE with wildcards
-        # Escape special characters for LIKE
-        escaped_query = query.replace('%', '\\%').replace('_', '\\_')
-        sql += " AND p.message LIKE %s"
-        params.append(f"%{escaped_query}%")
+        relevance = sort_by == "relevance" and self.has_fulltext_index('posts', 'message')
+        if relevance:
+            after_pid = None
+            sql += " AND MATCH(p.message) AGAINST(%s IN NATURAL LANGUAGE MODE)"
+            params.append(query)
+        else:
+            # Add search condition - use LIKE with wildcards
+            # Escape special characters for LIKE
+            escaped_query = query.replace('%', '\\%').replace('_', '\\_')
+            sql += " AND p.message LIKE %s"
+            params.append(f"%{escaped_query}%")
 
         # Add optional filters
         if forums:
@@ -1239,8 +1532,20 @@ class MyBBDatabase:
             sql += " AND p.dateline <= %s"
             params.append(date_to)
 
-        sql += " ORDER BY p.dateline DESC LIMIT %s OFFSET %s"
-        params.extend([limit, offset])
+        if after_pid is not None:
+            keyset_sql, keyset_params = self._keyset_after('posts', 'pid', 'dateline', after_pid, alias='p.')
+            sql += keyset_sql
+            params.extend(keyset_params)
+
+        if relevance:
+            sql += " ORDER BY MATCH(p.message) AGAINST(%s IN NATURAL LANGUAGE MODE) DESC, p.pid DESC LIMIT %s"
+            params.extend([query, limit])
+        else:
+            sql += " ORDER BY p.dateline DESC, p.pid DESC LIMIT %s"
+            params.append(limit)
+        if after_pid is None:
+            sql += " OFFSET %s"
+            params.append(offset)
 
         with self.cursor() as cur:
             cur.execute(sql, params)
@@ -1253,23 +1558,34 @@ class MyBBDatabase:
         author: str | None = None,
         prefix: int | None = None,
         limit: int = 25,
-        offset: int = 0
+        offset: int = 0,
+        after_tid: int | None = None,
+        sort_by: str = "date",
+        peek: bool = False
     ) -> list[dict[str, Any]]:
         """Search thread subjects with optional filters.
 
+        Threads are ordered by last post, newest first. Passing ``after_tid``
+        (the last TID of the previous page) switches to keyset pagination.
+        ``sort_by="relevance"`` behaves as in search_posts (offset paging only),
+        using the FULLTEXT index on threads.subject when present.
+
         Args:
             query: Search term to find in thread subject
             forums: Optional list of forum IDs to search within
             author: Optional username to filter by
             prefix: Optional thread prefix ID
             limit: Maximum results (default 25, max 100)
-            offset: Pagination offset
+            offset: Pagination offset (ignored when after_tid is given)
+            after_tid: Only return threads listed after this TID (date order only)
+            sort_by: "date" or "relevance"
+            peek: Fetch one row past ``limit`` (see search_posts)
 
         Returns:
             List of matching threads
         """
         # Sanitize limit
-        limit = min(max(1, limit), 100)
+        limit = min(max(1, limit), 100) + int(peek)
 
         sql = f"""
             SELECT
@@ -1281,9 +1597,15 @@ class MyBBDatabase:
         params = []
 
         # Add search condition
-        escaped_query = query.replace('%', '\\%').replace('_', '\\_')
-        sql += " AND subject LIKE %s"
-        params.append(f"%{escaped_query}%")
+        relevance = sort_by == "relevance" and self.has_fulltext_index('threads', 'subject')
+        if relevance:
+            after_tid = None
+            sql += " AND MATCH(subject) AGAINST(%s IN NATURAL LANGUAGE MODE)"
+            params.append(query)
+        else:
+            escaped_query = query.replace('%', '\\%').replace('_', '\\_')
+            sql += " AND subject LIKE %s"
+            params.append(f"%{escaped_query}%")
 
         # Add optional filters
         if forums:
@@ -1299,8 +1621,20 @@ class MyBBDatabase:
             sql += " AND prefix = %s"
             params.append(prefix)
 
-        sql += " ORDER BY lastpost DESC LIMIT %s OFFSET %s"
-        params.extend([limit, offset])
+        if after_tid is not None:
+            keyset_sql, keyset_params = self._keyset_after('threads', 'tid', 'lastpost', after_tid)
+            sql += keyset_sql
+            params.extend(keyset_params)
+
+        if relevance:
+            sql += " ORDER BY MATCH(subject) AGAINST(%s IN NATURAL LANGUAGE MODE) DESC, tid DESC LIMIT %s"
+            params.extend([query, limit])
+        else:
+            sql += " ORDER BY lastpost DESC, tid DESC LIMIT %s"
+            params.append(limit)
+        if after_tid is None:
+            sql += " OFFSET %s"
+            params.append(offset)
 
         with self.cursor() as cur:
             cur.execute(sql, params)
@@ -1311,21 +1645,28 @@ class MyBBDatabase:
         query: str,
         field: str = "username",
         limit: int = 25,
-        offset: int = 0
+        offset: int = 0,
+        after_uid: int | None = None,
+        peek: bool = False
     ) -> list[dict[str, Any]]:
         """Search users by username or email.
 
+        Users are ordered by username. Passing ``after_uid`` (the last UID of
+        the previous page) switches to keyset pagination.
+
         Args:
             query: Search term
             field: Field to search ("username" or "email")
             limit: Maximum results (default 25, max 100)
-            offset: Pagination offset
+            offset: Pagination offset (ignored when after_uid is given)
+            after_uid: Only return users listed after this UID
+            peek: Fetch one row past ``limit`` (see search_posts)
 
         Returns:
             List of matching users (no password/salt/loginkey)
         """
         # Sanitize limit
-        limit = min(max(1, limit), 100)
+        limit = min(max(1, limit), 100) + int(peek)
 
         # Validate field
         if field not in ["username", "email"]:
@@ -1343,8 +1684,16 @@ class MyBBDatabase:
         escaped_query = query.replace('%', '\\%').replace('_', '\\_')
         params = [f"%{escaped_query}%"]
 
-        sql += " ORDER BY username LIMIT %s OFFSET %s"
-        params.extend([limit, offset])
+        if after_uid is not None:
+            keyset_sql, keyset_params = self._keyset_after('users', 'uid', 'username', after_uid, descending=False)
+            sql += keyset_sql
+            params.extend(keyset_params)
+
+        sql += " ORDER BY username, uid LIMIT %s"
+        params.append(limit)
+        if after_uid is None:
+            sql += " OFFSET %s"
+            params.append(offset)
 
         with self.cursor() as cur:
             cur.execute(sql, params)
@@ -1359,7 +1708,10 @@ class MyBBDatabase:
         date_to: int | None = None,
         sort_by: str = "date",
         limit: int = 25,
-        offset: int = 0
+        offset: int = 0,
+        after_pid: int | None = None,
+        after_tid: int | None = None,
+        peek: bool = False
     ) -> dict[str, Any]:
         """Combined search with multiple filters.
 
@@ -1372,6 +1724,9 @@ class MyBBDatabase:
             sort_by: Sort order ("date" or "relevance")
             limit: Maximum results per type (default 25, max 100)
             offset: Pagination offset
+            after_pid: Keyset cursor for the posts results
+            after_tid: Keyset cursor for the threads results
+            peek: Fetch one extra row per type (see search_posts)
 
         Returns:
             Dict with posts and/or threads results
@@ -1385,7 +1740,10 @@ class MyBBDatabase:
                 date_from=date_from,
                 date_to=date_to,
                 limit=limit,
-                offset=offset
+                offset=offset,
+                after_pid=after_pid,
+                sort_by=sort_by,
+                peek=peek
             )
 
         if content_type in ["threads", "both"]:
@@ -1393,7 +1751,10 @@ class MyBBDatabase:
                 query=query,
                 forums=forums,
                 limit=limit,
-                offset=offset
+                offset=offset,
+                after_tid=after_tid,
+                sort_by=sort_by,
+                peek=peek
             )
 
         return results
@@ -2097,13 +2458,20 @@ class MyBBDatabase:
 
             return user
 
-    def list_users(self, usergroup: int = None, limit: int = 50, offset: int = 0) -> list[dict]:
+    def list_users(self, usergroup: int = None, limit: int = 50, offset: int = 0,
+                   after_uid: int = None) -> list[dict]:
         """List users with optional filters.
 
+        Users are ordered by UID descending. Passing ``after_uid`` (the last
+        UID of the previous page) switches to keyset pagination, which seeks
+        directly via the primary key instead of scanning and discarding
+        ``offset`` rows.
+
         Args:
             usergroup: Filter by usergroup ID
             limit: Maximum number of users to return (1-100)
-            offset: Number of users to skip
+            offset: Number of users to skip (ignored when after_uid is given)
+            after_uid: Only return users listed after this UID (uid < after_uid)
 
         Returns:
             List of sanitized user dicts
@@ -2114,17 +2482,26 @@ class MyBBDatabase:
         # Always exclude sensitive fields in list operations
         sensitive_fields = ['password', 'salt', 'loginkey', 'regip', 'lastip']
 
+        conditions = []
+        params = []
+        if usergroup is not None:
+            conditions.append("usergroup = %s")
+            params.append(usergroup)
+        if after_uid is not None:
+            conditions.append("uid < %s")
+            params.append(after_uid)
+
+        sql = f"SELECT * FROM {self.table('users')}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY uid DESC LIMIT %s"
+        params.append(limit)
+        if after_uid is None:
+            sql += " OFFSET %s"
+            params.append(offset)
+
         with self.cursor() as cur:
-            if usergroup is not None:
-                cur.execute(
-                    f"SELECT * FROM {self.table('users')} WHERE usergroup = %s ORDER BY uid DESC LIMIT %s OFFSET %s",
-                    (usergroup, limit, offset)
-                )
-            else:
-                cur.execute(
-                    f"SELECT * FROM {self.table('users')} ORDER BY uid DESC LIMIT %s OFFSET %s",
-                    (limit, offset)
-                )
+            cur.execute(sql, tuple(params))
 
             users = cur.fetchall()
 
@@ -1,9 +1,60 @@
 """Admin and cache management handlers for MyBB MCP tools."""
 
+import asyncio
+import io
+import time
+from collections import OrderedDict
 from typing import Any
 from datetime import datetime
 
-from ..bridge import MyBBBridgeClient
+from ..bridge import get_bridge
+from .common import board_cache_reset, invalidate_board_caches
+from .plugins import invalidate_plugins_cache
+from .users import invalidate_usergroups
+
+
+# Short-lived LRUs for mybb_setting_get (keyed by setting name) and
+# mybb_cache_read (keyed by cache title). Setting updates and cache
+# clear/rebuild through these tools drop the affected entries early, and
+# invalidate_board_caches() (called by every tool that writes settings or
+# the datacache) drops them all; other changes show up once the TTL runs out.
+_SETTING_CACHE_TTL = 60.0
+_SETTING_CACHE_SIZE = 1024
+_DATACACHE_CACHE_TTL = 30.0
+_DATACACHE_CACHE_SIZE = 256
+_setting_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+_datacache_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+
+def _cache_get(cache: OrderedDict, key: str, ttl: float) -> Any:
+    """Return a fresh cached value, or None if missing or expired."""
+    cached = cache.get(key)
+    if cached is None or time.monotonic() - cached[0] >= ttl:
+        return None
+    cache.move_to_end(key)
+    return cached[1]
+
+
+def _cache_put(cache: OrderedDict, key: str, value: Any, size: int) -> None:
+    """Store a value, evicting the least recently used entries past size."""
+    cache[key] = (time.monotonic(), value)
+    cache.move_to_end(key)
+    while len(cache) > size:
+        cache.popitem(last=False)
+
+
+def _invalidate_datacache(title: str | None) -> None:
+    """Drop one cached datacache entry, or all of them when title is None."""
+    if title is None:
+        _datacache_cache.clear()
+    else:
+        _datacache_cache.pop(title, None)
+
+
+@board_cache_reset
+def _reset_admin_caches() -> None:
+    _setting_cache.clear()
+    _datacache_cache.clear()
 
 
 # ==================== Settings Handlers ====================
@@ -24,9 +75,13 @@ async def handle_setting_get(args: dict, db: Any, config: Any, sync_service: Any
     if not setting_name:
         return "Error: 'name' parameter is required."
 
-    setting = db.get_setting(setting_name)
-    if not setting:
-        return f"Setting '{setting_name}' not found."
+    setting = _cache_get(_setting_cache, setting_name, _SETTING_CACHE_TTL)
+    if setting is None:
+        setting = await asyncio.to_thread(db.get_setting, setting_name)
+        if not setting:
+            _setting_cache.pop(setting_name, None)
+            return f"Setting '{setting_name}' not found."
+        _cache_put(_setting_cache, setting_name, setting, _SETTING_CACHE_SIZE)
 
     lines = [
         f"# Setting: {setting['title']}\n",
@@ -58,7 +113,7 @@ async def handle_setting_set(args: dict, db: Any, config: Any, sync_service: Any
         return "Error: 'name' and 'value' parameters are required."
 
     # Use bridge for setting update
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -68,6 +123,8 @@ async def handle_setting_set(args: dict, db: Any, config: Any, sync_service: Any
         return "Error: Bridge does not support 'setting:set' yet."
 
     result = await bridge.call_async("setting:set", name=setting_name, value=value)
+    _setting_cache.pop(setting_name, None)
+    _invalidate_datacache("settings")
     if not result.success:
         return f"Error: Bridge setting:set failed: {result.error or 'unknown error'}"
 
@@ -87,7 +144,7 @@ async def handle_setting_list(args: dict, db: Any, config: Any, sync_service: An
         Settings list as markdown table
     """
     gid = args.get("gid")
-    settings = db.list_settings(gid=gid)
+    settings = await asyncio.to_thread(db.list_settings, gid=gid)
 
     if not settings:
         return "No settings found."
@@ -127,7 +184,7 @@ async def handle_settinggroup_list(args: dict, db: Any, config: Any, sync_servic
     Returns:
         Setting groups as markdown table
     """
-    groups = db.list_setting_groups()
+    groups = await asyncio.to_thread(db.list_setting_groups)
 
     if not groups:
         return "No setting groups found."
@@ -167,7 +224,13 @@ async def handle_cache_read(args: dict, db: Any, config: Any, sync_service: Any)
     if not title:
         return "Error: 'title' parameter is required."
 
-    cache_data = db.read_cache(title)
+    cache_data = _cache_get(_datacache_cache, title, _DATACACHE_CACHE_TTL)
+    if cache_data is None:
+        cache_data = await asyncio.to_thread(db.read_cache, title)
+        if cache_data is not None:
+            _cache_put(_datacache_cache, title, cache_data, _DATACACHE_CACHE_SIZE)
+        else:
+            _datacache_cache.pop(title, None)
     if cache_data is None:
         return f"Cache '{title}' not found."
 
@@ -200,7 +263,15 @@ async def handle_cache_rebuild(args: dict, db: Any, config: Any, sync_service: A
         Success message with affected row count
     """
     cache_type = args.get("cache_type", "all")
-    result = db.rebuild_cache(cache_type)
+    result = await asyncio.to_thread(db.rebuild_cache, cache_type)
+    if cache_type == "all":
+        invalidate_board_caches()
+    else:
+        _invalidate_datacache(cache_type)
+        if cache_type == "usergroups":
+            invalidate_usergroups()
+        elif cache_type == "plugins":
+            invalidate_plugins_cache()
 
     return f"**{result['message']}** ({result['rows_affected']} cache entries cleared)\n\nMyBB will regenerate these caches on next access."
 
@@ -217,7 +288,7 @@ async def handle_cache_list(args: dict, db: Any, config: Any, sync_service: Any)
     Returns:
         Cache entries as markdown table with total size
     """
-    caches = db.list_caches()
+    caches = await asyncio.to_thread(db.list_caches)
 
     if not caches:
         return "No cache entries found."
@@ -250,7 +321,15 @@ async def handle_cache_clear(args: dict, db: Any, config: Any, sync_service: Any
         Success message or error
     """
     title = args.get("title")
-    success = db.clear_cache(title)
+    success = await asyncio.to_thread(db.clear_cache, title)
+    if title is None:
+        invalidate_board_caches()
+    else:
+        _invalidate_datacache(title)
+        if title == "usergroups":
+            invalidate_usergroups()
+        elif title == "plugins":
+            invalidate_plugins_cache()
 
     if not success:
         if title:
@@ -278,7 +357,7 @@ async def handle_stats_forum(args: dict, db: Any, config: Any, sync_service: Any
     Returns:
         Forum statistics as formatted markdown
     """
-    stats = db.get_forum_stats()
+    stats = await asyncio.to_thread(db.get_forum_stats)
 
     lines = [
         "# Forum Statistics\n",
@@ -311,7 +390,7 @@ async def handle_stats_board(args: dict, db: Any, config: Any, sync_service: Any
     Returns:
         Board statistics as formatted markdown
     """
-    stats = db.get_board_stats()
+    stats = await asyncio.to_thread(db.get_board_stats)
 
     lines = [
         "# Board Statistics\n",
@@ -365,8 +444,11 @@ async def handle_bridge_health_check(args: dict, db: Any, config: Any, sync_serv
         return "Error: mode must be 'quick' or 'full'"
 
     # Use bridge for health check
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     result = await bridge.call_async("bridge:health_check", mode=mode)
+    if mode == "full":
+        # The full smoke test writes a setting and rebuilds the forums cache
+        invalidate_board_caches()
 
     if not result.success:
         return f"Error: Health check failed: {result.error or 'Unknown error'}"
@@ -432,17 +514,18 @@ async def handle_list_template_groups(args: dict, db: Any, config: Any, sync_ser
     Returns:
         Template groups as markdown table
     """
-    with db.cursor() as cur:
-        cur.execute(f"SELECT prefix, title FROM {db.table('templategroups')} ORDER BY title")
-        groups = cur.fetchall()
+    return await asyncio.to_thread(_render_template_groups, db)
 
-    if not groups:
-        return "No template groups found."
 
-    lines = ["# Template Groups\n", "| Prefix | Title |", "|--------|-------|"]
-    for g in groups:
-        lines.append(f"| {g['prefix']} | {g['title']} |")
-    return "\n".join(lines)
+def _render_template_groups(db: Any) -> str:
+    """Write streamed template group rows straight into the response buffer."""
+    buf = io.StringIO()
+    for group in db.iter_template_groups():
+        buf.write(f"\n| {group['prefix']} | {group['title']} |")
+
+    if not buf.tell():
+        return "No template groups found."
+    return "# Template Groups\n\n| Prefix | Title |\n|--------|-------|" + buf.getvalue()
 
 
 # Handler registry for admin tools
@@ -1,6 +1,78 @@
 """Common formatting utilities for handler modules."""
 
-from typing import List
+import sys
+from pathlib import Path
+from typing import Any, Callable, List
+
+# handlers -> mybb_mcp -> mybb_mcp -> repo root (holds the plugin_manager package)
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+_plugin_manager: Any = None
+_repo_on_path = False
+
+
+def ensure_repo_on_path() -> None:
+    """Make the repo root importable so ``plugin_manager`` can be imported.
+
+    Only the first call scans and edits sys.path; later calls return at once.
+    """
+    global _repo_on_path
+    if _repo_on_path:
+        return
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    _repo_on_path = True
+
+
+def get_plugin_manager() -> Any:
+    """Return the shared PluginManager, creating it on first use.
+
+    Call this from the event loop thread only: the manager's ProjectDatabase
+    holds a sqlite3 connection bound to the thread that created it.
+
+    Raises:
+        ImportError: If plugin_manager cannot be imported
+    """
+    global _plugin_manager
+    if _plugin_manager is None:
+        ensure_repo_on_path()
+        from plugin_manager.manager import PluginManager
+        _plugin_manager = PluginManager()
+    return _plugin_manager
+
+
+# Handler modules that mirror MyBB settings or datacache rows register their
+# reset function here; every tool that writes settings or the datacache
+# (directly or through the bridge) calls invalidate_board_caches().
+_board_cache_resets: List[Callable[[], None]] = []
+
+
+def board_cache_reset(reset: Callable[[], None]) -> Callable[[], None]:
+    """Register reset to run on invalidate_board_caches() (usable as a decorator)."""
+    _board_cache_resets.append(reset)
+    return reset
+
+
+def invalidate_board_caches() -> None:
+    """Drop every in-process copy of MyBB settings and datacache rows."""
+    for reset in _board_cache_resets:
+        reset()
+
+
+# Characters that would break a markdown table row
+_TABLE_CELL_ESCAPES = str.maketrans({"|": "\\|", "\n": " ", "\r": ""})
+
+
+def format_table_cell(value: Any) -> str:
+    """Escape a value for use inside a markdown table cell.
+
+    Args:
+        value: Cell value (converted with str())
+
+    Returns:
+        Cell text with pipes escaped and line breaks flattened
+    """
+    return str(value).translate(_TABLE_CELL_ESCAPES)
 
 
 def format_markdown_table(headers: List[str], rows: List[List[str]]) -> str:
@@ -28,7 +100,7 @@ def format_markdown_table(headers: List[str], rows: List[List[str]]) -> str:
     for row in rows:
         # Ensure row has same number of columns as headers
         padded_row = list(row) + [""] * (len(headers) - len(row))
-        lines.append("| " + " | ".join(str(cell) for cell in padded_row[:len(headers)]) + " |")
+        lines.append("| " + " | ".join(format_table_cell(cell) for cell in padded_row[:len(headers)]) + " |")
 
     return "\n".join(lines)
 
@@ -1,10 +1,12 @@
 """Content handlers for MyBB MCP tools (forums, threads, posts)."""
 
+import asyncio
 from datetime import datetime
 import time
 from typing import Any
 
-from ..bridge import MyBBBridgeClient
+from ..bridge import get_bridge
+from .common import invalidate_board_caches
 
 
 # ==================== Forum Handlers ====================
@@ -21,7 +23,7 @@ async def handle_forum_list(args: dict, db: Any, config: Any, sync_service: Any)
     Returns:
         Forums as markdown table
     """
-    forums = db.list_forums()
+    forums = await asyncio.to_thread(db.list_forums)
     if not forums:
         return "No forums found."
 
@@ -48,7 +50,7 @@ async def handle_forum_read(args: dict, db: Any, config: Any, sync_service: Any)
     if not fid:
         return "Error: 'fid' is required."
 
-    forum = db.get_forum(fid)
+    forum = await asyncio.to_thread(db.get_forum, fid)
     if not forum:
         return f"Forum {fid} not found."
 
@@ -88,7 +90,7 @@ async def handle_forum_create(args: dict, db: Any, config: Any, sync_service: An
     if not name:
         return "Error: 'name' is required."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -106,6 +108,7 @@ async def handle_forum_create(args: dict, db: Any, config: Any, sync_service: An
         active=args.get("active"),
         open=args.get("open"),
     )
+    invalidate_board_caches()
 
     if not result.success:
         return f"Error: Bridge forum:create failed: {result.error or 'unknown error'}"
@@ -138,7 +141,7 @@ async def handle_forum_update(args: dict, db: Any, config: Any, sync_service: An
     if not updates:
         return "Error: No update fields provided."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -147,6 +150,7 @@ async def handle_forum_update(args: dict, db: Any, config: Any, sync_service: An
         return "Error: Bridge does not support 'forum:update' yet."
 
     result = await bridge.call_async("forum:update", fid=fid, **updates)
+    invalidate_board_caches()
     if not result.success:
         return f"Error: Bridge forum:update failed: {result.error or 'unknown error'}"
 
@@ -176,7 +180,7 @@ async def handle_forum_delete(args: dict, db: Any, config: Any, sync_service: An
 
     force_content_deletion = args.get("force_content_deletion", False)
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -185,6 +189,7 @@ async def handle_forum_delete(args: dict, db: Any, config: Any, sync_service: An
         return "Error: Bridge does not support 'forum:delete' yet."
 
     result = await bridge.call_async("forum:delete", fid=fid, force_content_deletion=force_content_deletion)
+    invalidate_board_caches()
 
     if not result.success:
         # Bridge returns detailed error for content check
@@ -220,7 +225,7 @@ async def handle_thread_list(args: dict, db: Any, config: Any, sync_service: Any
     limit = args.get("limit", 50)
     offset = args.get("offset", 0)
 
-    threads = db.list_threads(fid=fid, limit=limit, offset=offset)
+    threads = await asyncio.to_thread(db.list_threads, fid=fid, limit=limit, offset=offset)
     if not threads:
         return "No threads found."
 
@@ -249,7 +254,7 @@ async def handle_thread_read(args: dict, db: Any, config: Any, sync_service: Any
     if not tid:
         return "Error: 'tid' is required."
 
-    thread = db.get_thread(tid)
+    thread = await asyncio.to_thread(db.get_thread, tid)
     if not thread:
         return f"Thread {tid} not found."
 
@@ -299,7 +304,7 @@ async def handle_thread_create(args: dict, db: Any, config: Any, sync_service: A
     uid = args.get("uid", 1)
     username = args.get("username", "Admin")
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -359,7 +364,7 @@ async def handle_thread_update(args: dict, db: Any, config: Any, sync_service: A
     if subject is None and closed is None and sticky is None and visible is None:
         return "Error: No update fields provided."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -401,7 +406,7 @@ async def handle_thread_delete(args: dict, db: Any, config: Any, sync_service: A
     if not tid:
         return "Error: 'tid' is required."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -441,7 +446,7 @@ async def handle_thread_move(args: dict, db: Any, config: Any, sync_service: Any
     if not tid or not new_fid:
         return "Error: 'tid' and 'new_fid' are required."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -480,7 +485,7 @@ async def handle_post_list(args: dict, db: Any, config: Any, sync_service: Any)
     limit = args.get("limit", 50)
     offset = args.get("offset", 0)
 
-    posts = db.list_posts(tid=tid, limit=limit, offset=offset)
+    posts = await asyncio.to_thread(db.list_posts, tid=tid, limit=limit, offset=offset)
     if not posts:
         return "No posts found."
 
@@ -512,7 +517,7 @@ async def handle_post_read(args: dict, db: Any, config: Any, sync_service: Any)
     if not pid:
         return "Error: 'pid' is required."
 
-    post = db.get_post(pid)
+    post = await asyncio.to_thread(db.get_post, pid)
     if not post:
         return f"Post {pid} not found."
 
@@ -561,7 +566,7 @@ async def handle_post_create(args: dict, db: Any, config: Any, sync_service: Any
     username = args.get("username", "Admin")
     replyto = args.get("replyto", 0)
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -619,7 +624,7 @@ async def handle_post_update(args: dict, db: Any, config: Any, sync_service: Any
     if not any([message, subject]):
         return "Error: Provide at least 'message' or 'subject' to update."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -673,14 +678,14 @@ async def handle_post_delete(args: dict, db: Any, config: Any, sync_service: Any
         return "Error: 'pid' is required."
 
     # Read-only check for first post (delete thread instead)
-    post = db.get_post(pid)
+    post = await asyncio.to_thread(db.get_post, pid)
     if not post:
         return f"Error: Post {pid} not found."
-    thread = db.get_thread(post['tid'])
+    thread = await asyncio.to_thread(db.get_thread, post['tid'])
     if not restore and thread and thread['firstpost'] == pid:
         return "Error: Cannot delete first post. Delete the thread instead."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
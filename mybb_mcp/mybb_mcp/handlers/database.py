@@ -1,8 +1,16 @@
 """Database query handler for MyBB MCP tools."""
 
+import asyncio
 from typing import Any
 
 
+def _fetch_all(db: Any, query: str) -> list[dict]:
+    """Run a query on a pooled connection and return every row."""
+    with db.cursor() as cur:
+        cur.execute(query)
+        return cur.fetchall()
+
+
 async def handle_db_query(args: dict, db: Any, config: Any, sync_service: Any) -> str:
     """Execute a read-only SQL query against the MyBB database.
 
@@ -23,9 +31,7 @@ async def handle_db_query(args: dict, db: Any, config: Any, sync_service: Any) -
     if not any(query_upper.startswith(prefix) for prefix in allowed_prefixes):
         return "Error: Only read-only queries allowed (SELECT, DESCRIBE, SHOW, EXPLAIN)."
 
-    with db.cursor() as cur:
-        cur.execute(query)
-        rows = cur.fetchall()
+    rows = await asyncio.to_thread(_fetch_all, db, query)
 
     if not rows:
         return "No results."
@@ -33,6 +33,9 @@ async def dispatch_tool(
     if handler is None:
         return f"Unknown tool: {name}"
 
+    if sync_service is None and name in SYNC_HANDLERS:
+        return f"Error: {name} needs disk sync, which is disabled (MYBB_SYNC_ENABLED=false)."
+
     try:
         # Call the handler with all parameters
         result = await handler(args, db, config, sync_service)
@@ -1,9 +1,41 @@
 """Moderation handlers for MyBB MCP tools."""
 
+import asyncio
+import json
 from datetime import datetime
 from typing import Any
 
-from ..bridge import MyBBBridgeClient
+from ..bridge import get_bridge
+from .common import format_table_cell
+
+
+def _thread_target(args: dict) -> dict | None:
+    """Bridge options for the tids list or single tid in args, or None if neither."""
+    tids = args.get("tids")
+    if tids:
+        return {"tids": ",".join(str(int(tid)) for tid in tids)}
+    tid = args.get("tid")
+    return {"tid": tid} if tid else None
+
+
+def _thread_result(target: dict, status: str) -> str:
+    """Success message for a single-thread or multi-thread moderation call."""
+    if "tids" in target:
+        return f"# Threads {status.title()} (Bridge)\n\nThreads {target['tids']} have been {status} successfully."
+    return f"# Thread {status.title()} (Bridge)\n\nThread {target['tid']} has been {status} successfully."
+
+
+def _modlog_params(entry: dict) -> dict:
+    """Bridge options for one modlog:add call."""
+    return {
+        "uid": entry["uid"],
+        "logaction": entry["action"],
+        "fid": entry.get("fid", 0),
+        "tid": entry.get("tid", 0),
+        "pid": entry.get("pid", 0),
+        "data": entry.get("data", ""),
+        "ipaddress": entry.get("ipaddress", ""),
+    }
 
 
 # ==================== Moderation Action Handlers ====================
@@ -28,7 +60,7 @@ async def handle_mod_close_thread(args: dict, db: Any, config: Any, sync_service
     if not tid:
         return "Error: 'tid' is required."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -64,7 +96,7 @@ async def handle_mod_stick_thread(args: dict, db: Any, config: Any, sync_service
     if not tid:
         return "Error: 'tid' is required."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -81,11 +113,12 @@ async def handle_mod_stick_thread(args: dict, db: Any, config: Any, sync_service
 
 
 async def handle_mod_approve_thread(args: dict, db: Any, config: Any, sync_service: Any) -> str:
-    """Approve or unapprove a thread.
+    """Approve or unapprove one or more threads.
 
     Args:
         args: Tool arguments containing:
-            - tid: Thread ID (required)
+            - tid: Thread ID (required unless tids is given)
+            - tids: Thread IDs to moderate in one bridge call (optional)
             - approve: True to approve, False to unapprove (default True)
         db: MyBBDatabase instance
         config: Server configuration (unused)
@@ -94,13 +127,13 @@ async def handle_mod_approve_thread(args: dict, db: Any, config: Any, sync_servi
     Returns:
         Success or error message as markdown
     """
-    tid = args.get("tid")
+    target = _thread_target(args)
     approve = args.get("approve", True)
 
-    if not tid:
-        return "Error: 'tid' is required."
+    if target is None:
+        return "Error: 'tid' or 'tids' is required."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -108,12 +141,11 @@ async def handle_mod_approve_thread(args: dict, db: Any, config: Any, sync_servi
     if "mod:approve_thread" not in supported:
         return "Error: Bridge does not support 'mod:approve_thread' yet."
 
-    result = await bridge.call_async("mod:approve_thread", tid=tid, approve=1 if approve else 0)
+    result = await bridge.call_async("mod:approve_thread", **target, approve=1 if approve else 0)
     if not result.success:
         return f"Error: Bridge mod:approve_thread failed: {result.error or 'unknown error'}"
 
-    status = "approved" if approve else "unapproved"
-    return f"# Thread {status.title()} (Bridge)\n\nThread {tid} has been {status} successfully."
+    return _thread_result(target, "approved" if approve else "unapproved")
 
 
 async def handle_mod_approve_post(args: dict, db: Any, config: Any, sync_service: Any) -> str:
@@ -136,7 +168,7 @@ async def handle_mod_approve_post(args: dict, db: Any, config: Any, sync_service
     if not pid:
         return "Error: 'pid' is required."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -153,11 +185,12 @@ async def handle_mod_approve_post(args: dict, db: Any, config: Any, sync_service
 
 
 async def handle_mod_soft_delete_thread(args: dict, db: Any, config: Any, sync_service: Any) -> str:
-    """Soft delete or restore a thread.
+    """Soft delete or restore one or more threads.
 
     Args:
         args: Tool arguments containing:
-            - tid: Thread ID (required)
+            - tid: Thread ID (required unless tids is given)
+            - tids: Thread IDs to moderate in one bridge call (optional)
             - delete: True to soft delete, False to restore (default True)
         db: MyBBDatabase instance
         config: Server configuration (unused)
@@ -166,13 +199,13 @@ async def handle_mod_soft_delete_thread(args: dict, db: Any, config: Any, sync_s
     Returns:
         Success or error message as markdown
     """
-    tid = args.get("tid")
+    target = _thread_target(args)
     delete = args.get("delete", True)
 
-    if not tid:
-        return "Error: 'tid' is required."
+    if target is None:
+        return "Error: 'tid' or 'tids' is required."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -181,12 +214,11 @@ async def handle_mod_soft_delete_thread(args: dict, db: Any, config: Any, sync_s
     if action not in supported:
         return f"Error: Bridge does not support '{action}' yet."
 
-    result = await bridge.call_async(action, tid=tid)
+    result = await bridge.call_async(action, **target)
     if not result.success:
         return f"Error: Bridge {action} failed: {result.error or 'unknown error'}"
 
-    status = "soft deleted" if delete else "restored"
-    return f"# Thread {status.title()} (Bridge)\n\nThread {tid} has been {status} successfully."
+    return _thread_result(target, "soft deleted" if delete else "restored")
 
 
 async def handle_mod_soft_delete_post(args: dict, db: Any, config: Any, sync_service: Any) -> str:
@@ -209,7 +241,7 @@ async def handle_mod_soft_delete_post(args: dict, db: Any, config: Any, sync_ser
     if not pid:
         return "Error: 'pid' is required."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -249,7 +281,7 @@ async def handle_modlog_list(args: dict, db: Any, config: Any, sync_service: Any
     tid = args.get("tid")
     limit = args.get("limit", 50)
 
-    entries = db.list_modlog_entries(uid=uid, fid=fid, tid=tid, limit=limit)
+    entries = await asyncio.to_thread(db.list_modlog_entries, uid=uid, fid=fid, tid=tid, limit=limit)
 
     if not entries:
         return "No moderation log entries found."
@@ -289,18 +321,10 @@ async def handle_modlog_add(args: dict, db: Any, config: Any, sync_service: Any)
     Returns:
         Success or error message as markdown
     """
-    uid = args.get("uid")
-    fid = args.get("fid", 0)
-    tid = args.get("tid", 0)
-    pid = args.get("pid", 0)
-    action = args.get("action")
-    data = args.get("data", "")
-    ipaddress = args.get("ipaddress", "")
-
-    if not uid or not action:
+    if not args.get("uid") or not args.get("action"):
         return "Error: 'uid' and 'action' are required."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -308,16 +332,7 @@ async def handle_modlog_add(args: dict, db: Any, config: Any, sync_service: Any)
     if "modlog:add" not in supported:
         return "Error: Bridge does not support 'modlog:add' yet."
 
-    result = await bridge.call_async(
-        "modlog:add",
-        uid=uid,
-        logaction=action,
-        fid=fid,
-        tid=tid,
-        pid=pid,
-        data=data,
-        ipaddress=ipaddress,
-    )
+    result = await bridge.call_async("modlog:add", **_modlog_params(args))
 
     if not result.success:
         return f"Error: Bridge modlog:add failed: {result.error or 'unknown error'}"
@@ -325,6 +340,60 @@ async def handle_modlog_add(args: dict, db: Any, config: Any, sync_service: Any)
     return "# Moderation Log Entry Added (Bridge)\n\nLog entry created successfully."
 
 
+async def handle_modlog_add_bulk(args: dict, db: Any, config: Any, sync_service: Any) -> str:
+    """Add several moderation log entries in one bridge call.
+
+    The bridge inserts every entry with a single multi-row INSERT, so either
+    all entries are logged or none are.
+
+    Args:
+        args: Tool arguments containing:
+            - entries: List of log entries, each with uid and action (required)
+              and fid, tid, pid, data, ipaddress (optional)
+        db: MyBBDatabase instance
+        config: Server configuration (unused)
+        sync_service: Disk sync service (unused)
+
+    Returns:
+        Per-entry results as markdown table or error message
+    """
+    entries = args.get("entries") or []
+
+    if not entries:
+        return "Error: 'entries' must contain at least one entry."
+
+    for i, entry in enumerate(entries):
+        if not entry.get("uid") or not entry.get("action"):
+            return f"Error: entries[{i}] requires 'uid' and 'action'."
+    params = [_modlog_params(entry) for entry in entries]
+
+    bridge = get_bridge(config.mybb_root)
+    info = await bridge.info_async()
+    if not info.success:
+        return f"Error: Bridge info failed: {info.error or 'unknown error'}"
+    supported = info.data.get("supported_actions", [])
+    if "modlog:add_bulk" not in supported:
+        return "Error: Bridge does not support 'modlog:add_bulk' yet."
+
+    result = await bridge.call_async("modlog:add_bulk", entries_json=json.dumps(params))
+    if not result.success:
+        bridge.invalidate_info()
+        return f"Error: Bridge modlog:add_bulk failed: {result.error or 'unknown error'}"
+
+    lines = [
+        "# Moderation Log Entries Added (Bridge)\n",
+        f"{len(params)} entries added.\n",
+        "| # | UID | Action |",
+        "|---|-----|--------|",
+        *[
+            f"| {i} | {entry['uid']} | {format_table_cell(entry['logaction'])} |"
+            for i, entry in enumerate(params)
+        ],
+    ]
+
+    return "\n".join(lines)
+
+
 # Handler registry for moderation tools
 MODERATION_HANDLERS = {
     "mybb_mod_close_thread": handle_mod_close_thread,
@@ -335,4 +404,5 @@ MODERATION_HANDLERS = {
     "mybb_mod_soft_delete_post": handle_mod_soft_delete_post,
     "mybb_modlog_list": handle_modlog_list,
     "mybb_modlog_add": handle_modlog_add,
+    "mybb_modlog_add_bulk": handle_modlog_add_bulk,
 }
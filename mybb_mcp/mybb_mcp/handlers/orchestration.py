@@ -1,5 +1,6 @@
 """Server orchestration handlers for MyBB MCP tools."""
 
+import asyncio
 from typing import Any, Optional
 
 # Module-level singleton for service instance
@@ -103,10 +104,12 @@ async def handle_server_logs(args: dict, db: Any, config: Any, sync_service: Any
         filter_keyword=args.get("filter_keyword"),
         limit=args.get("limit", 50),
         tail=args.get("tail", True),
-        offset=args.get("offset", 0)
+        offset=args.get("offset", 0),
+        parallel=args.get("parallel", False)
     )
 
-    return service.query_logs(options)
+    # Log scans read (and may parse) megabytes of log; keep them off the event loop
+    return await asyncio.to_thread(service.query_logs, options)
 
 
 async def handle_server_restart(args: dict, db: Any, config: Any, sync_service: Any) -> str:
@@ -9,16 +9,22 @@ Handlers for plugin operations:
 - Plugin status queries
 """
 
+import asyncio
+import functools
 import re
-import sys
 import json
 import logging
+import os
 import shutil
 import tempfile
+import time
 import zipfile
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+from .common import REPO_ROOT, board_cache_reset, ensure_repo_on_path, get_plugin_manager, invalidate_board_caches
+
 logger = logging.getLogger(__name__)
 
 
@@ -106,6 +112,10 @@ def detect_embedded_templates(php_content: str) -> dict:
     return result
 
 
+_project_db_path: Path | None = None
+_project_db: Any = None
+
+
 def _get_plugin_manager_db_path() -> Path:
     """Get the canonical database path for plugin_manager.
 
@@ -115,18 +125,69 @@ def _get_plugin_manager_db_path() -> Path:
     Returns:
         Path to projects.db
     """
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
+    global _project_db_path
+    if _project_db_path is None:
+        ensure_repo_on_path()
+        from plugin_manager.config import Config
+
+        _project_db_path = Config(repo_root=REPO_ROOT).database_path
+    return _project_db_path
+
+
+def _get_project_db() -> Any:
+    """Return the shared ProjectDatabase, or None if it has not been created yet.
+
+    Only opened once the database file exists, so read-only tools never
+    create an empty projects.db. Call from the event loop thread only.
+
+    Raises:
+        ImportError: If plugin_manager cannot be imported
+    """
+    global _project_db
+    if _project_db is None:
+        db_path = _get_plugin_manager_db_path()
+        if not db_path.exists():
+            return None
+        from plugin_manager.database import ProjectDatabase
+
+        _project_db = ProjectDatabase(db_path)
+    return _project_db
+
 
-    from plugin_manager.config import Config
+@functools.lru_cache(maxsize=256)
+def _parse_meta(path: str, mtime_ns: int) -> dict:
+    """Parse a meta.json file; cached per (path, mtime) so edits are picked up."""
+    return json.loads(Path(path).read_bytes())
 
-    config = Config(repo_root=repo_root)
-    return config.database_path
+
+def _load_meta(meta_path: Path) -> dict:
+    """Load a workspace meta.json, reusing the parsed dict while it is unchanged.
+
+    The returned dict is shared between calls and must not be modified.
+
+    Raises:
+        FileNotFoundError: If meta_path does not exist
+    """
+    return _parse_meta(str(meta_path), meta_path.stat().st_mtime_ns)
 
 
 # ==================== Plugin Listing Handlers ====================
 
+def _legacy_plugin_names(plugins_dir: Path) -> list[str]:
+    """List plugin codenames in a TestForum ``inc/plugins`` directory.
+
+    Scans raw directory entries instead of globbing into Path objects.
+
+    Raises:
+        FileNotFoundError: If plugins_dir does not exist
+    """
+    with os.scandir(plugins_dir) as entries:
+        return [
+            entry.name[:-4] for entry in entries
+            if entry.name.endswith(".php") and entry.name != "index.php"
+        ]
+
+
 async def handle_list_plugins(
     args: dict, db: Any, config: Any, sync_service: Any
 ) -> str:
@@ -144,28 +205,19 @@ async def handle_list_plugins(
     plugins_dir = Path(config.mybb_root) / "inc" / "plugins"
 
     try:
-        # Add plugin_manager to path
-        repo_root = Path(__file__).resolve().parent.parent.parent.parent
-        if str(repo_root) not in sys.path:
-            sys.path.insert(0, str(repo_root))
-
-        from plugin_manager.database import ProjectDatabase
-
         # Get workspace plugins from ProjectDatabase
-        db_path = _get_plugin_manager_db_path()
-        if db_path.exists():
-            project_db = ProjectDatabase(db_path)
+        project_db = _get_project_db()
+        if project_db is not None:
             workspace_plugins = project_db.list_projects(type="plugin")
         else:
             workspace_plugins = []
 
-        # Get legacy plugins from filesystem
-        legacy_plugins = []
-        if plugins_dir.exists():
-            all_files = [f.stem for f in plugins_dir.glob("*.php") if f.stem != "index"]
-            # Filter out plugins already in workspace
-            workspace_codenames = {p['codename'] for p in workspace_plugins}
-            legacy_plugins = [p for p in all_files if p not in workspace_codenames]
+        # Get legacy plugins from filesystem, minus those already in workspace
+        try:
+            legacy_plugins = set(_legacy_plugin_names(plugins_dir))
+        except FileNotFoundError:
+            legacy_plugins = set()
+        legacy_plugins -= {p['codename'] for p in workspace_plugins}
 
         # Build response
         lines = ["# Plugins\n"]
@@ -174,7 +226,7 @@ async def handle_list_plugins(
             lines.append("## Workspace Plugins (Managed)")
             lines.append("| Name | Status | Visibility | Version |")
             lines.append("|------|--------|------------|---------|")
-            for p in sorted(workspace_plugins, key=lambda x: x['codename']):
+            for p in sorted(workspace_plugins, key=itemgetter('codename')):
                 lines.append(f"| {p['display_name']} (`{p['codename']}`) | {p['status']} | {p['visibility']} | {p['version']} |")
             lines.append("")
 
@@ -192,9 +244,10 @@ async def handle_list_plugins(
 
     except ImportError:
         # Fallback to legacy filesystem scan only
-        if not plugins_dir.exists():
+        try:
+            plugins = _legacy_plugin_names(plugins_dir)
+        except FileNotFoundError:
             return "Plugins directory not found."
-        plugins = [f.stem for f in plugins_dir.glob("*.php") if f.stem != "index"]
         lines = [f"# Plugins ({len(plugins)})\n"]
         for p in sorted(plugins):
             lines.append(f"- `{p}`")
@@ -219,43 +272,34 @@ async def handle_read_plugin(
     pname = args.get("name", "").replace(".php", "")
 
     try:
-        # Add plugin_manager to path
-        repo_root = Path(__file__).resolve().parent.parent.parent.parent
-        if str(repo_root) not in sys.path:
-            sys.path.insert(0, str(repo_root))
-
-        from plugin_manager.database import ProjectDatabase
-
         # Check workspace first
-        db_path = _get_plugin_manager_db_path()
+        project_db = _get_project_db()
         workspace_path = None
         meta_info = None
 
-        if db_path.exists():
-            project_db = ProjectDatabase(db_path)
+        if project_db is not None:
             project = project_db.get_project(pname)
             if project:
-                workspace_path = repo_root / project['workspace_path']
+                workspace_path = REPO_ROOT / project['workspace_path']
                 # Try to read meta.json for additional context
-                meta_path = workspace_path / "meta.json"
-                if meta_path.exists():
-                    with open(meta_path, 'r') as f:
-                        meta_info = json.load(f)
+                try:
+                    meta_info = _load_meta(workspace_path / "meta.json")
+                except FileNotFoundError:
+                    pass
 
         # Read plugin source (workspace or legacy)
         if workspace_path and workspace_path.exists():
-            plugin_file = workspace_path / "src" / f"{pname}.php"
-            if plugin_file.exists():
-                source = plugin_file.read_text()
-                location = f"Workspace: `{project['workspace_path']}/src/{pname}.php`"
-            else:
+            try:
+                source = await asyncio.to_thread((workspace_path / "src" / f"{pname}.php").read_text)
+            except FileNotFoundError:
                 return f"# Plugin: {pname}\n\n**Error:** Plugin found in database but source file missing."
+            location = f"Workspace: `{project['workspace_path']}/src/{pname}.php`"
         else:
             # Fallback to legacy TestForum location
-            ppath = plugins_dir / f"{pname}.php"
-            if not ppath.exists():
+            try:
+                source = await asyncio.to_thread((plugins_dir / f"{pname}.php").read_text)
+            except FileNotFoundError:
                 return f"Plugin '{pname}' not found in workspace or TestForum."
-            source = ppath.read_text()
             location = f"Legacy: `TestForum/inc/plugins/{pname}.php` (Not managed)"
 
         # Build response
@@ -277,10 +321,11 @@ async def handle_read_plugin(
 
     except ImportError:
         # Fallback to legacy read
-        ppath = plugins_dir / f"{pname}.php"
-        if not ppath.exists():
+        try:
+            source = await asyncio.to_thread((plugins_dir / f"{pname}.php").read_text)
+        except FileNotFoundError:
             return f"Plugin '{pname}' not found."
-        return f"# Plugin: {pname}\n\n```php\n{ppath.read_text()}\n```"
+        return f"# Plugin: {pname}\n\n```php\n{source}\n```"
 
 
 async def handle_create_plugin(
@@ -297,19 +342,12 @@ async def handle_create_plugin(
     Returns:
         Markdown formatted creation result
     """
-    # Add plugin_manager to path
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-
     try:
-        from plugin_manager.manager import PluginManager
+        manager = get_plugin_manager()
         from forge_config import ForgeConfig
 
-        manager = PluginManager()
-
         # Load forge config for developer defaults
-        forge_config = ForgeConfig(repo_root)
+        forge_config = ForgeConfig(REPO_ROOT)
 
         # Map MCP args to plugin_manager params (forge config provides defaults)
         codename = args.get("codename", "").lower().replace(" ", "_").replace("-", "_")
@@ -343,20 +381,26 @@ async def handle_create_plugin(
 
         # Format response as markdown
         if result.get("success"):
-            files_list = "\n".join(f"- `{f}`" for f in result.get('files_created', []))
-            return (
-                f"# Plugin Created: {display_name}\n\n"
-                f"**Codename:** `{result['codename']}`\n"
-                f"**Workspace:** `{result['workspace_path']}`\n"
-                f"**Project ID:** {result['project_id']}\n"
-                f"**Visibility:** {visibility}\n\n"
-                f"## Files Created\n{files_list}\n\n"
-                f"## Next Steps\n"
-                f"1. Edit the plugin at `{result['workspace_path']}/src/{codename}.php`\n"
-                f"2. Run `mybb_plugin_activate {codename}` to deploy to TestForum\n"
-                f"3. Activate in MyBB Admin CP to run PHP hooks\n"
-                f"4. Export for distribution when ready"
-            )
+            lines = [
+                f"# Plugin Created: {display_name}",
+                "",
+                f"**Codename:** `{result['codename']}`",
+                f"**Workspace:** `{result['workspace_path']}`",
+                f"**Project ID:** {result['project_id']}",
+                f"**Visibility:** {visibility}",
+                "",
+                "## Files Created",
+            ]
+            lines.extend(f"- `{f}`" for f in result.get('files_created', []))
+            lines.extend([
+                "",
+                "## Next Steps",
+                f"1. Edit the plugin at `{result['workspace_path']}/src/{codename}.php`",
+                f"2. Run `mybb_plugin_activate {codename}` to deploy to TestForum",
+                "3. Activate in MyBB Admin CP to run PHP hooks",
+                "4. Export for distribution when ready",
+            ])
+            return "\n".join(lines)
         else:
             return f"# Error Creating Plugin\n\n**Error:** {result.get('error', 'Unknown error')}"
 
@@ -433,6 +477,60 @@ async def handle_hooks_usage(
 
 # ==================== Plugin Analysis Handlers ====================
 
+_HOOK_RE = re.compile(r"\$plugins->add_hook\s*\(\s*['\"]([^'\"]+)['\"]")
+_FUNC_RE = re.compile(r"function\s+(\w+)")
+# Case-insensitive without lowercasing a copy of the whole source
+_CREATE_TABLE_RE = re.compile(r"create_table", re.IGNORECASE)
+
+
+def _plugin_functions(content: str, pname: str) -> list[str]:
+    """Return the suffixes of ``{pname}_*`` functions defined in content."""
+    prefix = f"{pname}_"
+    return [
+        name[len(prefix):] for name in _FUNC_RE.findall(content)
+        if name.startswith(prefix) and len(name) > len(prefix)
+    ]
+
+
+def _analyze_legacy_plugin(pname: str, plugins_dir: Path) -> str:
+    """Analyze an unmanaged plugin by parsing its PHP source in TestForum.
+
+    Reads and regex-scans the file, so handlers run it via asyncio.to_thread.
+    """
+    try:
+        content = (plugins_dir / f"{pname}.php").read_text()
+    except FileNotFoundError:
+        return f"Plugin '{pname}' not found."
+
+    lines = [f"# Plugin Analysis: {pname}\n"]
+    lines.append("**Source:** Legacy (Unmanaged)\n")
+
+    # Find hooks
+    hooks = _HOOK_RE.findall(content)
+    lines.append(f"## Hooks ({len(hooks)})")
+    for h in hooks[:20]:
+        lines.append(f"- `{h}`")
+
+    # Find _info function
+    if f"{pname}_info" in content:
+        lines.append("\n## Has _info: Yes")
+
+    # Find functions
+    funcs = _plugin_functions(content, pname)
+    lines.append(f"\n## Functions ({len(funcs)})")
+    for f in funcs[:20]:
+        lines.append(f"- `{pname}_{f}()`")
+
+    # Check for features
+    lines.append("\n## Features")
+    lines.append(f"- Settings: {'Yes' if 'settinggroups' in content else 'No'}")
+    lines.append(f"- Templates: {'Yes' if 'templates' in content and 'insert_query' in content else 'No'}")
+    has_database = 'write_query' in content or _CREATE_TABLE_RE.search(content) is not None
+    lines.append(f"- Database: {'Yes' if has_database else 'No'}")
+
+    return "\n".join(lines)
+
+
 async def handle_analyze_plugin(
     args: dict, db: Any, config: Any, sync_service: Any
 ) -> str:
@@ -451,28 +549,20 @@ async def handle_analyze_plugin(
     pname = args.get("name", "").replace(".php", "")
 
     try:
-        # Add plugin_manager to path
-        repo_root = Path(__file__).resolve().parent.parent.parent.parent
-        if str(repo_root) not in sys.path:
-            sys.path.insert(0, str(repo_root))
-
-        from plugin_manager.database import ProjectDatabase
-
         # Check if workspace plugin
-        db_path = _get_plugin_manager_db_path()
+        project_db = _get_project_db()
         is_workspace = False
         meta_info = None
 
-        if db_path.exists():
-            project_db = ProjectDatabase(db_path)
+        if project_db is not None:
             project = project_db.get_project(pname)
             if project:
-                workspace_path = repo_root / project['workspace_path']
-                meta_path = workspace_path / "meta.json"
-                if meta_path.exists():
-                    with open(meta_path, 'r') as f:
-                        meta_info = json.load(f)
+                workspace_path = REPO_ROOT / project['workspace_path']
+                try:
+                    meta_info = _load_meta(workspace_path / "meta.json")
                     is_workspace = True
+                except FileNotFoundError:
+                    pass
 
         lines = [f"# Plugin Analysis: {pname}\n"]
 
@@ -537,77 +627,51 @@ async def handle_analyze_plugin(
 
         else:
             # Fall back to PHP parsing for legacy plugins
-            ppath = plugins_dir / f"{pname}.php"
-            if not ppath.exists():
-                return f"Plugin '{pname}' not found."
-
-            content = ppath.read_text()
-            lines = [f"# Plugin Analysis: {pname}\n"]
-            lines.append("**Source:** Legacy (Unmanaged)\n")
-
-            # Find hooks
-            hook_pattern = r"\$plugins->add_hook\s*\(\s*['\"]([^'\"]+)['\"]"
-            hooks = re.findall(hook_pattern, content)
-            lines.append(f"## Hooks ({len(hooks)})")
-            for h in hooks[:20]:
-                lines.append(f"- `{h}`")
+            return await asyncio.to_thread(_analyze_legacy_plugin, pname, plugins_dir)
+
+    except ImportError:
+        # Fallback to legacy PHP parsing
+        return await asyncio.to_thread(_analyze_legacy_plugin, pname, plugins_dir)
 
-            # Find _info function
-            if f"{pname}_info" in content:
-                lines.append("\n## Has _info: Yes")
 
-            # Find functions
-            func_pattern = rf"function\s+{pname}_(\w+)"
-            funcs = re.findall(func_pattern, content)
-            lines.append(f"\n## Functions ({len(funcs)})")
-            for f in funcs[:20]:
-                lines.append(f"- `{pname}_{f}()`")
+# ==================== Plugin Cache Handlers ====================
 
-            # Check for features
-            lines.append("\n## Features")
-            lines.append(f"- Settings: {'Yes' if 'settinggroups' in content else 'No'}")
-            lines.append(f"- Templates: {'Yes' if 'templates' in content and 'insert_query' in content else 'No'}")
-            lines.append(f"- Database: {'Yes' if 'create_table' in content.lower() or 'write_query' in content else 'No'}")
+# Active plugins from MyBB's "plugins" datacache, reused by
+# mybb_plugin_list_installed for as long as admin.py reuses datacache rows.
+# Dropped by invalidate_board_caches(), which the plugin lifecycle tools call.
+_PLUGINS_CACHE_TTL = 30.0
+_plugins_cache: dict[str, Any] = {"ts": 0.0, "data": None}
 
-            return "\n".join(lines)
 
-    except ImportError:
-        # Fallback to legacy PHP parsing
-        ppath = plugins_dir / f"{pname}.php"
-        if not ppath.exists():
-            return f"Plugin '{pname}' not found."
+@board_cache_reset
+def invalidate_plugins_cache() -> None:
+    """Drop the cached active-plugin listing."""
+    _plugins_cache["data"] = None
 
-        content = ppath.read_text()
-        lines = [f"# Plugin Analysis: {pname}\n"]
 
-        # Find hooks
-        hook_pattern = r"\$plugins->add_hook\s*\(\s*['\"]([^'\"]+)['\"]"
-        hooks = re.findall(hook_pattern, content)
-        lines.append(f"## Hooks ({len(hooks)})")
-        for h in hooks[:20]:
-            lines.append(f"- `{h}`")
-
-        # Find _info function
-        if f"{pname}_info" in content:
-            lines.append("\n## Has _info: Yes")
-
-        # Find functions
-        func_pattern = rf"function\s+{pname}_(\w+)"
-        funcs = re.findall(func_pattern, content)
-        lines.append(f"\n## Functions ({len(funcs)})")
-        for f in funcs[:20]:
-            lines.append(f"- `{pname}_{f}()`")
-
-        # Check for features
-        lines.append("\n## Features")
-        lines.append(f"- Settings: {'Yes' if 'settinggroups' in content else 'No'}")
-        lines.append(f"- Templates: {'Yes' if 'templates' in content and 'insert_query' in content else 'No'}")
-        lines.append(f"- Database: {'Yes' if 'create_table' in content.lower() or 'write_query' in content else 'No'}")
+async def _get_plugins_cache(db: Any) -> dict:
+    """Return db.get_plugins_cache(), reusing a recent result."""
+    now = time.monotonic()
+    if _plugins_cache["data"] is not None and now - _plugins_cache["ts"] < _PLUGINS_CACHE_TTL:
+        return _plugins_cache["data"]
+    cache = await asyncio.to_thread(db.get_plugins_cache)
+    _plugins_cache["data"] = cache
+    _plugins_cache["ts"] = now
+    return cache
 
-        return "\n".join(lines)
 
+_INFO_FIELDS = ("name", "description", "website", "author", "authorsite", "version", "compatibility", "codename")
+_INFO_FIELD_RE = re.compile(rf'"({"|".join(_INFO_FIELDS)})"\s*=>\s*"([^"]+)"')
+
+
+@functools.lru_cache(maxsize=128)
+def _info_function_re(info_func: str) -> re.Pattern:
+    """Compile (once per plugin) the pattern capturing an _info() function body."""
+    return re.compile(
+        rf"function\s+{re.escape(info_func)}\s*\(\s*\)\s*\{{([^}}]+(?:\{{[^}}]+\}}[^}}]*)*)\}}",
+        re.DOTALL,
+    )
 
-# ==================== Plugin Cache Handlers ====================
 
 async def handle_plugin_list_installed(
     args: dict, db: Any, config: Any, sync_service: Any
@@ -623,7 +687,7 @@ async def handle_plugin_list_installed(
     Returns:
         Markdown formatted list of installed plugins
     """
-    cache = db.get_plugins_cache()
+    cache = await _get_plugins_cache(db)
     if not cache["plugins"]:
         return "# Installed Plugins\n\nNo plugins are currently active.\n\n*Note: This shows plugins from datacache. File-based listing available via mybb_list_plugins.*"
 
@@ -651,19 +715,18 @@ async def handle_plugin_info(
     """
     plugins_dir = Path(config.mybb_root) / "inc" / "plugins"
     pname = args.get("name", "").replace(".php", "")
-    ppath = plugins_dir / f"{pname}.php"
-    if not ppath.exists():
+    try:
+        content = await asyncio.to_thread((plugins_dir / f"{pname}.php").read_text)
+    except FileNotFoundError:
         return f"Plugin '{pname}' not found in {plugins_dir}"
 
-    content = ppath.read_text()
     info_func = f"{pname}_info"
 
     if info_func not in content:
         return f"# Plugin: {pname}\n\nNo `{info_func}()` function found."
 
-    # Extract _info function content
-    pattern = rf"function\s+{info_func}\s*\(\s*\)\s*\{{([^}}]+(?:\{{[^}}]+\}}[^}}]*)*)\}}"
-    match = re.search(pattern, content, re.DOTALL)
+    # Extract _info function content (nested-brace pattern; scan off the loop)
+    match = await asyncio.to_thread(_info_function_re(info_func).search, content)
 
     if not match:
         return f"# Plugin: {pname}\n\nCould not parse `{info_func}()` function."
@@ -671,12 +734,13 @@ async def handle_plugin_info(
     info_content = match.group(1)
     lines = [f"# Plugin Info: {pname}\n"]
 
-    # Extract key fields
-    for field in ["name", "description", "website", "author", "authorsite", "version", "compatibility", "codename"]:
-        field_pattern = rf'"{field}"\s*=>\s*"([^"]+)"'
-        field_match = re.search(field_pattern, info_content)
-        if field_match:
-            lines.append(f"**{field.title()}**: {field_match.group(1)}")
+    # Extract key fields (first occurrence of each, in _INFO_FIELDS order)
+    values: dict[str, str] = {}
+    for field, value in _INFO_FIELD_RE.findall(info_content):
+        values.setdefault(field, value)
+    for field in _INFO_FIELDS:
+        if field in values:
+            lines.append(f"**{field.title()}**: {values[field]}")
 
     return "\n".join(lines)
 
@@ -702,18 +766,12 @@ async def handle_plugin_activate(
     if not pname:
         return "Error: Plugin codename is required."
 
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-
     manager = None
     project = None
     install_result = None
 
     try:
-        from plugin_manager.manager import PluginManager
-
-        manager = PluginManager()
+        manager = get_plugin_manager()
         project = manager.db.get_project(pname)
 
         if project and project.get("type") == "plugin":
@@ -743,6 +801,7 @@ async def handle_plugin_activate(
             )
 
         result = lifecycle.activate(pname, force=force)
+        invalidate_board_caches()
         if not result.success:
             return f"Error: Bridge activate failed: {result.error or 'unknown error'}"
     except FileNotFoundError as e:
@@ -791,17 +850,11 @@ async def handle_plugin_deactivate(
     if not pname:
         return "Error: Plugin codename is required."
 
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-
     manager = None
     project = None
 
     try:
-        from plugin_manager.manager import PluginManager
-
-        manager = PluginManager()
+        manager = get_plugin_manager()
         project = manager.db.get_project(pname)
     except ImportError:
         manager = None
@@ -816,6 +869,7 @@ async def handle_plugin_deactivate(
             lifecycle = PluginLifecycle(Path(config.mybb_root))
 
         result = lifecycle.deactivate(pname, uninstall=False)
+        invalidate_board_caches()
         if not result.success:
             return f"Error: Bridge deactivate failed: {result.error or 'unknown error'}"
     except FileNotFoundError as e:
@@ -854,26 +908,18 @@ async def handle_plugin_is_installed(
     pname = args.get("name", "").replace(".php", "")
 
     try:
-        # Add plugin_manager to path
-        repo_root = Path(__file__).resolve().parent.parent.parent.parent
-        if str(repo_root) not in sys.path:
-            sys.path.insert(0, str(repo_root))
-
-        from plugin_manager.database import ProjectDatabase
-
         # Check workspace database first
-        db_path = _get_plugin_manager_db_path()
+        project_db = _get_project_db()
         workspace_status = None
         workspace_project = None
 
-        if db_path.exists():
-            project_db = ProjectDatabase(db_path)
+        if project_db is not None:
             workspace_project = project_db.get_project(pname)
             if workspace_project:
                 workspace_status = workspace_project.get('status')
 
         # Check MyBB cache
-        is_active = db.is_plugin_installed(pname)
+        is_active = await asyncio.to_thread(db.is_plugin_installed, pname)
 
         # Build response
         lines = [f"# Plugin Status: {pname}\n"]
@@ -908,7 +954,7 @@ async def handle_plugin_is_installed(
 
     except ImportError:
         # Fallback to MyBB cache check only
-        is_active = db.is_plugin_installed(pname)
+        is_active = await asyncio.to_thread(db.is_plugin_installed, pname)
 
         if is_active:
             return f"# Plugin Status: {pname}\n\n**Status**: Active\n\nPlugin is currently in the active plugins cache."
@@ -938,15 +984,10 @@ async def handle_plugin_install(
     if not codename:
         return "Error: Plugin codename is required."
 
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-
     try:
-        from plugin_manager.manager import PluginManager
-
-        manager = PluginManager()
+        manager = get_plugin_manager()
         result = manager.activate_full(codename, force=force)
+        invalidate_board_caches()
 
         if result.get("success"):
             lines = [f"# Plugin Installed: {codename}\n"]
@@ -1007,15 +1048,10 @@ async def handle_plugin_uninstall(
     if not codename:
         return "Error: Plugin codename is required."
 
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-
     try:
-        from plugin_manager.manager import PluginManager
-
-        manager = PluginManager()
+        manager = get_plugin_manager()
         result = manager.deactivate_full(codename, uninstall=uninstall, remove_files=remove_files)
+        invalidate_board_caches()
 
         if result.get("success"):
             lines = [f"# Plugin Uninstalled: {codename}\n"]
@@ -1074,14 +1110,8 @@ async def handle_plugin_deploy(
     if action not in {"activate", "deactivate", "reinstall"}:
         return "Error: action must be one of: activate, deactivate, reinstall."
 
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-
     try:
-        from plugin_manager.manager import PluginManager
-
-        manager = PluginManager()
+        manager = get_plugin_manager()
     except ImportError as e:
         return f"Error: plugin_manager not available: {e}"
     except Exception as e:
@@ -1093,10 +1123,12 @@ async def handle_plugin_deploy(
         return await handle_plugin_deactivate({"name": codename}, db, config, sync_service)
 
     uninstall_result = manager.deactivate_full(codename, uninstall=True, remove_files=True)
+    invalidate_board_caches()
     if not uninstall_result.get("success"):
         return f"# Plugin Reinstall Failed: {codename}\n\n**Error:** {uninstall_result.get('error', 'Uninstall failed')}"
 
     install_result = manager.activate_full(codename, force=force)
+    invalidate_board_caches()
     if not install_result.get("success"):
         return f"# Plugin Reinstall Failed: {codename}\n\n**Error:** {install_result.get('error', 'Install failed')}"
 
@@ -1141,14 +1173,8 @@ async def handle_plugin_status(
     if not codename:
         return "Error: Plugin codename is required."
 
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-
     try:
-        from plugin_manager.manager import PluginManager
-
-        manager = PluginManager()
+        manager = get_plugin_manager()
         result = manager.get_plugin_status(codename)
 
         if result.get("success"):
@@ -1215,14 +1241,8 @@ async def handle_delete_plugin(
     Returns:
         Markdown formatted deletion result
     """
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-
     try:
-        from plugin_manager.manager import PluginManager
-
-        manager = PluginManager()
+        manager = get_plugin_manager()
 
         codename = args.get("codename", "")
         archive = args.get("archive", True)
@@ -1288,13 +1308,10 @@ async def handle_plugin_export(
         Markdown formatted export result
     """
     # Add plugin_manager to path
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
+    ensure_repo_on_path()
 
     try:
         from plugin_manager.workspace import PluginWorkspace
-        from plugin_manager.database import ProjectDatabase
         from plugin_manager.packager import PluginPackager
 
         # Get required args
@@ -1306,12 +1323,14 @@ async def handle_plugin_export(
         output_path = args.get("output_path")
 
         # Initialize workspace and packager
-        db_path = _get_plugin_manager_db_path()
-        if not db_path.exists():
-            return f"# Error: Plugin Manager Not Initialized\n\n**Error:** Database not found at `{db_path}`"
+        project_db = _get_project_db()
+        if project_db is None:
+            return (
+                "# Error: Plugin Manager Not Initialized\n\n"
+                f"**Error:** Database not found at `{_get_plugin_manager_db_path()}`"
+            )
 
-        project_db = ProjectDatabase(db_path)
-        workspace_root = repo_root / "plugin_manager" / "plugins"
+        workspace_root = REPO_ROOT / "plugin_manager" / "plugins"
         workspace = PluginWorkspace(workspace_root=workspace_root)
         packager = PluginPackager(workspace=workspace, db=project_db)
 
@@ -1342,7 +1361,6 @@ async def handle_plugin_export(
 
             meta_path = workspace_path / "meta.json"
             if meta_path.exists():
-                import json
                 with open(meta_path) as f:
                     meta = json.load(f)
                 version = meta.get("version", "0.0.0")
@@ -1351,7 +1369,7 @@ async def handle_plugin_export(
 
         # Determine output path
         if not output_path:
-            exports_dir = repo_root / "exports"
+            exports_dir = REPO_ROOT / "exports"
             exports_dir.mkdir(exist_ok=True)
             output_path = exports_dir / f"{codename}_v{version}.zip"
         else:
@@ -1464,9 +1482,7 @@ async def handle_plugin_import(
     from datetime import datetime
 
     # Add plugin_manager to path
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
+    ensure_repo_on_path()
 
     temp_dir = None  # Track temp directory for cleanup (defined before try for exception handling)
 
@@ -1479,7 +1495,7 @@ async def handle_plugin_import(
         source_path = Path(source_path_str)
         if not source_path.is_absolute():
             # Try relative to repo root
-            source_path = repo_root / source_path
+            source_path = REPO_ROOT / source_path
 
         if not source_path.exists():
             return f"# Error: Source Not Found\n\n**Error:** Source path does not exist: `{source_path_str}`"
@@ -1585,7 +1601,7 @@ async def handle_plugin_import(
         codename = re.sub(r"[^a-z0-9_]", "_", codename.lower())
 
         # Create workspace directory
-        workspace_path = repo_root / "plugin_manager" / "plugins" / category / codename
+        workspace_path = REPO_ROOT / "plugin_manager" / "plugins" / category / codename
 
         if workspace_path.exists():
             return (
@@ -1653,7 +1669,7 @@ async def handle_plugin_import(
 
         # Register in database so mybb_plugin_install can find it
         from plugin_manager.database import ProjectDatabase
-        project_db = ProjectDatabase(repo_root / ".plugin_manager" / "projects.db")
+        project_db = ProjectDatabase(REPO_ROOT / ".plugin_manager" / "projects.db")
         project_db.add_project(
             codename=codename,
             display_name=meta.get("name", codename),
@@ -1678,21 +1694,25 @@ async def handle_plugin_import(
         # Build template warning section
         template_warning = ""
         if template_detection and template_detection["has_embedded"]:
-            template_warning = "\n## ⚠️ Embedded Templates Detected\n\n"
-            template_warning += "**This plugin has templates embedded in PHP code that need manual conversion.**\n\n"
-            template_warning += "**Patterns Found:**\n"
-            for pattern in template_detection["patterns_found"]:
-                template_warning += f"- {pattern}\n"
-            if template_detection["template_names"]:
-                template_warning += f"\n**Templates to Extract ({len(template_detection['template_names'])}):**\n"
-                for tpl_name in template_detection["template_names"][:15]:
-                    template_warning += f"- `{tpl_name}`\n"
-                if len(template_detection["template_names"]) > 15:
-                    template_warning += f"- ... and {len(template_detection['template_names']) - 15} more\n"
-            template_warning += "\n**Recommendations:**\n"
-            for rec in template_detection["recommendations"]:
-                template_warning += f"- {rec}\n"
-            template_warning += "\n"
+            template_names = template_detection["template_names"]
+            warning_lines = [
+                "",
+                "## ⚠️ Embedded Templates Detected",
+                "",
+                "**This plugin has templates embedded in PHP code that need manual conversion.**",
+                "",
+                "**Patterns Found:**",
+            ]
+            warning_lines.extend(f"- {pattern}" for pattern in template_detection["patterns_found"])
+            if template_names:
+                warning_lines.extend(["", f"**Templates to Extract ({len(template_names)}):**"])
+                warning_lines.extend(f"- `{tpl_name}`" for tpl_name in template_names[:15])
+                if len(template_names) > 15:
+                    warning_lines.append(f"- ... and {len(template_names) - 15} more")
+            warning_lines.extend(["", "**Recommendations:**"])
+            warning_lines.extend(f"- {rec}" for rec in template_detection["recommendations"])
+            warning_lines.append("")
+            template_warning = "\n".join(warning_lines) + "\n"
 
         return (
             f"# Plugin Imported Successfully\n\n"
@@ -1,9 +1,47 @@
 """Search handlers for MyBB MCP tools."""
 
+import asyncio
 from datetime import datetime
 from typing import Any
 
 
+# Markdown table heads, shared across calls
+_POSTS_TABLE = "| PID | Thread | Author | Date | Preview |\n|-----|--------|--------|------|---------|"
+_THREADS_TABLE = (
+    "| TID | Subject | Author | Replies | Views | Last Post |\n"
+    "|-----|---------|--------|---------|-------|-----------|"
+)
+_THREADS_BRIEF_TABLE = "| TID | Subject | Author | Replies | Views |\n|-----|---------|--------|---------|-------|"
+_USERS_TABLE = (
+    "| UID | Username | Group | Posts | Threads | Registered |\n"
+    "|-----|----------|-------|-------|---------|------------|"
+)
+
+
+def _page_limit(args: dict) -> int:
+    """Clamp the requested page size the same way the search queries do."""
+    return min(max(1, args.get("limit", 25)), 100)
+
+
+def _split_page(rows: list, limit: int) -> tuple[list, bool]:
+    """Trim a peeked result set to ``limit`` and report whether more rows exist."""
+    return rows[:limit], len(rows) > limit
+
+
+def _found(count: int, has_more: bool) -> str:
+    return f"{count} found, more available" if has_more else f"{count} found"
+
+
+def _next_page(args: dict, limit: int, cursor: str, last_id: int) -> str:
+    """Next-page hint: a keyset cursor, or an offset when ranked by relevance.
+
+    Relevance order has no stable key to seek on, so those pages use offset.
+    """
+    if args.get("sort_by") == "relevance":
+        return f"offset={args.get('offset', 0) + limit}"
+    return f"{cursor}={last_id}"
+
+
 # ==================== Search Handlers ====================
 
 async def handle_search_posts(args: dict, db: Any, config: Any, sync_service: Any) -> str:
@@ -18,6 +56,8 @@ async def handle_search_posts(args: dict, db: Any, config: Any, sync_service: An
             - date_to: Optional end timestamp
             - limit: Max results (default 25)
             - offset: Pagination offset (default 0)
+            - after_pid: Keyset cursor; list posts after this PID (optional)
+            - sort_by: 'date' or 'relevance' (default 'date')
         db: MyBBDatabase instance
         config: Server configuration (unused)
         sync_service: Disk sync service (unused)
@@ -29,22 +69,27 @@ async def handle_search_posts(args: dict, db: Any, config: Any, sync_service: An
     if not query:
         return "Error: 'query' parameter is required."
 
-    results = db.search_posts(
+    limit = _page_limit(args)
+    results = await asyncio.to_thread(
+        db.search_posts,
         query=query,
         forums=args.get("forums"),
         author=args.get("author"),
         date_from=args.get("date_from"),
         date_to=args.get("date_to"),
-        limit=args.get("limit", 25),
-        offset=args.get("offset", 0)
+        limit=limit,
+        offset=args.get("offset", 0),
+        after_pid=args.get("after_pid"),
+        sort_by=args.get("sort_by", "date"),
+        peek=True
     )
+    results, has_more = _split_page(results, limit)
 
     if not results:
         return f"# Post Search Results\n\nNo posts found matching '{query}'."
 
-    lines = [f"# Post Search Results ({len(results)} found)\n"]
-    lines.append("| PID | Thread | Author | Date | Preview |")
-    lines.append("|-----|--------|--------|------|---------|")
+    lines = [f"# Post Search Results ({_found(len(results), has_more)})\n"]
+    lines.append(_POSTS_TABLE)
 
     for post in results:
         date_str = datetime.fromtimestamp(post['dateline']).strftime('%Y-%m-%d')
@@ -56,6 +101,8 @@ async def handle_search_posts(args: dict, db: Any, config: Any, sync_service: An
             f"| {post['pid']} | {post['thread_subject']} | {post['username']} | {date_str} | {preview} |"
         )
 
+    if has_more:
+        lines.append(f"\n*Next page: `{_next_page(args, limit, 'after_pid', results[-1]['pid'])}`*")
     return "\n".join(lines)
 
 
@@ -70,6 +117,8 @@ async def handle_search_threads(args: dict, db: Any, config: Any, sync_service:
             - prefix: Optional thread prefix ID
             - limit: Max results (default 25)
             - offset: Pagination offset (default 0)
+            - after_tid: Keyset cursor; list threads after this TID (optional)
+            - sort_by: 'date' or 'relevance' (default 'date')
         db: MyBBDatabase instance
         config: Server configuration (unused)
         sync_service: Disk sync service (unused)
@@ -81,21 +130,26 @@ async def handle_search_threads(args: dict, db: Any, config: Any, sync_service:
     if not query:
         return "Error: 'query' parameter is required."
 
-    results = db.search_threads(
+    limit = _page_limit(args)
+    results = await asyncio.to_thread(
+        db.search_threads,
         query=query,
         forums=args.get("forums"),
         author=args.get("author"),
         prefix=args.get("prefix"),
-        limit=args.get("limit", 25),
-        offset=args.get("offset", 0)
+        limit=limit,
+        offset=args.get("offset", 0),
+        after_tid=args.get("after_tid"),
+        sort_by=args.get("sort_by", "date"),
+        peek=True
     )
+    results, has_more = _split_page(results, limit)
 
     if not results:
         return f"# Thread Search Results\n\nNo threads found matching '{query}'."
 
-    lines = [f"# Thread Search Results ({len(results)} found)\n"]
-    lines.append("| TID | Subject | Author | Replies | Views | Last Post |")
-    lines.append("|-----|---------|--------|---------|-------|-----------|")
+    lines = [f"# Thread Search Results ({_found(len(results), has_more)})\n"]
+    lines.append(_THREADS_TABLE)
 
     for thread in results:
         last_post = datetime.fromtimestamp(thread['lastpost']).strftime('%Y-%m-%d %H:%M')
@@ -104,6 +158,8 @@ async def handle_search_threads(args: dict, db: Any, config: Any, sync_service:
             f"{thread['replies']} | {thread['views']} | {last_post} |"
         )
 
+    if has_more:
+        lines.append(f"\n*Next page: `{_next_page(args, limit, 'after_tid', results[-1]['tid'])}`*")
     return "\n".join(lines)
 
 
@@ -116,6 +172,7 @@ async def handle_search_users(args: dict, db: Any, config: Any, sync_service: An
             - field: Field to search ('username' or 'email', default 'username')
             - limit: Max results (default 25)
             - offset: Pagination offset (default 0)
+            - after_uid: Keyset cursor; list users after this UID (optional)
         db: MyBBDatabase instance
         config: Server configuration (unused)
         sync_service: Disk sync service (unused)
@@ -128,23 +185,27 @@ async def handle_search_users(args: dict, db: Any, config: Any, sync_service: An
         return "Error: 'query' parameter is required."
 
     field = args.get("field", "username")
+    limit = _page_limit(args)
 
     try:
-        results = db.search_users(
+        results = await asyncio.to_thread(
+            db.search_users,
             query=query,
             field=field,
-            limit=args.get("limit", 25),
-            offset=args.get("offset", 0)
+            limit=limit,
+            offset=args.get("offset", 0),
+            after_uid=args.get("after_uid"),
+            peek=True
         )
     except ValueError as e:
         return f"Error: {e}"
+    results, has_more = _split_page(results, limit)
 
     if not results:
         return f"# User Search Results\n\nNo users found matching '{query}' in {field}."
 
-    lines = [f"# User Search Results ({len(results)} found)\n"]
-    lines.append("| UID | Username | Group | Posts | Threads | Registered |")
-    lines.append("|-----|----------|-------|-------|---------|------------|")
+    lines = [f"# User Search Results ({_found(len(results), has_more)})\n"]
+    lines.append(_USERS_TABLE)
 
     for user in results:
         reg_date = datetime.fromtimestamp(user['regdate']).strftime('%Y-%m-%d')
@@ -153,6 +214,8 @@ async def handle_search_users(args: dict, db: Any, config: Any, sync_service: An
             f"{user['postnum']} | {user['threadnum']} | {reg_date} |"
         )
 
+    if has_more:
+        lines.append(f"\n*Next page: `after_uid={results[-1]['uid']}`*")
     return "\n".join(lines)
 
 
@@ -169,6 +232,8 @@ async def handle_search_advanced(args: dict, db: Any, config: Any, sync_service:
             - sort_by: 'date' or 'relevance' (default 'date')
             - limit: Max results per type (default 25)
             - offset: Pagination offset (default 0)
+            - after_pid: Keyset cursor for posts (optional)
+            - after_tid: Keyset cursor for threads (optional)
         db: MyBBDatabase instance
         config: Server configuration (unused)
         sync_service: Disk sync service (unused)
@@ -180,25 +245,29 @@ async def handle_search_advanced(args: dict, db: Any, config: Any, sync_service:
     if not query:
         return "Error: 'query' parameter is required."
 
-    results = db.search_advanced(
+    limit = _page_limit(args)
+    results = await asyncio.to_thread(
+        db.search_advanced,
         query=query,
         content_type=args.get("content_type", "both"),
         forums=args.get("forums"),
         date_from=args.get("date_from"),
         date_to=args.get("date_to"),
         sort_by=args.get("sort_by", "date"),
-        limit=args.get("limit", 25),
-        offset=args.get("offset", 0)
+        limit=limit,
+        offset=args.get("offset", 0),
+        after_pid=args.get("after_pid"),
+        after_tid=args.get("after_tid"),
+        peek=True
     )
 
     lines = [f"# Advanced Search Results for '{query}'\n"]
 
     if "posts" in results:
-        posts = results["posts"]
-        lines.append(f"\n## Posts ({len(posts)} found)\n")
+        posts, more_posts = _split_page(results["posts"], limit)
+        lines.append(f"\n## Posts ({_found(len(posts), more_posts)})\n")
         if posts:
-            lines.append("| PID | Thread | Author | Date | Preview |")
-            lines.append("|-----|--------|--------|------|---------|")
+            lines.append(_POSTS_TABLE)
             for post in posts:
                 date_str = datetime.fromtimestamp(post['dateline']).strftime('%Y-%m-%d')
                 preview = post['message'][:80].replace('\n', ' ').replace('|', '\\|')
@@ -207,18 +276,21 @@ async def handle_search_advanced(args: dict, db: Any, config: Any, sync_service:
                 lines.append(
                     f"| {post['pid']} | {post['thread_subject']} | {post['username']} | {date_str} | {preview} |"
                 )
+            if more_posts:
+                lines.append(f"\n*Next posts page: `{_next_page(args, limit, 'after_pid', posts[-1]['pid'])}`*")
 
     if "threads" in results:
-        threads = results["threads"]
-        lines.append(f"\n## Threads ({len(threads)} found)\n")
+        threads, more_threads = _split_page(results["threads"], limit)
+        lines.append(f"\n## Threads ({_found(len(threads), more_threads)})\n")
         if threads:
-            lines.append("| TID | Subject | Author | Replies | Views |")
-            lines.append("|-----|---------|--------|---------|-------|")
+            lines.append(_THREADS_BRIEF_TABLE)
             for thread in threads:
                 lines.append(
                     f"| {thread['tid']} | {thread['subject']} | {thread['username']} | "
                     f"{thread['replies']} | {thread['views']} |"
                 )
+            if more_threads:
+                lines.append(f"\n*Next threads page: `{_next_page(args, limit, 'after_tid', threads[-1]['tid'])}`*")
 
     if not results.get("posts") and not results.get("threads"):
         lines.append("\nNo results found.")
@@ -6,9 +6,30 @@ Handlers for disk sync operations:
 - Sync status queries
 """
 
+import json
+import re
+import sys
+from pathlib import Path
 from typing import Any
 from datetime import datetime
 
+# Template set ID inside a serialized themes.properties value
+_TEMPLATESET_PROPERTY = re.compile(r'"templateset";(?:i:(\d+)|s:\d+:"(\d+)")')
+
+# Directory holding plugin_manager's modules, imported top-level (``database``)
+_PLUGIN_MANAGER_DIR = Path(__file__).resolve().parents[2] / "plugin_manager"
+_plugin_manager_dir_on_path = False
+
+
+def _ensure_plugin_manager_dir_on_path() -> None:
+    """Put plugin_manager's directory on sys.path once per process."""
+    global _plugin_manager_dir_on_path
+    if _plugin_manager_dir_on_path:
+        return
+    if str(_PLUGIN_MANAGER_DIR) not in sys.path:
+        sys.path.insert(0, str(_PLUGIN_MANAGER_DIR))
+    _plugin_manager_dir_on_path = True
+
 
 # ==================== Sync Handlers ====================
 
@@ -156,17 +177,12 @@ async def handle_sync_status(
     # Query workspace projects from ProjectDatabase
     try:
         # Import PluginManager dependencies
-        import sys
-        from pathlib import Path
-        repo_root = Path(__file__).resolve().parent.parent.parent
-        plugin_manager_path = repo_root / "plugin_manager"
-        if str(plugin_manager_path) not in sys.path:
-            sys.path.insert(0, str(plugin_manager_path))
+        _ensure_plugin_manager_dir_on_path()
 
         from database import ProjectDatabase
 
         # Initialize database
-        workspace_root = Path(status.get('workspace_root', repo_root / 'plugin_manager'))
+        workspace_root = Path(status.get('workspace_root', _PLUGIN_MANAGER_DIR))
         db_path = workspace_root / '.meta' / 'projects.db'
 
         if db_path.exists():
@@ -329,7 +345,6 @@ def _format_dry_run_plugin(codename: str, workspace_path) -> str:
     Shows ALL files that would be synced from workspace to TestForum,
     following the same pattern as PluginInstaller and DiskSyncService.
     """
-    from pathlib import Path
     workspace_path = Path(workspace_path)
 
     # Files/directories that are workspace-only and should NOT be deployed
@@ -390,7 +405,6 @@ def _format_dry_run_plugin(codename: str, workspace_path) -> str:
 
 def _format_dry_run_theme(codename: str, workspace_path) -> str:
     """Format dry run preview for theme."""
-    from pathlib import Path
     workspace_path = Path(workspace_path)
 
     output = [f"# Dry Run: Theme {codename}\n"]
@@ -417,9 +431,6 @@ def _resolve_theme_ids(db, codename: str, workspace_path) -> tuple:
     Uses meta.json to get theme display name, then queries DB.
     Returns (theme_tid, template_set_sid) or (None, None) if not found.
     """
-    import json
-    import re
-    from pathlib import Path
     workspace_path = Path(workspace_path)
 
     meta_path = workspace_path / "meta.json"
@@ -441,7 +452,7 @@ def _resolve_theme_ids(db, codename: str, workspace_path) -> tuple:
             template_set_sid = 1  # default
             if properties_str and isinstance(properties_str, str):
                 # Parse PHP serialized format: s:11:"templateset";i:13; or s:11:"templateset";s:2:"13";
-                match = re.search(r'"templateset";(?:i:(\d+)|s:\d+:"(\d+)")', properties_str)
+                match = _TEMPLATESET_PROPERTY.search(properties_str)
                 if match:
                     template_set_sid = int(match.group(1) or match.group(2))
             return (theme_tid, template_set_sid)
@@ -1,9 +1,11 @@
 """Task management handlers for MyBB MCP tools."""
 
+import asyncio
 from typing import Any
 import datetime
 
-from ..bridge import MyBBBridgeClient
+from ..bridge import get_bridge
+from .common import invalidate_board_caches
 
 
 async def handle_task_list(args: dict, db: Any, config: Any, sync_service: Any) -> str:
@@ -19,7 +21,7 @@ async def handle_task_list(args: dict, db: Any, config: Any, sync_service: Any)
         Formatted list of tasks as markdown table
     """
     enabled_only = args.get("enabled_only", False)
-    tasks = db.list_tasks(enabled_only=enabled_only)
+    tasks = await asyncio.to_thread(db.list_tasks, enabled_only=enabled_only)
 
     if not tasks:
         return "No tasks found."
@@ -55,7 +57,7 @@ async def handle_task_get(args: dict, db: Any, config: Any, sync_service: Any) -
         Detailed task information as formatted markdown
     """
     tid = args.get("tid")
-    task = db.get_task(tid)
+    task = await asyncio.to_thread(db.get_task, tid)
 
     if not task:
         return f"Task {tid} not found."
@@ -99,7 +101,7 @@ async def handle_task_enable(args: dict, db: Any, config: Any, sync_service: Any
         return "Error: 'tid' parameter is required."
 
     # Use bridge for task enable
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -109,6 +111,7 @@ async def handle_task_enable(args: dict, db: Any, config: Any, sync_service: Any
         return "Error: Bridge does not support 'task:enable' yet."
 
     result = await bridge.call_async("task:enable", tid=tid)
+    invalidate_board_caches()
     if not result.success:
         return f"Error: Bridge task:enable failed: {result.error or 'unknown error'}"
 
@@ -132,7 +135,7 @@ async def handle_task_disable(args: dict, db: Any, config: Any, sync_service: An
         return "Error: 'tid' parameter is required."
 
     # Use bridge for task disable
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -142,6 +145,7 @@ async def handle_task_disable(args: dict, db: Any, config: Any, sync_service: An
         return "Error: Bridge does not support 'task:disable' yet."
 
     result = await bridge.call_async("task:disable", tid=tid)
+    invalidate_board_caches()
     if not result.success:
         return f"Error: Bridge task:disable failed: {result.error or 'unknown error'}"
 
@@ -167,7 +171,7 @@ async def handle_task_update_nextrun(args: dict, db: Any, config: Any, sync_serv
         return "Error: 'tid' and 'nextrun' parameters are required."
 
     # Use bridge for task nextrun update
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -177,6 +181,7 @@ async def handle_task_update_nextrun(args: dict, db: Any, config: Any, sync_serv
         return "Error: Bridge does not support 'task:update_nextrun' yet."
 
     result = await bridge.call_async("task:update_nextrun", tid=tid, nextrun=nextrun)
+    invalidate_board_caches()
     if not result.success:
         return f"Error: Bridge task:update_nextrun failed: {result.error or 'unknown error'}"
 
@@ -198,7 +203,7 @@ async def handle_task_run_log(args: dict, db: Any, config: Any, sync_service: An
     """
     tid = args.get("tid")
     limit = args.get("limit", 50)
-    logs = db.get_task_logs(tid=tid, limit=limit)
+    logs = await asyncio.to_thread(db.get_task_logs, tid=tid, limit=limit)
 
     if not logs:
         return "No task logs found."
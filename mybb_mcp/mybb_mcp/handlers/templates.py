@@ -1,9 +1,15 @@
 """Template handlers for MyBB MCP tools."""
 
+import asyncio
+import io
+import itertools
 import json
 from typing import Any
 
-from ..bridge import MyBBBridgeClient
+from ..bridge import get_bridge
+
+# Markdown table head for template listings, shared across calls
+_TEMPLATES_TABLE = "| TID | Title | SID | Version |\n|-----|-------|-----|---------|"
 
 # ==================== Template List Handlers ====================
 
@@ -19,7 +25,7 @@ async def handle_list_template_sets(args: dict, db: Any, config: Any, sync_servi
     Returns:
         Template sets as markdown table
     """
-    sets = db.list_template_sets()
+    sets = await asyncio.to_thread(db.list_template_sets)
     if not sets:
         return "No template sets found."
     lines = ["# MyBB Template Sets\n", "| SID | Title |", "|-----|-------|"]
@@ -41,15 +47,13 @@ async def handle_list_templates(args: dict, db: Any, config: Any, sync_service:
     Returns:
         Templates as markdown table
     """
-    templates = db.list_templates(sid=args.get("sid"), search=args.get("search"))
+    templates = await asyncio.to_thread(db.list_templates, sid=args.get("sid"), search=args.get("search"))
     if not templates:
         return "No templates found."
-    lines = [f"# Templates ({len(templates)} found)\n", "| TID | Title | SID | Version |", "|-----|-------|-----|---------|"]
-    for t in templates[:100]:
-        lines.append(f"| {t['tid']} | {t['title']} | {t['sid']} | {t['version']} |")
-    if len(templates) > 100:
-        lines.append(f"\n*...{len(templates) - 100} more*")
-    return "\n".join(lines)
+    header = (f"# Templates ({len(templates)} found)\n", _TEMPLATES_TABLE)
+    rows = (f"| {t['tid']} | {t['title']} | {t['sid']} | {t['version']} |" for t in templates[:100])
+    footer = (f"\n*...{len(templates) - 100} more*",) if len(templates) > 100 else ()
+    return "\n".join(itertools.chain(header, rows, footer))
 
 
 # ==================== Template Read/Write Handlers ====================
@@ -69,10 +73,11 @@ async def handle_read_template(args: dict, db: Any, config: Any, sync_service: A
     title = args.get("title")
     sid = args.get("sid")
 
-    # Get master template (-2)
-    master = db.get_template(title, -2)
-    # Get custom if sid specified
-    custom = db.get_template(title, sid) if sid and sid != -2 else None
+    # Master (-2) and, if sid is specified, the custom version in one query
+    sids = [-2, sid] if sid and sid != -2 else [-2]
+    rows = await asyncio.to_thread(db.get_templates_for_title, title, sids)
+    master = rows.get(-2)
+    custom = rows.get(sid) if sid and sid != -2 else None
 
     if not master and not custom:
         return f"Template '{title}' not found."
@@ -118,7 +123,7 @@ async def handle_write_template(args: dict, db: Any, config: Any, sync_service:
     if not title or not template:
         return "Error: 'title' and 'template' are required."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -150,6 +155,9 @@ async def handle_write_template(args: dict, db: Any, config: Any, sync_service:
 async def handle_template_find_replace(args: dict, db: Any, config: Any, sync_service: Any) -> str:
     """Find and replace in templates across sets.
 
+    Matching happens in the bridge via MyBB's find_replace_templatesets(), whose
+    preg_replace() reuses PHP's compiled-pattern cache across template sets.
+
     Args:
         args: Tool arguments containing 'title', 'find', 'replace', and optional parameters
         db: MyBBDatabase instance
@@ -169,7 +177,7 @@ async def handle_template_find_replace(args: dict, db: Any, config: Any, sync_se
     if not title or not find or replace is None:
         return "Error: 'title', 'find', and 'replace' are required."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -221,31 +229,32 @@ async def handle_template_batch_read(args: dict, db: Any, config: Any, sync_serv
     results = {}
     not_found = []
 
+    found = await asyncio.to_thread(db.get_templates_bulk, template_names, sid)
     for title in template_names:
-        template = db.get_template(title, sid)
+        template = found.get(title.lower())
         if template:
             results[title] = template['template']
         else:
             not_found.append(title)
 
-    lines = [f"# Batch Read Results (sid={sid})\n"]
+    # Template bodies can be large: write them straight into one buffer rather
+    # than holding a list of pieces plus the joined copy
+    buf = io.StringIO()
+    buf.write(f"# Batch Read Results (sid={sid})\n")
 
     if results:
-        lines.append(f"Successfully read {len(results)} template(s):\n")
+        buf.write(f"\nSuccessfully read {len(results)} template(s):\n")
         for title, content in results.items():
-            lines.extend([
-                f"## {title}",
-                "```html",
-                content,
-                "```\n"
-            ])
+            buf.write(f"\n## {title}\n```html\n")
+            buf.write(content)
+            buf.write("\n```\n")
 
     if not_found:
-        lines.append(f"\nNot found ({len(not_found)}):")
+        buf.write(f"\n\nNot found ({len(not_found)}):")
         for title in not_found:
-            lines.append(f"- {title}")
+            buf.write(f"\n- {title}")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 async def handle_template_batch_write(args: dict, db: Any, config: Any, sync_service: Any) -> str:
@@ -266,7 +275,7 @@ async def handle_template_batch_write(args: dict, db: Any, config: Any, sync_ser
     if not templates:
         return "Error: 'templates' list is required."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -314,26 +323,24 @@ async def handle_template_outdated(args: dict, db: Any, config: Any, sync_servic
     if sid == -2:
         return "Error: Cannot check master templates (sid=-2) for outdated versions."
 
-    outdated = db.find_outdated_templates(sid)
+    outdated = await asyncio.to_thread(db.find_outdated_templates, sid)
 
     if not outdated:
         return f"No outdated templates found in template set {sid}. All templates are up to date."
 
-    lines = [
+    header = (
         f"# Outdated Templates in Set {sid}\n",
         f"Found {len(outdated)} outdated template(s):\n",
         "| Template | Custom Version | Master Version | TID |",
         "|----------|----------------|----------------|-----|"
-    ]
-
-    for template in outdated:
-        lines.append(
-            f"| {template['title']} | {template['custom_version']} | "
-            f"{template['master_version']} | {template['tid']} |"
-        )
-
-    lines.append("\n*Note: Custom templates with version < master version are outdated and may need updating.*")
-    return "\n".join(lines)
+    )
+    rows = (
+        f"| {template['title']} | {template['custom_version']} | "
+        f"{template['master_version']} | {template['tid']} |"
+        for template in outdated
+    )
+    footer = ("\n*Note: Custom templates with version < master version are outdated and may need updating.*",)
+    return "\n".join(itertools.chain(header, rows, footer))
 
 
 # Handler registry for template tools
@@ -1,14 +1,91 @@
 """Theme and stylesheet handlers for MyBB MCP tools."""
 
-import sys
+import asyncio
+import functools
+import logging
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
-from ..bridge import MyBBBridgeClient
+from ..bridge import get_bridge
+from .common import get_plugin_manager, invalidate_board_caches
+
+logger = logging.getLogger(__name__)
+
+# Short-lived LRU of theme rows and stylesheet metadata for the stylesheet
+# tools, keyed by tid/sid. Only metadata is kept for stylesheets: the CSS body
+# is rewritten by disk sync behind our back, so it is always read fresh.
+_ROW_CACHE_TTL = 30.0
+_ROW_CACHE_SIZE = 512
+_theme_cache: OrderedDict[Any, tuple[float, dict]] = OrderedDict()
+_stylesheet_cache: OrderedDict[Any, tuple[float, dict]] = OrderedDict()
+_STYLESHEET_META = ('sid', 'tid', 'name', 'attachedto')
+
+
+async def _cached_row(cache: OrderedDict, fetch: Any, key: Any) -> dict | None:
+    """Fetch a row via fetch(key) off the event loop, reusing recent lookups."""
+    cached = cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _ROW_CACHE_TTL:
+        cache.move_to_end(key)
+        return cached[1]
+
+    row = await asyncio.to_thread(fetch, key)
+    if row is None:
+        cache.pop(key, None)
+        return None
+
+    cache[key] = (time.monotonic(), row)
+    cache.move_to_end(key)
+    while len(cache) > _ROW_CACHE_SIZE:
+        cache.popitem(last=False)
+    return row
+
+
+async def _cached_get_theme(db: Any, tid: Any) -> dict | None:
+    """Return the theme row for tid, cached briefly."""
+    return await _cached_row(_theme_cache, db.get_theme, tid)
+
+
+def _stylesheet_meta(db: Any, sid: Any) -> dict | None:
+    row = db.get_stylesheet(sid)
+    return {k: row[k] for k in _STYLESHEET_META} if row else None
+
+
+async def _cached_get_stylesheet(db: Any, sid: Any) -> dict | None:
+    """Return the stylesheet metadata (no CSS body) for sid, cached briefly."""
+    return await _cached_row(_stylesheet_cache, functools.partial(_stylesheet_meta, db), sid)
+
+
+@functools.lru_cache(maxsize=1024)
+def _theme_codename(name: str) -> str:
+    """Convert a MyBB theme name to its workspace codename.
+
+    Hyphens are kept, unlike plugin codenames, so existing theme projects
+    keep matching their installed themes.
+    """
+    return name.lower().replace(' ', '_')
+
+
+def _managed_theme(manager: Any, codename: str) -> dict | None:
+    """Look up a workspace theme by codename.
+
+    Uses the unique ``codename`` column instead of listing every project
+    and scanning it for a match.
+    """
+    project = manager.db.get_project(codename)
+    if project and project.get('type') == 'theme':
+        return project
+    return None
 
 
 # ==================== Theme List Handlers ====================
 
+async def _list_workspace_themes(manager: Any) -> list[dict]:
+    """List workspace theme projects (runs on the loop: the SQLite handle is thread-bound)."""
+    return manager.db.list_projects(type="theme")
+
+
 async def handle_list_themes(args: dict, db: Any, config: Any, sync_service: Any) -> str:
     """List all MyBB themes (workspace and installed).
 
@@ -22,18 +99,15 @@ async def handle_list_themes(args: dict, db: Any, config: Any, sync_service: Any
         Themes as markdown list with workspace and MyBB sections
     """
     # Import plugin_manager
-    pm_path = Path(__file__).parent.parent.parent.parent / "plugin_manager"
-    if str(pm_path.parent) not in sys.path:
-        sys.path.insert(0, str(pm_path.parent))
-    from plugin_manager.manager import PluginManager
-
-    manager = PluginManager()
-
-    # Get workspace themes
-    workspace_themes = manager.db.list_projects(type="theme")
-
-    # Get MyBB themes (existing behavior)
-    mybb_themes = db.list_themes()
+    manager = get_plugin_manager()
+
+    # The MySQL and workspace (SQLite) themes live in separate databases, so
+    # they cannot be joined; start the MySQL query in its worker thread
+    # first and read the workspace themes on the loop while it runs
+    mybb_themes, workspace_themes = await asyncio.gather(
+        asyncio.to_thread(db.list_themes),
+        _list_workspace_themes(manager),
+    )
 
     lines = ["# Themes\n"]
 
@@ -46,9 +120,9 @@ async def handle_list_themes(args: dict, db: Any, config: Any, sync_service: Any
 
     lines.append("## MyBB Installed Themes")
     if mybb_themes:
+        workspace_set = {wt['codename'] for wt in workspace_themes}
         for t in mybb_themes:
-            in_workspace = any(wt['codename'] == t['name'].lower().replace(' ', '_')
-                              for wt in workspace_themes)
+            in_workspace = _theme_codename(t['name']) in workspace_set
             marker = " (managed)" if in_workspace else ""
             lines.append(f"- **{t['name']}** (tid: {t['tid']}){marker}")
     else:
@@ -71,7 +145,7 @@ async def handle_list_stylesheets(args: dict, db: Any, config: Any, sync_service
     Returns:
         Stylesheets as markdown table
     """
-    sheets = db.list_stylesheets(tid=args.get("tid"))
+    sheets = await asyncio.to_thread(db.list_stylesheets, tid=args.get("tid"))
     if not sheets:
         return "No stylesheets found."
     lines = [
@@ -102,35 +176,35 @@ async def handle_read_stylesheet(args: dict, db: Any, config: Any, sync_service:
         Stylesheet content as markdown with CSS code block
     """
     sid = args.get("sid")
-    sheet = db.get_stylesheet(sid)
+    sheet = await _cached_get_stylesheet(db, sid)
     if not sheet:
         return f"Stylesheet {sid} not found."
 
     # HYBRID MODE: Check if this stylesheet belongs to a workspace-managed theme
-    pm_path = Path(__file__).parent.parent.parent.parent / "plugin_manager"
-    if str(pm_path.parent) not in sys.path:
-        sys.path.insert(0, str(pm_path.parent))
-    from plugin_manager.manager import PluginManager
-
-    manager = PluginManager()
+    manager = get_plugin_manager()
 
     # Get theme name from tid
-    theme = db.get_theme(sheet['tid'])
+    theme = await _cached_get_theme(db, sheet['tid'])
     if theme:
         # Convert theme name to codename format for matching
-        theme_codename = theme['name'].lower().replace(' ', '_')
+        theme_codename = _theme_codename(theme['name'])
 
         # Check if this theme is workspace-managed
-        workspace_themes = manager.db.list_projects(type="theme")
-        managed_theme = next((t for t in workspace_themes if t['codename'] == theme_codename), None)
+        managed_theme = _managed_theme(manager, theme_codename)
 
         if managed_theme:
             # Read from workspace file
             workspace_path = Path(managed_theme['workspace_path'])
             stylesheet_file = workspace_path / "stylesheets" / sheet['name']
 
-            if stylesheet_file.exists():
-                css_content = stylesheet_file.read_text(encoding='utf-8')
+            # Decode the raw bytes once, like the DB path returns the stored CSS
+            try:
+                css_bytes = await asyncio.to_thread(stylesheet_file.read_bytes)
+                css_content = css_bytes.decode('utf-8', 'replace')
+            except FileNotFoundError:
+                css_content = None
+
+            if css_content is not None:
                 return (
                     f"# Stylesheet: {sheet['name']} (WORKSPACE)\n"
                     f"- Theme: {theme['name']} (managed)\n"
@@ -139,7 +213,10 @@ async def handle_read_stylesheet(args: dict, db: Any, config: Any, sync_service:
                     f"```css\n{css_content}\n```"
                 )
 
-    # Fall back to DB read for unmanaged themes
+    # Fall back to DB read for unmanaged themes; the body is never cached
+    sheet = await asyncio.to_thread(db.get_stylesheet, sid)
+    if not sheet:
+        return f"Stylesheet {sid} not found."
     return (
         f"# Stylesheet: {sheet['name']}\n"
         f"- SID: {sid}, Theme TID: {sheet['tid']}\n"
@@ -168,29 +245,23 @@ async def handle_write_stylesheet(args: dict, db: Any, config: Any, sync_service
     css = args.get("stylesheet")
 
     # HYBRID MODE: Check if this stylesheet belongs to a workspace-managed theme
-    pm_path = Path(__file__).parent.parent.parent.parent / "plugin_manager"
-    if str(pm_path.parent) not in sys.path:
-        sys.path.insert(0, str(pm_path.parent))
-    from plugin_manager.manager import PluginManager
-
-    manager = PluginManager()
+    manager = get_plugin_manager()
 
     # Get stylesheet info
-    sheet = db.get_stylesheet(sid)
+    sheet = await _cached_get_stylesheet(db, sid)
     if not sheet:
         return f"Stylesheet {sid} not found."
 
     # Get theme name from tid
-    theme = db.get_theme(sheet['tid'])
+    theme = await _cached_get_theme(db, sheet['tid'])
     result = ""
 
     if theme:
         # Convert theme name to codename format for matching
-        theme_codename = theme['name'].lower().replace(' ', '_')
+        theme_codename = _theme_codename(theme['name'])
 
         # Check if this theme is workspace-managed
-        workspace_themes = manager.db.list_projects(type="theme")
-        managed_theme = next((t for t in workspace_themes if t['codename'] == theme_codename), None)
+        managed_theme = _managed_theme(manager, theme_codename)
 
         if managed_theme:
             # Write to workspace file
@@ -206,7 +277,7 @@ async def handle_write_stylesheet(args: dict, db: Any, config: Any, sync_service
     else:
         result = f"Stylesheet {sid} prepared for bridge update."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     info = await bridge.call_async("info")
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
@@ -219,6 +290,7 @@ async def handle_write_stylesheet(args: dict, db: Any, config: Any, sync_service
         sid=sid,
         stylesheet=css,
     )
+    _stylesheet_cache.pop(sid, None)
 
     if not bridge_result.success:
         return f"Error: Bridge stylesheet:write failed: {bridge_result.error or 'unknown error'}"
@@ -248,18 +320,13 @@ async def handle_create_theme(args: dict, db: Any, config: Any, sync_service: An
         Success message with created files or error message
     """
     # Import plugin_manager
-    pm_path = Path(__file__).parent.parent.parent.parent / "plugin_manager"
-    if str(pm_path.parent) not in sys.path:
-        sys.path.insert(0, str(pm_path.parent))
-    from plugin_manager.manager import PluginManager
-
-    manager = PluginManager()
+    manager = get_plugin_manager()
 
     # Convert stylesheets to proper format
     stylesheets_input = args.get("stylesheets", ["global.css"])
 
     result = manager.create_theme(
-        codename=args.get("codename", "").lower().replace(" ", "_"),
+        codename=_theme_codename(args.get("codename", "")),
         display_name=args.get("name", ""),
         description=args.get("description", ""),
         author=args.get("author", "Developer"),
@@ -270,18 +337,24 @@ async def handle_create_theme(args: dict, db: Any, config: Any, sync_service: An
     )
 
     if result.get("success"):
-        return (
-            f"# Theme Created: {args.get('name')}\n\n"
-            f"**Codename:** `{result['codename']}`\n"
-            f"**Workspace:** `{result['workspace_path']}`\n"
-            f"**Project ID:** {result['project_id']}\n\n"
-            f"## Files Created\n" +
-            "\n".join(f"- `{f}`" for f in result.get('files_created', [])) +
-            f"\n\n**Next Steps:**\n"
-            f"1. Edit stylesheets in `{result['workspace_path']}/stylesheets/`\n"
-            f"2. Install to TestForum: Use `mybb_theme_activate` or Admin CP\n"
-            f"3. Export for distribution: Use export workflow"
-        )
+        lines = [
+            f"# Theme Created: {args.get('name')}",
+            "",
+            f"**Codename:** `{result['codename']}`",
+            f"**Workspace:** `{result['workspace_path']}`",
+            f"**Project ID:** {result['project_id']}",
+            "",
+            "## Files Created",
+        ]
+        lines.extend(f"- `{f}`" for f in result.get('files_created', []))
+        lines.extend([
+            "",
+            "**Next Steps:**",
+            f"1. Edit stylesheets in `{result['workspace_path']}/stylesheets/`",
+            "2. Install to TestForum: Use `mybb_theme_activate` or Admin CP",
+            "3. Export for distribution: Use export workflow",
+        ])
+        return "\n".join(lines)
     else:
         return f"# Error Creating Theme\n\n{result.get('error', 'Unknown error')}"
 
@@ -302,14 +375,8 @@ async def handle_delete_theme(
     Returns:
         Markdown formatted deletion result
     """
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-
     try:
-        from plugin_manager.manager import PluginManager
-
-        manager = PluginManager()
+        manager = get_plugin_manager()
 
         codename = args.get("codename", "")
         archive = args.get("archive", True)
@@ -351,9 +418,7 @@ async def handle_delete_theme(
     except ImportError as e:
         return f"Error: plugin_manager not available: {e}"
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.exception(f"Error deleting theme {args.get('codename')}")
+        logger.exception("Error deleting theme %s", args.get('codename'))
         return f"Error deleting theme: {e}"
 
 
@@ -373,14 +438,8 @@ async def handle_theme_install(
     Returns:
         Markdown formatted installation result
     """
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-
     try:
-        from plugin_manager.manager import PluginManager
-
-        manager = PluginManager()
+        manager = get_plugin_manager()
 
         codename = args.get("codename", "")
         visibility = args.get("visibility")
@@ -427,9 +486,7 @@ async def handle_theme_install(
     except ImportError as e:
         return f"Error: plugin_manager not available: {e}"
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.exception(f"Error installing theme {args.get('codename')}")
+        logger.exception("Error installing theme %s", args.get('codename'))
         return f"Error installing theme: {e}"
 
 
@@ -450,14 +507,8 @@ async def handle_theme_uninstall(
     Returns:
         Markdown formatted uninstallation result
     """
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-
     try:
-        from plugin_manager.manager import PluginManager
-
-        manager = PluginManager()
+        manager = get_plugin_manager()
 
         codename = args.get("codename", "")
         remove_from_db = args.get("remove_from_db", False)
@@ -472,7 +523,7 @@ async def handle_theme_uninstall(
         if remove_from_db and result.get("success"):
             try:
                 # Get theme by name (case-insensitive)
-                theme = db.get_theme_by_name(codename)
+                theme = await asyncio.to_thread(db.get_theme_by_name, codename)
                 if theme:
                     tid = theme["tid"]
 
@@ -568,9 +619,7 @@ async def handle_theme_uninstall(
     except ImportError as e:
         return f"Error: plugin_manager not available: {e}"
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.exception(f"Error uninstalling theme {args.get('codename')}")
+        logger.exception("Error uninstalling theme %s", args.get('codename'))
         return f"Error uninstalling theme: {e}"
 
 
@@ -598,14 +647,8 @@ async def handle_theme_status(
         return "# Error\n\n**Error:** codename is required"
 
     # Setup path for plugin_manager imports
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-
     try:
-        from plugin_manager.manager import PluginManager
-
-        manager = PluginManager()
+        manager = get_plugin_manager()
 
         lines = [f"# Theme Status: {codename}\n"]
 
@@ -698,9 +741,7 @@ async def handle_theme_status(
     except ImportError as e:
         return f"# Error\n\n**Error:** plugin_manager not available: {e}"
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.exception(f"Error getting theme status for {codename}")
+        logger.exception("Error getting theme status for %s", codename)
         return f"# Error\n\n**Error:** {e}"
 
 
@@ -725,12 +766,7 @@ async def handle_export_theme_xml(args: dict, db: Any, config: Any, sync_service
 
     try:
         # Import plugin_manager
-        pm_path = Path(__file__).parent.parent.parent.parent / "plugin_manager"
-        if str(pm_path.parent) not in sys.path:
-            sys.path.insert(0, str(pm_path.parent))
-        from plugin_manager.manager import PluginManager
-
-        manager = PluginManager()
+        manager = get_plugin_manager()
         result = manager.export_theme_xml(codename, output_path, visibility)
 
         lines = ["# Theme XML Export\n"]
@@ -764,9 +800,7 @@ async def handle_export_theme_xml(args: dict, db: Any, config: Any, sync_service
     except ImportError as e:
         return f"# Error\n\n**Error:** plugin_manager not available: {e}"
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.exception(f"Error exporting theme XML for {codename}")
+        logger.exception("Error exporting theme XML for %s", codename)
         return f"# Error\n\n**Error:** {e}"
 
 
@@ -791,12 +825,7 @@ async def handle_import_theme_xml(args: dict, db: Any, config: Any, sync_service
 
     try:
         # Import plugin_manager
-        pm_path = Path(__file__).parent.parent.parent.parent / "plugin_manager"
-        if str(pm_path.parent) not in sys.path:
-            sys.path.insert(0, str(pm_path.parent))
-        from plugin_manager.manager import PluginManager
-
-        manager = PluginManager()
+        manager = get_plugin_manager()
         result = manager.import_theme_xml(xml_path, codename, visibility)
 
         lines = ["# Theme XML Import\n"]
@@ -833,9 +862,7 @@ async def handle_import_theme_xml(args: dict, db: Any, config: Any, sync_service
     except ImportError as e:
         return f"# Error\n\n**Error:** plugin_manager not available: {e}"
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.exception(f"Error importing theme XML from {xml_path}")
+        logger.exception("Error importing theme XML from %s", xml_path)
         return f"# Error\n\n**Error:** {e}"
 
 
@@ -879,7 +906,7 @@ async def handle_theme_import_to_mybb(args: dict, db: Any, config: Any, sync_ser
 
     try:
         # Check bridge support
-        bridge = MyBBBridgeClient(config.mybb_root)
+        bridge = get_bridge(config.mybb_root)
         info = await bridge.call_async("info")
         if not info.success:
             return f"# Error\n\n**Error:** Bridge info failed: {info.error or 'unknown error'}"
@@ -920,9 +947,7 @@ async def handle_theme_import_to_mybb(args: dict, db: Any, config: Any, sync_ser
         return "\n".join(lines)
 
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.exception(f"Error importing theme to MyBB from {xml_path}")
+        logger.exception("Error importing theme to MyBB from %s", xml_path)
         return f"# Error\n\n**Error:** {e}"
 
 
@@ -938,7 +963,7 @@ async def handle_templateset_create(args: dict, db: Any, config: Any, sync_servi
     if not title:
         return "Error: 'title' parameter is required"
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     result = await bridge.call_async("templateset:create", title=title)
 
     if not result.success:
@@ -961,7 +986,7 @@ async def handle_templateset_copy_master(args: dict, db: Any, config: Any, sync_
 
     source_sid = args.get("source_sid", -2)
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     result = await bridge.call_async("templateset:copy_master", sid=sid, source_sid=source_sid)
 
     if not result.success:
@@ -984,7 +1009,7 @@ async def handle_theme_create_db(args: dict, db: Any, config: Any, sync_service:
     if not name:
         return "Error: 'name' parameter is required"
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     result = await bridge.call_async(
         "theme:create",
         name=name,
@@ -1013,7 +1038,7 @@ async def handle_theme_get(args: dict, db: Any, config: Any, sync_service: Any)
     if not tid and not name:
         return "Error: Either 'tid' or 'name' parameter is required"
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     result = await bridge.call_async("theme:get", tid=tid, name=name)
 
     if not result.success:
@@ -1047,7 +1072,7 @@ async def handle_stylesheet_create(args: dict, db: Any, config: Any, sync_servic
     if not all([tid, name, content]):
         return "Error: 'tid', 'name', and 'content' parameters are required"
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     result = await bridge.call_async(
         "stylesheet:create",
         tid=tid,
@@ -1075,8 +1100,9 @@ async def handle_theme_set_default(args: dict, db: Any, config: Any, sync_servic
     if not tid:
         return "Error: 'tid' parameter is required"
 
-    bridge = MyBBBridgeClient(config.mybb_root)
+    bridge = get_bridge(config.mybb_root)
     result = await bridge.call_async("theme:set_default", tid=tid)
+    invalidate_board_caches()
 
     if not result.success:
         return f"Error: {result.error or 'Unknown error'}"
@@ -1,8 +1,99 @@
 """User management handlers for MyBB MCP tools."""
 
-from typing import Any
+import asyncio
+import itertools
+import time
+from collections import OrderedDict
+from typing import Any, Iterator, TypedDict
 
-from ..bridge import MyBBBridgeClient
+from ..bridge import get_bridge
+from .common import board_cache_reset, format_table_cell, invalidate_board_caches
+
+
+class BanArgs(TypedDict, total=False):
+    """Arguments for a single ban (mybb_user_ban and each mybb_user_ban_bulk item)."""
+    uid: int
+    gid: int
+    admin: int
+    dateline: int
+    bantime: str
+    reason: str
+
+
+_BAN_REQUIRED = ("uid", "gid", "admin", "dateline")
+
+
+def _missing(args: dict, *keys: str) -> list[str]:
+    """Return the required keys that are absent or empty in args."""
+    return [key for key in keys if not args.get(key)]
+
+
+def _ban_params(ban: BanArgs) -> dict:
+    """Build user:ban bridge parameters from validated ban arguments."""
+    uid, gid, admin, dateline = (ban[key] for key in _BAN_REQUIRED)
+    return {
+        "uid": uid,
+        "gid": gid,
+        "admin": admin,
+        "dateline": dateline,
+        "bantime": ban.get("bantime", "---"),
+        "reason": ban.get("reason", ""),
+    }
+
+
+# Short-lived LRU of sanitized user rows for mybb_user_get, keyed by
+# ("uid", uid) or ("name", lowercased username). Entries for a user are
+# dropped whenever a bridge mutation touches that user.
+_USER_CACHE_TTL = 30.0
+_USER_CACHE_SIZE = 1024
+_user_cache: OrderedDict[tuple[str, Any], tuple[float, dict]] = OrderedDict()
+
+
+def _get_user_cached(db: Any, uid: Any = None, username: str | None = None) -> dict | None:
+    """Fetch a sanitized user via db.get_user, reusing recent lookups."""
+    key = ("uid", int(uid)) if uid else ("name", username.lower())
+    now = time.monotonic()
+
+    cached = _user_cache.get(key)
+    if cached is not None and now - cached[0] < _USER_CACHE_TTL:
+        _user_cache.move_to_end(key)
+        return cached[1]
+
+    user = db.get_user(uid=uid, username=username, sanitize=True)
+    if user is None:
+        _user_cache.pop(key, None)
+        return None
+
+    _user_cache[key] = (now, user)
+    _user_cache.move_to_end(key)
+    while len(_user_cache) > _USER_CACHE_SIZE:
+        _user_cache.popitem(last=False)
+    return user
+
+
+def _invalidate_user(uid: Any) -> None:
+    """Drop every cached entry (by UID or username) for the given user."""
+    uid = int(uid)
+    stale = [key for key, (_, user) in _user_cache.items() if user.get("uid") == uid]
+    for key in stale:
+        del _user_cache[key]
+
+
+# Markdown table head for mybb_user_list, shared across calls
+_USERS_TABLE = "| UID | Username | Usergroup | Posts | Threads |\n|-----|----------|-----------|-------|---------|"
+
+
+# Usergroups rarely change, so mybb_usergroup_list reuses the last listing
+# for a few minutes. Rebuilding or clearing MyBB's usergroups cache through
+# the admin tools, or any other datacache write, drops it early.
+_USERGROUP_CACHE_TTL = 300.0
+_usergroup_cache: dict[str, Any] = {"ts": 0.0, "data": None}
+
+
+@board_cache_reset
+def invalidate_usergroups() -> None:
+    """Drop the cached usergroup listing."""
+    _usergroup_cache["data"] = None
 
 
 # ==================== User Handlers ====================
@@ -27,7 +118,7 @@ async def handle_user_get(args: dict, db: Any, config: Any, sync_service: Any) -
     if not uid and not username:
         return "Error: Either 'uid' or 'username' is required."
 
-    user = db.get_user(uid=uid, username=username, sanitize=True)
+    user = _get_user_cached(db, uid=uid, username=username)
 
     if not user:
         identifier = f"UID {uid}" if uid else f"username '{username}'"
@@ -60,6 +151,7 @@ async def handle_user_list(args: dict, db: Any, config: Any, sync_service: Any)
             - usergroup: Optional filter by usergroup ID
             - limit: Maximum users to return (default 50)
             - offset: Number of users to skip (default 0)
+            - after_uid: Keyset cursor; list users after this UID (optional)
         db: MyBBDatabase instance
         config: Server configuration (unused)
         sync_service: Disk sync service (unused)
@@ -70,24 +162,23 @@ async def handle_user_list(args: dict, db: Any, config: Any, sync_service: Any)
     usergroup = args.get("usergroup")
     limit = args.get("limit", 50)
     offset = args.get("offset", 0)
+    after_uid = args.get("after_uid")
 
-    users = db.list_users(usergroup=usergroup, limit=limit, offset=offset)
+    users = await asyncio.to_thread(db.list_users, usergroup=usergroup, limit=limit, offset=offset, after_uid=after_uid)
 
     if not users:
         return "No users found."
 
-    lines = [
-        f"# Users ({len(users)} found)\n",
-        "| UID | Username | Usergroup | Posts | Threads |",
-        "|-----|----------|-----------|-------|---------|"
-    ]
+    header = (f"# Users ({len(users)} found)\n", _USERS_TABLE)
+    footer = (f"\n*Next page: `after_uid={users[-1]['uid']}`*",)
 
-    for user in users:
-        lines.append(
-            f"| {user['uid']} | {user['username']} | {user['usergroup']} | {user.get('postnum', 0)} | {user.get('threadnum', 0)} |"
-        )
+    return "\n".join(itertools.chain(header, _iter_user_rows(users), footer))
 
-    return "\n".join(lines)
+
+def _iter_user_rows(users: list[dict]) -> Iterator[str]:
+    """Yield one markdown table row per user."""
+    for u in users:
+        yield f"| {u['uid']} | {format_table_cell(u['username'])} | {u['usergroup']} | {u.get('postnum', 0)} | {u.get('threadnum', 0)} |"
 
 
 async def handle_user_update_group(args: dict, db: Any, config: Any, sync_service: Any) -> str:
@@ -105,15 +196,14 @@ async def handle_user_update_group(args: dict, db: Any, config: Any, sync_servic
     Returns:
         Success or error message as markdown
     """
-    uid = args.get("uid")
-    usergroup = args.get("usergroup")
-    additionalgroups = args.get("additionalgroups")
-
-    if not uid or not usergroup:
+    if _missing(args, "uid", "usergroup"):
         return "Error: 'uid' and 'usergroup' are required."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
-    info = await bridge.call_async("info")
+    uid, usergroup = args["uid"], args["usergroup"]
+    additionalgroups = args.get("additionalgroups")
+
+    bridge = get_bridge(config.mybb_root)
+    info = await bridge.info_async()
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
     supported = info.data.get("supported_actions", [])
@@ -128,8 +218,10 @@ async def handle_user_update_group(args: dict, db: Any, config: Any, sync_servic
     )
 
     if not result.success:
+        bridge.invalidate_info()
         return f"Error: Bridge user:update_group failed: {result.error or 'unknown error'}"
 
+    _invalidate_user(uid)
     return f"# User Group Updated (Bridge)\n\nUser {uid} has been assigned to usergroup {usergroup}."
 
 
@@ -151,71 +243,118 @@ async def handle_user_ban(args: dict, db: Any, config: Any, sync_service: Any) -
     Returns:
         Success or error message as markdown
     """
-    uid = args.get("uid")
-    gid = args.get("gid")
-    admin = args.get("admin")
-    dateline = args.get("dateline")
-    bantime = args.get("bantime", "---")
-    reason = args.get("reason", "")
-
-    if not uid or not gid or not admin or not dateline:
+    if _missing(args, *_BAN_REQUIRED):
         return "Error: 'uid', 'gid', 'admin', and 'dateline' are required."
 
-    bridge = MyBBBridgeClient(config.mybb_root)
-    info = await bridge.call_async("info")
+    params = _ban_params(args)
+    uid = params["uid"]
+
+    bridge = get_bridge(config.mybb_root)
+    info = await bridge.info_async()
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
     supported = info.data.get("supported_actions", [])
     if "user:ban" not in supported:
         return "Error: Bridge does not support 'user:ban' yet."
 
-    result = await bridge.call_async(
-        "user:ban",
-        uid=uid,
-        gid=gid,
-        admin=admin,
-        dateline=dateline,
-        bantime=bantime,
-        reason=reason,
-    )
+    result = await bridge.call_async("user:ban", **params)
 
     if not result.success:
+        bridge.invalidate_info()
         return f"Error: Bridge user:ban failed: {result.error or 'unknown error'}"
 
+    _invalidate_user(uid)
     return f"# User Banned (Bridge)\n\nUser {uid} has been banned."
 
 
-async def handle_user_unban(args: dict, db: Any, config: Any, sync_service: Any) -> str:
-    """Remove user from banned list.
+async def handle_user_ban_bulk(args: dict, db: Any, config: Any, sync_service: Any) -> str:
+    """Ban several users after a single bridge capability check.
 
     Args:
         args: Tool arguments containing:
-            - uid: User ID to unban (required)
+            - bans: List of ban objects, each with uid, gid, admin, dateline
+              (required) and bantime, reason (optional)
         db: MyBBDatabase instance
         config: Server configuration (unused)
         sync_service: Disk sync service (unused)
 
     Returns:
-        Success or error message as markdown
+        Per-user ban results as markdown table or error message
     """
-    uid = args.get("uid")
+    bans = args.get("bans") or []
 
-    if not uid:
-        return "Error: 'uid' is required."
+    if not bans:
+        return "Error: 'bans' must contain at least one ban."
+
+    for i, ban in enumerate(bans):
+        if _missing(ban, *_BAN_REQUIRED):
+            return f"Error: bans[{i}] requires 'uid', 'gid', 'admin', and 'dateline'."
+    actions = [("user:ban", _ban_params(ban)) for ban in bans]
 
-    bridge = MyBBBridgeClient(config.mybb_root)
-    info = await bridge.call_async("info")
+    bridge = get_bridge(config.mybb_root)
+    info = await bridge.info_async()
     if not info.success:
         return f"Error: Bridge info failed: {info.error or 'unknown error'}"
     supported = info.data.get("supported_actions", [])
-    if "user:unban" not in supported:
-        return "Error: Bridge does not support 'user:unban' yet."
+    if "user:ban" not in supported:
+        return "Error: Bridge does not support 'user:ban' yet."
 
-    result = await bridge.call_async("user:unban", uid=uid)
-    if not result.success:
-        return f"Error: Bridge user:unban failed: {result.error or 'unknown error'}"
+    results = await bridge.call_batch_async(actions)
+    if not all(result.success for result in results):
+        bridge.invalidate_info()
+    for (_, params), result in zip(actions, results):
+        if result.success:
+            _invalidate_user(params["uid"])
+
+    banned = sum(1 for result in results if result.success)
+    lines = [
+        "# Users Banned (Bridge)\n",
+        f"{banned} of {len(results)} users banned.\n",
+        "| UID | Result |",
+        "|-----|--------|",
+        *[
+            f"| {params['uid']} | {'Banned' if result.success else 'Error: ' + format_table_cell(result.error or 'unknown error')} |"
+            for (_, params), result in zip(actions, results)
+        ],
+    ]
 
-    return f"# User Unbanned (Bridge)\n\nUser {uid} has been unbanned successfully."
+    return "\n".join(lines)
+
+
+async def handle_user_unban(args: dict, db: Any, config: Any, sync_service: Any) -> str:
+    """Remove user from banned list.
+
+    Args:
+        args: Tool arguments containing:
+            - uid: User ID to unban (required)
+        db: MyBBDatabase instance
+        config: Server configuration (unused)
+        sync_service: Disk sync service (unused)
+
+    Returns:
+        Success or error message as markdown
+    """
+    if _missing(args, "uid"):
+        return "Error: 'uid' is required."
+
+    uid = args["uid"]
+    bridge = get_bridge(config.mybb_root)
+    # Unbanning is idempotent and unknown actions are rejected by the bridge,
+    # so the capability check runs alongside the action instead of before it
+    # and only explains a failed unban.
+    info, result = await asyncio.gather(
+        bridge.info_async(),
+        bridge.call_async("user:unban", uid=uid),
+    )
+    invalidate_board_caches()  # unbanning rebuilds the moderators cache
+    if result.success:
+        _invalidate_user(uid)
+        return f"# User Unbanned (Bridge)\n\nUser {uid} has been unbanned successfully."
+
+    bridge.invalidate_info()
+    if info.success and "user:unban" not in info.data.get("supported_actions", []):
+        return "Error: Bridge does not support 'user:unban' yet."
+    return f"Error: Bridge user:unban failed: {result.error or 'unknown error'}"
 
 
 async def handle_usergroup_list(args: dict, db: Any, config: Any, sync_service: Any) -> str:
@@ -230,7 +369,10 @@ async def handle_usergroup_list(args: dict, db: Any, config: Any, sync_service:
     Returns:
         Usergroup list as markdown table
     """
-    groups = db.list_usergroups()
+    now = time.monotonic()
+    if _usergroup_cache["data"] is None or now - _usergroup_cache["ts"] >= _USERGROUP_CACHE_TTL:
+        _usergroup_cache.update(data=await asyncio.to_thread(db.list_usergroups), ts=now)
+    groups = _usergroup_cache["data"]
 
     if not groups:
         return "No usergroups found."
@@ -238,22 +380,32 @@ async def handle_usergroup_list(args: dict, db: Any, config: Any, sync_service:
     lines = [
         f"# Usergroups ({len(groups)} total)\n",
         "| GID | Title | Type |",
-        "|-----|-------|------|"
+        "|-----|-------|------|",
+        *[
+            f"| {g['gid']} | {format_table_cell(g['title'])} | {_usergroup_type(g)} |"
+            for g in groups
+        ],
     ]
 
-    for group in groups:
-        group_type = "Admin" if group.get('cancp') == 1 else ("Moderator" if group.get('canmodcp') == 1 else "User")
-        lines.append(f"| {group['gid']} | {group['title']} | {group_type} |")
-
     return "\n".join(lines)
 
 
+def _usergroup_type(group: dict) -> str:
+    """Classify a usergroup as Admin, Moderator or User from its permissions."""
+    if group.get('cancp') == 1:
+        return "Admin"
+    if group.get('canmodcp') == 1:
+        return "Moderator"
+    return "User"
+
+
 # Handler registry for user tools
 USER_HANDLERS = {
     "mybb_user_get": handle_user_get,
     "mybb_user_list": handle_user_list,
     "mybb_user_update_group": handle_user_update_group,
     "mybb_user_ban": handle_user_ban,
+    "mybb_user_ban_bulk": handle_user_ban_bulk,
     "mybb_user_unban": handle_user_unban,
     "mybb_usergroup_list": handle_usergroup_list,
 }
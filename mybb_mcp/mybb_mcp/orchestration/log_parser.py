@@ -6,12 +6,24 @@ from datetime import datetime, timezone
 from typing import Optional
 
 
-@dataclass
+# LogEntry.entry_type values. Shared constants (rather than scattered
+# literals) so producers and consumers compare against the same objects.
+ENTRY_REQUEST = 'request'
+ENTRY_ERROR = 'error'
+ENTRY_CONNECTION = 'connection'
+ENTRY_OTHER = 'other'
+
+# Error categories derived from the HTTP status code
+ERROR_HTTP_5XX = 'http_5xx'
+ERROR_HTTP_4XX = 'http_4xx'
+
+
+@dataclass(slots=True)
 class LogEntry:
     """Parsed log entry from PHP development server."""
     timestamp: Optional[datetime]
     raw_line: str
-    entry_type: str  # 'request', 'error', 'connection', 'other'
+    entry_type: str  # One of the ENTRY_* constants
     status_code: Optional[int] = None
     method: Optional[str] = None
     path: Optional[str] = None
@@ -29,6 +41,9 @@ STATIC_PATTERNS = [
     r'\.(png|jpg|jpeg|gif|css|js|ico|woff|woff2|ttf|svg)(\?|$)',
 ]
 
+# Single compiled alternation so a path is checked with one regex pass
+_STATIC_RE = re.compile('|'.join(f'(?:{p})' for p in STATIC_PATTERNS))
+
 # Error patterns to detect with categories
 ERROR_PATTERNS = {
     'fatal': [r'PHP Fatal error:', r'Fatal error:'],
@@ -39,14 +54,63 @@ ERROR_PATTERNS = {
     'strict': [r'PHP Strict Standards:', r'Strict Standards:'],
     'recoverable': [r'PHP Recoverable fatal error:'],
     'exception': [r'Uncaught Exception:', r'Uncaught Error:', r'Exception:'],
-    'http_5xx': [r'\[50[0-9]\]:'],  # 500-509 status codes
-    'http_4xx': [r'\[4[0-9]{2}\]:'],  # 400-499 status codes
+    ERROR_HTTP_5XX: [r'\[50[0-9]\]:'],  # 500-509 status codes
+    ERROR_HTTP_4XX: [r'\[4[0-9]{2}\]:'],  # 400-499 status codes
     'stack_trace': [r'^#\d+\s'],  # Stack trace lines
 }
 
 # Flattened patterns for quick matching
 ALL_ERROR_PATTERNS = [p for patterns in ERROR_PATTERNS.values() for p in patterns]
 
+# One compiled alternation per category, checked in ERROR_PATTERNS order
+_ERROR_RES = [
+    (category, re.compile('|'.join(f'(?:{p})' for p in patterns)))
+    for category, patterns in ERROR_PATTERNS.items()
+]
+
+# Literal substrings of which at least one appears in any line matched by
+# ERROR_PATTERNS (stack traces are caught by their leading '#'). Lines with
+# none of them cannot be errors, so the regexes are skipped entirely.
+_ERROR_TOKENS = ('error', 'Warning:', 'Notice:', 'Deprecated:', 'Strict',
+                 'Exception', 'Uncaught', ']:')
+
+
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
+
+def _parse_timestamp(text: str) -> Optional[datetime]:
+    """Parse a PHP dev server timestamp such as "Mon Jan 19 22:21:26 2026".
+
+    The format is fixed-width, so fields are sliced directly instead of
+    going through the much slower ``datetime.strptime``.
+
+    Args:
+        text: Timestamp text from inside the leading brackets
+
+    Returns:
+        UTC datetime, or None if the text is not in the expected format
+    """
+    if len(text) != 24:
+        return None
+    try:
+        return datetime(
+            int(text[20:24]), _MONTHS[text[4:7]], int(text[8:10]),
+            int(text[11:13]), int(text[14:16]), int(text[17:19]),
+            tzinfo=timezone.utc,
+        )
+    except (KeyError, ValueError):
+        return None
+
+
+# Full request line: [Mon Jan 19 22:21:26 2026] 127.0.0.1:47778 [200]: GET /usercp.php
+_REQUEST_LINE_RE = re.compile(
+    r'\[(?P<ts>[^\]]+)\]\s+(?P<ip>\d+\.\d+\.\d+\.\d+):\d+\s+'
+    r'\[(?P<status>\d{3})\]:\s+(?P<method>[A-Z]+)\s+(?P<path>.+)$'
+)
+
 
 def parse_log_line(line: str) -> Optional[LogEntry]:
     """Parse a single log line from PHP development server.
@@ -67,31 +131,46 @@ def parse_log_line(line: str) -> Optional[LogEntry]:
     if not line:
         return None
 
+    # Cheap first-character gate before any regex work
+    c0 = line[0]
+    if c0 == '#' and line[1:2].isdigit():
+        # Stack trace line (#0, #1, etc.)
+        return LogEntry(timestamp=None, raw_line=line, entry_type=ENTRY_ERROR, is_error=True)
+    if c0 != '[':
+        # No [timestamp] prefix, so not a request or connection line; only
+        # the error check applies (e.g. PHP errors written straight to stderr)
+        entry = LogEntry(timestamp=None, raw_line=line, entry_type=ENTRY_OTHER)
+        _classify_error(entry)
+        return entry
+
+    # Common case: an IPv4 request line, with every field captured in one pass
+    request_match = _REQUEST_LINE_RE.match(line)
+    if request_match:
+        entry = LogEntry(
+            timestamp=_parse_timestamp(request_match.group('ts')),
+            raw_line=line,
+            entry_type=ENTRY_REQUEST,
+            status_code=int(request_match.group('status')),
+            method=request_match.group('method'),
+            path=request_match.group('path'),
+            ip=request_match.group('ip'),
+        )
+        _classify_request(entry)
+        return entry
+
     # Parse timestamp from [...]
     timestamp_match = re.match(r'\[([^\]]+)\]', line)
     timestamp = None
     if timestamp_match:
-        timestamp_str = timestamp_match.group(1)
-        try:
-            # PHP dev server format: "Mon Jan 19 22:21:26 2026"
-            timestamp = datetime.strptime(timestamp_str, "%a %b %d %H:%M:%S %Y")
-            timestamp = timestamp.replace(tzinfo=timezone.utc)
-        except ValueError:
-            pass
+        timestamp = _parse_timestamp(timestamp_match.group(1))
 
     # Initialize entry with defaults
     entry = LogEntry(
         timestamp=timestamp,
         raw_line=line,
-        entry_type='other'
+        entry_type=ENTRY_OTHER
     )
 
-    # Check for stack trace lines (start with #0, #1, etc.)
-    if re.match(r'^#\d+', line):
-        entry.entry_type = 'error'
-        entry.is_error = True
-        return entry
-
     # Extract IP:port pattern
     ip_port_match = re.search(r'(\d+\.\d+\.\d+\.\d+):(\d+)', line)
     if ip_port_match:
@@ -99,7 +178,7 @@ def parse_log_line(line: str) -> Optional[LogEntry]:
 
     # Check for connection events
     if 'Accepted' in line or 'Closing' in line:
-        entry.entry_type = 'connection'
+        entry.entry_type = ENTRY_CONNECTION
         return entry
 
     # Check for HTTP request format: [200]: GET /path
@@ -108,28 +187,41 @@ def parse_log_line(line: str) -> Optional[LogEntry]:
         entry.status_code = int(request_match.group(1))
         entry.method = request_match.group(2)
         entry.path = request_match.group(3)
-        entry.entry_type = 'request'
+        entry.entry_type = ENTRY_REQUEST
+        _classify_request(entry)
+        return entry
 
-        # Check if it's an error status and categorize
-        if entry.status_code >= 400:
-            entry.is_error = True
-            entry.error_category = get_error_category(entry)
+    _classify_error(entry)
+    return entry
 
-        # Check if it's a static asset
-        if is_static_request(entry):
-            entry.is_static = True
 
-        return entry
+def _status_category(status_code: int) -> Optional[str]:
+    """Map an HTTP status code to its error category, or None for non-errors."""
+    if 500 <= status_code < 600:
+        return ERROR_HTTP_5XX
+    if 400 <= status_code < 500:
+        return ERROR_HTTP_4XX
+    return None
+
 
-    # Check for PHP error patterns
+def _classify_error(entry: LogEntry) -> None:
+    """Mark a non-request entry as an error if it matches a PHP error pattern."""
     error_cat = get_error_category(entry)
     if error_cat:
-        entry.entry_type = 'error'
+        entry.entry_type = ENTRY_ERROR
         entry.is_error = True
         entry.error_category = error_cat
-        return entry
 
-    return entry
+
+def _classify_request(entry: LogEntry) -> None:
+    """Set error and static-asset flags on a parsed request entry."""
+    category = _status_category(entry.status_code)
+    if category:
+        entry.is_error = True
+        entry.error_category = category
+
+    if is_static_request(entry):
+        entry.is_static = True
 
 
 def is_static_request(entry: LogEntry) -> bool:
@@ -144,11 +236,7 @@ def is_static_request(entry: LogEntry) -> bool:
     if not entry.path:
         return False
 
-    for pattern in STATIC_PATTERNS:
-        if re.search(pattern, entry.path):
-            return True
-
-    return False
+    return _STATIC_RE.search(entry.path) is not None
 
 
 def get_error_category(entry: LogEntry) -> Optional[str]:
@@ -160,18 +248,19 @@ def get_error_category(entry: LogEntry) -> Optional[str]:
     Returns:
         Error category string or None if not an error
     """
-    # Check status code first
+    # Request entries are categorized by status code alone; their raw line
+    # (path included) is never scanned for PHP error text
     if entry.status_code:
-        if 500 <= entry.status_code < 600:
-            return 'http_5xx'
-        elif 400 <= entry.status_code < 500:
-            return 'http_4xx'
+        return _status_category(entry.status_code)
 
     # Check raw line for error patterns
-    for category, patterns in ERROR_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, entry.raw_line):
-                return category
+    line = entry.raw_line
+    if not line.startswith('#') and not any(tok in line for tok in _ERROR_TOKENS):
+        return None
+
+    for category, pattern in _ERROR_RES:
+        if pattern.search(line):
+            return category
 
     return None
 
@@ -7,15 +7,563 @@ Persists state to .mybb-server.json.
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional, Union
 import subprocess
+import errno
 import json
+import mmap
+import multiprocessing
 import os
+import re
+import select
 import signal
+import socket
 import time
 from datetime import datetime, timezone, timedelta
 from collections import deque
-from .log_parser import parse_log_line, is_static_request, is_error_entry
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from .log_parser import (
+    LogEntry, parse_log_line, is_static_request, is_error_entry,
+    ENTRY_REQUEST, ENTRY_ERROR, ENTRY_CONNECTION,
+)
+
+
+# Max bytes of log scanned per query (10MB) - prevents runaway scans on huge logs
+MAX_READ_BYTES = 10 * 1024 * 1024
+
+
+# Below this many bytes of log a parallel query falls back to the serial scan
+PARALLEL_MIN_BYTES = 1024 * 1024
+
+# Start method for parallel scan workers. The MCP server is multithreaded
+# (asyncio worker threads, watchdog observers), and forking a multithreaded
+# process can copy a lock held by another thread into the child.
+_SCAN_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Header of query_logs output
+_LOG_HEADER_TEMPLATE = (
+    "# Server Logs%s\n\n"
+    "**Showing:** %d of %d%s matching (from %d lines read)\n"
+    "**Log file:** %s (%.2f MB)\n"
+    "**Filters:** %s%s\n\n"
+    "```\n"
+)
+
+# Output line templates per log entry type (connection entries are skipped)
+_LINE_FORMATS = {
+    ENTRY_REQUEST: '%s[%s] %s[%s] %s %s%s\n',
+    ENTRY_ERROR: '**[%s] %s%s**\n',
+}
+_OTHER_LINE_FORMAT = '[%s] %s\n'
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with '...'."""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+def _format_log_entry(entry: LogEntry) -> str:
+    """Render a parsed log entry as one line of query_logs output.
+
+    Args:
+        entry: Parsed entry (must not be a connection entry)
+
+    Returns:
+        Formatted line including trailing newline
+    """
+    ts_str = entry.timestamp.strftime("%H:%M:%S") if entry.timestamp else "??:??:??"
+    cat_tag = '[%s] ' % entry.error_category if entry.error_category else ''
+
+    if entry.entry_type == ENTRY_REQUEST:
+        marker = '**' if entry.is_error else ''
+        return _LINE_FORMATS[ENTRY_REQUEST] % (
+            marker, ts_str, cat_tag, entry.status_code, entry.method, entry.path, marker
+        )
+    if entry.entry_type == ENTRY_ERROR:
+        return _LINE_FORMATS[ENTRY_ERROR] % (ts_str, cat_tag, _truncate(entry.raw_line, 200))
+    return _OTHER_LINE_FORMAT % (ts_str, _truncate(entry.raw_line, 150))
+
+
+def _compile_filter(errors_only: bool, exclude_static: bool,
+                    keyword: Optional[re.Pattern],
+                    cutoff: Optional[datetime]) -> Callable[[LogEntry], bool]:
+    """Build a predicate that applies only the active log filters.
+
+    Args:
+        errors_only: Keep only error entries
+        exclude_static: Drop static asset requests
+        keyword: Case-insensitive keyword pattern the raw line must match
+        cutoff: Drop entries timestamped before this time
+
+    Returns:
+        Function returning True for entries that pass every filter
+    """
+    checks: list[Callable[[LogEntry], bool]] = []
+    if errors_only:
+        checks.append(lambda e: e.is_error)
+    if exclude_static:
+        checks.append(lambda e: not e.is_static)
+    if keyword:
+        search = keyword.search
+        checks.append(lambda e: search(e.raw_line) is not None)
+    if cutoff is not None:
+        checks.append(lambda e: e.timestamp is None or e.timestamp >= cutoff)
+
+    if not checks:
+        return lambda e: True
+    if len(checks) == 1:
+        return checks[0]
+
+    def keep(entry: LogEntry) -> bool:
+        for check in checks:
+            if not check(entry):
+                return False
+        return True
+
+    return keep
+
+
+def _keyword_pattern(keywords: Union[str, list[str], None]) -> Optional[re.Pattern]:
+    """Compile one or more keywords into a single case-insensitive pattern.
+
+    Args:
+        keywords: Keyword, list of keywords (any may match), or None
+
+    Returns:
+        Compiled alternation of the escaped keywords, or None if there are none
+    """
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    keywords = [k for k in keywords or () if k]
+    if not keywords:
+        return None
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+def _prefilter_lines(lines, keyword: Optional[re.Pattern]):
+    """Drop raw lines that can't contain the keyword, before they are parsed.
+
+    Parsing dominates scan cost, and the keyword filter only needs the raw
+    text, so lines without the keyword never reach parse_log_line. The entry
+    filter still applies the same check to parsed entries.
+
+    Args:
+        lines: Iterable of raw log lines
+        keyword: Keyword pattern from _keyword_pattern, or None to pass everything through
+
+    Returns:
+        Iterable of lines that may match
+    """
+    if not keyword:
+        return lines
+    search = keyword.search
+    return (line for line in lines if search(line) is not None)
+
+
+def _scan_log_range(path: str, start: int, end: int,
+                    filter_args: tuple) -> tuple[int, list[str]]:
+    """Parse and filter one newline-aligned byte range of a log file.
+
+    Runs in a worker process, so it takes the filter arguments rather than a
+    compiled predicate and returns plain strings rather than LogEntry objects.
+
+    Args:
+        path: Log file path
+        start: Offset of the first byte (start of a line)
+        end: Offset just past the last byte (end of a line or of the file)
+        filter_args: Arguments for _compile_filter
+
+    Returns:
+        Tuple of (lines scanned, matching lines in file order)
+    """
+    keep = _compile_filter(*filter_args)
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    lines = data.decode('utf-8', errors='replace').split('\n')
+    matched = []
+    for line in _prefilter_lines(lines, filter_args[2]):
+        entry = parse_log_line(line)
+        if entry is not None and keep(entry):
+            matched.append(entry.raw_line)
+    return len(lines), matched
+
+
+def _scan_log_parallel(path: str, file_size: int, max_bytes: Optional[int],
+                       filter_args: tuple) -> tuple[int, list[str]]:
+    """Parse and filter a log file across worker processes.
+
+    The scanned range is split into one chunk per CPU on line boundaries;
+    results are merged back in file order. Workers are started with
+    _SCAN_START_METHOD, never plain fork.
+
+    Args:
+        path: Log file path
+        file_size: Size of the file in bytes
+        max_bytes: Only scan this many bytes from the end (None for all)
+        filter_args: Arguments for _compile_filter
+
+    Returns:
+        Tuple of (lines scanned, matching lines in file order)
+    """
+    start = 0 if max_bytes is None else max(0, file_size - max_bytes)
+    workers = os.cpu_count() or 1
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) as mm:
+        if start > 0:
+            # Drop the line cut by the byte cap
+            nl = mm.find(b'\n', start)
+            start = file_size if nl == -1 else nl + 1
+
+        bounds = [start]
+        step = max(1, (file_size - start) // workers)
+        for i in range(1, workers):
+            nl = mm.find(b'\n', start + i * step)
+            if nl == -1:
+                break
+            if nl + 1 > bounds[-1]:
+                bounds.append(nl + 1)
+        if file_size > bounds[-1]:
+            bounds.append(file_size)
+
+    if len(bounds) < 2:
+        return 0, []
+
+    total_lines = 0
+    matched: list[str] = []
+    ctx = multiprocessing.get_context(_SCAN_START_METHOD)
+    with ProcessPoolExecutor(max_workers=len(bounds) - 1, mp_context=ctx) as ex:
+        for count, lines in ex.map(_scan_log_range, repeat(path), bounds[:-1],
+                                   bounds[1:], repeat(filter_args)):
+            total_lines += count
+            matched.extend(lines)
+    return total_lines, matched
+
+
+def _iter_lines_reverse(buf, max_bytes: int) -> Iterator[str]:
+    """Yield decoded lines from the end of a byte buffer, newest first.
+
+    Meant for a read-only mmap of the log: only the lines actually consumed
+    are copied out and decoded. At most the last ``max_bytes`` are scanned;
+    a line cut by that limit is dropped.
+
+    Args:
+        buf: bytes-like object supporting rfind() and slicing (e.g. mmap)
+        max_bytes: Maximum number of bytes to scan from the end
+
+    Yields:
+        Lines without their trailing newline, last line first
+    """
+    start_limit = max(0, len(buf) - max_bytes)
+    end = len(buf)
+
+    while True:
+        nl = buf.rfind(b'\n', start_limit, end)
+        if nl == -1:
+            # Only a line starting at byte 0 is known to be complete
+            if start_limit == 0 and end > 0:
+                yield buf[:end].decode('utf-8', errors='replace')
+            return
+        yield buf[nl + 1:end].decode('utf-8', errors='replace')
+        end = nl
+
+
+# How long a MariaDB process check is trusted before /proc is scanned again
+MARIADB_CHECK_TTL = 2.0
+
+# How long a computed ServerStatus is reused while the state file is unchanged
+STATUS_CACHE_TTL = 0.5
+
+# Max seconds start() waits for the PHP server to accept connections
+SERVER_START_TIMEOUT = 2.0
+
+# Signals used by stop(); signal 0 only checks that a process exists
+_SIG_ALIVE = 0
+_SIGTERM = signal.SIGTERM
+_SIGKILL = signal.SIGKILL
+
+# TCP state code for LISTEN in /proc/net/tcp
+_TCP_LISTEN = '0A'
+
+# Socket tables read by _find_listening_pid (Linux only)
+_PROC_NET_TCP = ('/proc/net/tcp', '/proc/net/tcp6')
+
+
+def _parse_started_at(state: dict) -> Optional[datetime]:
+    """Parse the ISO 'started_at' timestamp from a state dict.
+
+    Returns:
+        Parsed datetime, or None if missing or malformed
+    """
+    try:
+        return datetime.fromisoformat(state['started_at'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+# Process names that mean MariaDB/MySQL is running (newer MariaDB, older or MySQL)
+_MARIADB_NAMES = ('mariadbd', 'mysqld')
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check that a process exists with signal 0, for systems without /proc."""
+    try:
+        os.kill(pid, _SIG_ALIVE)
+    except (ProcessLookupError, OSError):
+        return False
+    return True
+
+
+def _pgrep_any(names: tuple[str, ...]) -> bool:
+    """Check for a process by exact name with pgrep, for systems without /proc.
+
+    Args:
+        names: Exact process names to look for
+
+    Returns:
+        True if pgrep finds a process with any of the names
+    """
+    for name in names:
+        try:
+            if subprocess.run(['pgrep', '-x', name], capture_output=True).returncode == 0:
+                return True
+        except OSError:
+            # pgrep not installed
+            return False
+    return False
+
+
+def _snapshot_procs(tracked_pid: Optional[int], names: tuple[str, ...]) -> tuple[bool, bool]:
+    """Check a PID and a set of process names in one pass over /proc.
+
+    Reads /proc/<pid>/comm directly instead of forking pgrep, and stops as
+    soon as both answers are known. Where /proc is unavailable (e.g. macOS)
+    the PID check falls back to os.kill(pid, 0) and the name check to pgrep.
+
+    Args:
+        tracked_pid: PID to check for liveness, or None
+        names: Exact process names to look for (e.g. 'mariadbd')
+
+    Returns:
+        Tuple of (tracked_pid is running, a process named in names is running)
+    """
+    tracked = str(tracked_pid) if tracked_pid else None
+    alive = False
+    found = False
+
+    try:
+        entries = os.scandir('/proc')
+    except OSError:
+        return (bool(tracked_pid) and _pid_alive(tracked_pid), _pgrep_any(names))
+
+    with entries:
+        for p in entries:
+            if not p.name.isdigit():
+                continue
+            if p.name == tracked:
+                alive = True
+            if not found:
+                try:
+                    with open(f'/proc/{p.name}/comm') as f:
+                        found = f.read().strip() in names
+                except OSError:
+                    # Process exited or is not readable
+                    pass
+            if found and (alive or tracked is None):
+                break
+    return (alive, found)
+
+
+def _proc_has(*names: str) -> bool:
+    """Check whether any running process has one of the given command names.
+
+    Args:
+        names: Exact process names to look for (e.g. 'mariadbd')
+
+    Returns:
+        True if a matching process is running
+    """
+    return _snapshot_procs(None, names)[1]
+
+
+def _port_in_use(port: int) -> bool:
+    """Check whether a local TCP port is taken by trying to bind it.
+
+    Args:
+        port: Port number to check
+
+    SO_REUSEADDR is set so leftover TIME_WAIT connections from a server that
+    just stopped do not count; binding still fails while a socket is listening.
+
+    Returns:
+        True if binding the port on the IPv4 or IPv6 loopback fails with EADDRINUSE
+    """
+    for family, host in ((socket.AF_INET, '127.0.0.1'), (socket.AF_INET6, '::1')):
+        try:
+            sock = socket.socket(family, socket.SOCK_STREAM)
+        except OSError:
+            # Address family not supported on this host
+            continue
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((host, port))
+        except OSError as e:
+            if e.errno == errno.EADDRINUSE:
+                return True
+        finally:
+            sock.close()
+    return False
+
+
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Wait for a process to exit.
+
+    Uses a pidfd so the wait is a single poll() that returns as soon as the
+    process dies. Falls back to polling os.kill(pid, 0) every 0.1s where
+    pidfd_open isn't available (non-Linux or kernels before 5.3), reaping
+    the process if it is our child so it doesn't linger as a zombie.
+
+    Args:
+        pid: Process ID to wait for
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if the process exited within the timeout
+    """
+    try:
+        fd = os.pidfd_open(pid)
+    except ProcessLookupError:
+        return True
+    except (AttributeError, OSError):
+        fd = None
+
+    if fd is not None:
+        try:
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            return bool(poller.poll(int(timeout * 1000)))
+        finally:
+            os.close(fd)
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            # An exited child stays visible to signal 0 until it is reaped
+            if os.waitpid(pid, os.WNOHANG)[0] == pid:
+                return True
+        except ChildProcessError:
+            # Not our child, or already reaped
+            pass
+        try:
+            os.kill(pid, _SIG_ALIVE)
+        except (ProcessLookupError, OSError):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.1)
+
+
+def _wait_for_port(port: int, pid: int, timeout: float) -> None:
+    """Wait until a server accepts connections on a local port.
+
+    Returns early if the process exits, leaving the caller to report it.
+
+    Args:
+        port: Port the server should listen on
+        pid: Server process ID
+        timeout: Maximum seconds to wait
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('localhost', port), timeout=0.05):
+                return
+        except OSError:
+            pass
+        if _wait_for_exit(pid, 0.05):
+            return
+
+
+def _find_listening_pid(port: int) -> Optional[int]:
+    """Find the PID of the process listening on a TCP port.
+
+    Matches the port against /proc/net/tcp and /proc/net/tcp6 to get the
+    socket inode, then looks for that inode among /proc/<pid>/fd links.
+    Where those tables don't exist (e.g. macOS) it asks lsof instead.
+
+    Args:
+        port: Port number to look up
+
+    Returns:
+        PID of the listening process, or None if it can't be determined
+    """
+    port_hex = f':{port:04X}'
+    inodes = set()
+    have_tables = False
+    for table in _PROC_NET_TCP:
+        try:
+            with open(table) as f:
+                have_tables = True
+                next(f, None)  # Header row
+                for row in f:
+                    fields = row.split()
+                    if (len(fields) > 9 and fields[3] == _TCP_LISTEN
+                            and fields[1].endswith(port_hex)):
+                        inodes.add(f'socket:[{fields[9]}]')
+        except OSError:
+            continue
+
+    if not have_tables:
+        return _lsof_pid(port)
+    if not inodes:
+        return None
+
+    try:
+        entries = os.scandir('/proc')
+    except OSError:
+        return None
+
+    with entries:
+        for p in entries:
+            if not p.name.isdigit():
+                continue
+            fd_dir = f'/proc/{p.name}/fd'
+            try:
+                fds = os.listdir(fd_dir)
+            except OSError:
+                continue
+            for fd in fds:
+                try:
+                    if os.readlink(f'{fd_dir}/{fd}') in inodes:
+                        return int(p.name)
+                except OSError:
+                    continue
+    return None
+
+
+def _lsof_pid(port: int) -> Optional[int]:
+    """Find the PID using a TCP port with lsof, for systems without /proc.
+
+    Args:
+        port: Port number to look up
+
+    Returns:
+        First PID lsof reports, or None if none or lsof is missing
+    """
+    try:
+        result = subprocess.run(['lsof', '-ti', f':{port}'], capture_output=True, text=True)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    try:
+        return int(result.stdout.split()[0])
+    except (IndexError, ValueError):
+        return None
 
 
 @dataclass
@@ -46,10 +594,11 @@ class LogQueryOptions:
     errors_only: bool = False
     exclude_static: bool = False
     since_minutes: Optional[int] = None
-    filter_keyword: Optional[str] = None
+    filter_keyword: Union[str, list[str], None] = None  # Any of several keywords may match
     limit: int = 50
     offset: int = 0  # Pagination offset
     tail: bool = True
+    parallel: bool = False  # Scan large logs across worker processes
 
 
 class ServerOrchestrationService:
@@ -72,6 +621,16 @@ class ServerOrchestrationService:
         self.state_file = self.repo_root / ".mybb-server.json"
         self.log_dir = self.repo_root / "logs"
         self.log_file = self.log_dir / "server.log"
+        self._log_file_str = str(self.log_file)
+        # (monotonic timestamp, result) of the last MariaDB process check
+        self._mariadb_cache: Optional[tuple[float, bool]] = None
+        # PHP server process started by this service instance, if any
+        self._server_proc: Optional[subprocess.Popen] = None
+        # ((mtime_ns, size), parsed dict, parsed started_at) of the state file
+        # as last read or written
+        self._state_cache: Optional[tuple[tuple[int, int], dict, Optional[datetime]]] = None
+        # (monotonic timestamp, state file mtime_ns, status) of the last get_status()
+        self._status_cache: Optional[tuple[float, Optional[int], "ServerStatus"]] = None
 
     def _read_state(self) -> Optional[dict]:
         """Read server state from JSON file.
@@ -79,15 +638,26 @@ class ServerOrchestrationService:
         Returns:
             State dict if file exists and is valid JSON, None otherwise
         """
-        if not self.state_file.exists():
+        try:
+            st = self.state_file.stat()
+        except OSError:
+            self._state_cache = None
             return None
 
+        # Reuse the parsed state while the file is unchanged
+        key = (st.st_mtime_ns, st.st_size)
+        if self._state_cache and self._state_cache[0] == key:
+            return self._state_cache[1]
+
         try:
             with open(self.state_file, 'r') as f:
-                return json.load(f)
+                state = json.load(f)
         except (json.JSONDecodeError, IOError):
             return None
 
+        self._state_cache = (key, state, _parse_started_at(state))
+        return state
+
     def _write_state(self, state: dict) -> None:
         """Write server state to JSON file atomically.
 
@@ -108,6 +678,10 @@ class ServerOrchestrationService:
 
         # Atomic rename
         temp_file.rename(self.state_file)
+        self._status_cache = None
+
+        st = self.state_file.stat()
+        self._state_cache = ((st.st_mtime_ns, st.st_size), state, _parse_started_at(state))
 
     def _validate_state(self, state: dict) -> bool:
         """Validate that the process in state is actually running.
@@ -122,18 +696,28 @@ class ServerOrchestrationService:
         if not pid:
             return False
 
+        # A server we started that has exited lingers as a zombie until reaped
+        self._reap_server()
+
         try:
             # os.kill with signal 0 checks if process exists without sending a signal
-            os.kill(pid, 0)
+            os.kill(pid, _SIG_ALIVE)
             return True
         except (ProcessLookupError, OSError):
             # Process doesn't exist
             return False
 
+    def _reap_server(self) -> None:
+        """Collect the exit status of a PHP server started by this service."""
+        if self._server_proc is not None and self._server_proc.poll() is not None:
+            self._server_proc = None
+
     def _clear_state(self) -> None:
         """Remove state file if it exists."""
         if self.state_file.exists():
             self.state_file.unlink()
+        self._status_cache = None
+        self._state_cache = None
 
     def _check_mariadb(self) -> bool:
         """Check if MariaDB/MySQL is running.
@@ -141,26 +725,59 @@ class ServerOrchestrationService:
         Returns:
             True if MariaDB or MySQL process is running, False otherwise
         """
-        # Try mariadbd first (newer MariaDB)
-        result = subprocess.run(['pgrep', '-x', 'mariadbd'], capture_output=True)
-        if result.returncode == 0:
-            return True
+        now = time.monotonic()
+        if self._mariadb_cache and now - self._mariadb_cache[0] < MARIADB_CHECK_TTL:
+            return self._mariadb_cache[1]
 
-        # Fallback to mysqld (older or MySQL)
-        result = subprocess.run(['pgrep', '-x', 'mysqld'], capture_output=True)
-        return result.returncode == 0
+        running = _proc_has(*_MARIADB_NAMES)
+        self._mariadb_cache = (now, running)
+        return running
+
+    def _state_mtime(self) -> Optional[int]:
+        """Return the state file's mtime in nanoseconds, or None if it doesn't exist."""
+        try:
+            return self.state_file.stat().st_mtime_ns
+        except OSError:
+            return None
 
     def get_status(self) -> ServerStatus:
         """Get current server status.
 
+        Back-to-back calls reuse the previous result for STATUS_CACHE_TTL
+        seconds as long as the state file hasn't changed.
+
         Returns:
             ServerStatus with current state
         """
-        # Check MariaDB status
-        mariadb_running = self._check_mariadb()
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached and now - cached[0] < STATUS_CACHE_TTL and cached[1] == self._state_mtime():
+            return cached[2]
 
+        status = self._compute_status()
+        self._status_cache = (now, self._state_mtime(), status)
+        return status
+
+    def _compute_status(self) -> ServerStatus:
+        """Build a fresh ServerStatus from the state file and process checks.
+
+        Returns:
+            ServerStatus with current state
+        """
         # Read state file
         state = self._read_state()
+        pid = state.get('pid') if state else None
+
+        now = time.monotonic()
+        mariadb_fresh = self._mariadb_cache and now - self._mariadb_cache[0] < MARIADB_CHECK_TTL
+        if pid and not mariadb_fresh:
+            # One /proc pass answers both the PID and the MariaDB check
+            self._reap_server()
+            pid_alive, mariadb_running = _snapshot_procs(pid, _MARIADB_NAMES)
+            self._mariadb_cache = (now, mariadb_running)
+        else:
+            mariadb_running = self._check_mariadb()
+            pid_alive = None
 
         # No state file - check if port is in use anyway (server started externally)
         if not state:
@@ -180,14 +797,20 @@ class ServerOrchestrationService:
             return ServerStatus(running=False, mariadb_running=mariadb_running)
 
         # Validate PID is still running
-        if not self._validate_state(state):
+        if pid_alive is None:
+            pid_alive = self._validate_state(state)
+        if not pid_alive:
             # Stale state file - clean it up
             self._clear_state()
             return ServerStatus(running=False, mariadb_running=mariadb_running)
 
         # Calculate uptime
-        started_at = datetime.fromisoformat(state['started_at'])
-        uptime_seconds = (datetime.now(timezone.utc) - started_at).total_seconds()
+        # started_at is parsed once when the state file is read
+        cached = self._state_cache
+        started_at = cached[2] if cached and cached[1] is state else _parse_started_at(state)
+        uptime_seconds = None
+        if started_at is not None:
+            uptime_seconds = (datetime.now(timezone.utc) - started_at).total_seconds()
 
         # Return full status
         return ServerStatus(
@@ -209,42 +832,26 @@ class ServerOrchestrationService:
         Returns:
             Tuple of (is_available, pid_using_port)
         """
-        result = subprocess.run(
-            ['lsof', '-ti', f':{port}'],
-            capture_output=True,
-            text=True
-        )
-
-        # returncode != 0 means nothing is using the port
-        if result.returncode != 0:
+        if not _port_in_use(port):
             return (True, None)
 
-        # Parse PID from output
-        try:
-            pid = int(result.stdout.strip())
-            return (False, pid)
-        except (ValueError, AttributeError):
-            # Couldn't parse PID, but port is in use
-            return (False, None)
+        # Port is in use - PID may be None if the owner isn't visible to us
+        return (False, _find_listening_pid(port))
 
     def _rotate_log(self) -> None:
         """Rotate the server log file.
 
-        Moves current log to .log.1, deleting any existing .log.1
+        Moves current log to .log.1, replacing any existing .log.1
         """
         # Ensure log directory exists
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-        # If current log exists, rotate it
-        if self.log_file.exists():
-            rotated = self.log_file.with_suffix('.log.1')
-
-            # Delete old rotated log if it exists
-            if rotated.exists():
-                rotated.unlink()
-
-            # Rename current log to rotated
-            self.log_file.rename(rotated)
+        # os.replace atomically overwrites an old .log.1
+        try:
+            os.replace(self.log_file, self.log_file.with_suffix('.log.1'))
+        except FileNotFoundError:
+            # No current log to rotate
+            pass
 
     def start(self, port: Optional[int] = None, force: bool = False) -> ServerResult:
         """Start the PHP development server.
@@ -298,29 +905,36 @@ class ServerOrchestrationService:
         # Rotate log file
         self._rotate_log()
 
-        # Start PHP server
-        log_path = str(self.log_file)
-        cmd = f'cd "{self.mybb_root}" && php -S localhost:{port} -t . >> "{log_path}" 2>&1 & echo $!'
+        # Start PHP server directly (no shell), appending to the log
+        log_path = self._log_file_str
 
         try:
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                cwd=str(self.mybb_root)
+            # O_CLOEXEC: only the dup2'd stdout/stderr copies reach the child
+            log_fd = os.open(
+                log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o644
             )
+            try:
+                proc = subprocess.Popen(
+                    ['php', '-S', f'localhost:{port}', '-t', '.'],
+                    cwd=str(self.mybb_root),
+                    stdin=subprocess.DEVNULL,
+                    stdout=log_fd,
+                    stderr=subprocess.STDOUT,
+                    start_new_session=True,
+                    close_fds=True
+                )
+            finally:
+                os.close(log_fd)
 
-            # Parse PID from output
-            pid = int(result.stdout.strip())
+            pid = proc.pid
+            self._server_proc = proc
 
-            # Wait a moment for server to start
-            time.sleep(0.5)
+            # Wait for server to start accepting connections
+            _wait_for_port(port, pid, SERVER_START_TIMEOUT)
 
-            # Verify process exists
-            try:
-                os.kill(pid, 0)
-            except (ProcessLookupError, OSError):
+            # Verify process is still alive
+            if proc.poll() is not None:
+                self._server_proc = None
                 return ServerResult(
                     success=False,
                     message=f"Server process {pid} failed to start"
@@ -341,7 +955,7 @@ class ServerOrchestrationService:
                 pid=pid
             )
 
-        except (subprocess.SubprocessError, ValueError) as e:
+        except (subprocess.SubprocessError, OSError) as e:
             return ServerResult(
                 success=False,
                 message=f"Failed to start server: {str(e)}"
@@ -371,22 +985,15 @@ class ServerOrchestrationService:
 
         try:
             # Try graceful shutdown first
-            os.kill(pid, signal.SIGTERM)
+            os.kill(pid, _SIGTERM)
 
             # Wait up to 5 seconds for process to exit
-            for _ in range(50):  # 50 * 0.1s = 5s
-                try:
-                    os.kill(pid, 0)  # Check if process still exists
-                    time.sleep(0.1)
-                except (ProcessLookupError, OSError):
-                    # Process is gone
-                    break
-            else:
+            if not _wait_for_exit(pid, 5.0):
                 # Process still running after 5 seconds
                 if force:
                     # Force kill
-                    os.kill(pid, signal.SIGKILL)
-                    time.sleep(0.1)
+                    os.kill(pid, _SIGKILL)
+                    _wait_for_exit(pid, 1.0)
                 else:
                     return ServerResult(
                         success=False,
@@ -394,6 +1001,7 @@ class ServerOrchestrationService:
                     )
 
             # Clear state file
+            self._reap_server()
             self._clear_state()
 
             return ServerResult(
@@ -419,70 +1027,102 @@ class ServerOrchestrationService:
         Returns:
             Markdown-formatted log output
         """
-        log_file = self.log_dir / "server.log"
+        log_file = self._log_file_str
 
-        # Check if log file exists
-        if not log_file.exists():
+        # Get file size for info (also checks the log file exists)
+        try:
+            file_size = os.stat(log_file).st_size
+        except FileNotFoundError:
             return "# Server Logs\n\nNo log file found. Server may not have been started yet."
-
-        # Get file size for info
-        file_size = log_file.stat().st_size
         file_size_mb = file_size / (1024 * 1024)
 
-        # Max bytes to read (10MB) - prevents memory issues on huge logs
-        MAX_READ_BYTES = 10 * 1024 * 1024
+        cutoff = None
+        if options.since_minutes is not None:
+            cutoff = datetime.now(timezone.utc) - timedelta(minutes=options.since_minutes)
+        filter_args = (
+            options.errors_only,
+            options.exclude_static,
+            _keyword_pattern(options.filter_keyword),
+            cutoff,
+        )
+        keep = _compile_filter(*filter_args)
+
+        total_lines = 0
+        truncated = False
+
+        def counted(lines):
+            # Count every line read, including those the prefilter drops
+            nonlocal total_lines
+            for line in lines:
+                total_lines += 1
+                yield line
+
+        # True when every matching entry in the scanned range was counted
+        count_exact = True
 
         try:
-            with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-                if options.tail and file_size > MAX_READ_BYTES:
-                    # For large files with tail mode, seek to end and read last chunk
-                    f.seek(max(0, file_size - MAX_READ_BYTES))
-                    f.readline()  # Discard partial line
-                    lines = f.readlines()
-                    truncated = True
+            if options.parallel and file_size > PARALLEL_MIN_BYTES:
+                # Full scan across worker processes - exact counts, no early exit
+                total_lines, matched = _scan_log_parallel(
+                    log_file, file_size,
+                    MAX_READ_BYTES if options.tail else None, filter_args
+                )
+                truncated = options.tail and file_size > MAX_READ_BYTES
+                total_matching = len(matched)
+                if options.tail:
+                    page_end = max(0, total_matching - options.offset)
+                    page = matched[max(0, page_end - options.limit):page_end]
                 else:
-                    lines = f.readlines()
-                    truncated = False
+                    page = matched[options.offset:options.offset + options.limit]
+                entries = [parse_log_line(line) for line in page]
+            elif options.tail:
+                # Walk backwards from the end of the file, stopping as soon as
+                # the requested page (plus one entry to detect more pages) is
+                # found. Collected newest first.
+                wanted = options.offset + options.limit + 1
+                newest_first = []
+                with open(log_file, 'rb') as f:
+                    # mmap can't map an empty file
+                    mm = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) if file_size else b''
+                    try:
+                        for line in _prefilter_lines(counted(_iter_lines_reverse(mm, MAX_READ_BYTES)),
+                                                     filter_args[2]):
+                            entry = parse_log_line(line)
+                            if entry is None or not keep(entry):
+                                continue
+                            newest_first.append(entry)
+                            if len(newest_first) >= wanted:
+                                count_exact = False
+                                break
+                        else:
+                            truncated = file_size > MAX_READ_BYTES
+                    finally:
+                        if file_size:
+                            mm.close()
+
+                total_matching = len(newest_first)
+                page = newest_first[options.offset:options.offset + options.limit]
+                entries = page[::-1]
+            else:
+                # Stream forward, keeping only the requested page and stopping
+                # at the first match past it
+                page_end = options.offset + options.limit
+                total_matching = 0
+                entries = []
+                with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+                    for line in _prefilter_lines(counted(f), filter_args[2]):
+                        entry = parse_log_line(line)
+                        if entry is None or not keep(entry):
+                            continue
+                        total_matching += 1
+                        if total_matching > page_end:
+                            count_exact = False
+                            break
+                        if total_matching > options.offset:
+                            entries.append(entry)
         except Exception as e:
             return f"# Server Logs\n\n**Error reading log file:** {str(e)}"
 
-        total_lines = len(lines)
-
-        # Parse and filter entries, collecting matches
-        entries = []
-        for line in lines:
-            entry = parse_log_line(line)
-            if entry is None:
-                continue
-
-            # Apply filters
-            if options.errors_only and not entry.is_error:
-                continue
-            if options.exclude_static and entry.is_static:
-                continue
-            if options.filter_keyword:
-                if options.filter_keyword.lower() not in entry.raw_line.lower():
-                    continue
-            if options.since_minutes is not None and entry.timestamp:
-                cutoff_time = datetime.now(timezone.utc) - timedelta(minutes=options.since_minutes)
-                if entry.timestamp < cutoff_time:
-                    continue
-
-            entries.append(entry)
-
-        # Track total matching before pagination
-        total_matching = len(entries)
-
-        # Apply pagination: offset first, then limit
-        if options.tail:
-            # For tail, offset from the end
-            if options.offset > 0:
-                entries = entries[:-options.offset] if options.offset < len(entries) else []
-            entries = entries[-options.limit:] if entries else []
-        else:
-            # For head, offset from the start
-            entries = entries[options.offset:options.offset + options.limit]
-
         # Build error category breakdown
         error_categories = {}
         for e in entries:
@@ -496,28 +1136,27 @@ class ServerOrchestrationService:
         if options.exclude_static:
             filter_desc.append("exclude_static=true")
         if options.filter_keyword:
-            filter_desc.append(f"keyword='{options.filter_keyword}'")
+            keywords = options.filter_keyword
+            if not isinstance(keywords, str):
+                keywords = "|".join(keywords)
+            filter_desc.append(f"keyword='{keywords}'")
         if options.since_minutes:
             filter_desc.append(f"since={options.since_minutes}m")
         if options.offset > 0:
             filter_desc.append(f"offset={options.offset}")
 
         filters_str = ", ".join(filter_desc) if filter_desc else "none"
-        truncated_warning = "\n**⚠️ Large log file - showing last 10MB only**" if truncated else ""
+        truncated_warning = "\n**⚠️ Large log file - searched last 10MB only**" if truncated else ""
 
         # Pagination info
         has_more = total_matching > (options.offset + options.limit)
         page_info = f" (page {options.offset // options.limit + 1})" if options.offset > 0 else ""
         next_page_hint = f"\n*More entries available. Use offset={options.offset + options.limit} to see next page.*" if has_more else ""
 
-        output = f"""# Server Logs{page_info}
-
-**Showing:** {len(entries)} of {total_matching} matching (from {total_lines} lines read)
-**Log file:** {log_file} ({file_size_mb:.2f} MB)
-**Filters:** {filters_str}{truncated_warning}
-
-```
-"""
+        parts: list[str] = [_LOG_HEADER_TEMPLATE % (
+            page_info, len(entries), total_matching, '' if count_exact else '+',
+            total_lines, log_file, file_size_mb, filters_str, truncated_warning
+        )]
 
         # Token guard: max ~8000 chars of log content to avoid context bloat
         MAX_OUTPUT_CHARS = 8000
@@ -525,45 +1164,33 @@ class ServerOrchestrationService:
         entries_shown = 0
 
         for entry in entries:
-            # Format timestamp
-            ts_str = entry.timestamp.strftime("%H:%M:%S") if entry.timestamp else "??:??:??"
-
-            # Format line based on entry type
-            if entry.entry_type == 'request':
-                cat_tag = f"[{entry.error_category}] " if entry.error_category else ""
-                status_marker = "**" if entry.is_error else ""
-                line = f"{status_marker}[{ts_str}] {cat_tag}[{entry.status_code}] {entry.method} {entry.path}{status_marker}\n"
-            elif entry.entry_type == 'error':
-                cat_tag = f"[{entry.error_category}] " if entry.error_category else ""
-                line = f"**[{ts_str}] {cat_tag}{entry.raw_line[:200]}{'...' if len(entry.raw_line) > 200 else ''}**\n"
-            elif entry.entry_type == 'connection':
+            if entry.entry_type == ENTRY_CONNECTION:
                 continue
-            else:
-                line = f"[{ts_str}] {entry.raw_line[:150]}{'...' if len(entry.raw_line) > 150 else ''}\n"
+            line = _format_log_entry(entry)
 
             # Check token guard
             if chars_used + len(line) > MAX_OUTPUT_CHARS:
-                output += f"... ({len(entries) - entries_shown} more entries truncated for context limit)\n"
+                parts.append(f"... ({len(entries) - entries_shown} more entries truncated for context limit)\n")
                 break
 
-            output += line
+            parts.append(line)
             chars_used += len(line)
             entries_shown += 1
 
-        output += "```\n"
+        parts.append("```\n")
 
         # Add summary with error breakdown
         error_count = sum(1 for e in entries if e.is_error)
         if error_count > 0:
             breakdown = ", ".join(f"{cat}: {count}" for cat, count in sorted(error_categories.items()))
-            output += f"\n**Summary:** {entries_shown} entries shown, {error_count} errors"
+            parts.append(f"\n**Summary:** {entries_shown} entries shown, {error_count} errors")
             if breakdown:
-                output += f"\n**Error breakdown:** {breakdown}"
-            output += "\n"
+                parts.append(f"\n**Error breakdown:** {breakdown}")
+            parts.append("\n")
 
-        output += next_page_hint
+        parts.append(next_page_hint)
 
-        return output
+        return "".join(parts)
 
     def restart(self, port: Optional[int] = None) -> ServerResult:
         """Restart the server (stop + start).
@@ -6,37 +6,97 @@ This server provides tools for Claude to interact with MyBB:
 - Plugin scaffolding and hook reference
 
 Architecture:
-- Tool definitions: mybb_mcp/tools_registry.py (85 tools)
+- Tool definitions: mybb_mcp/tools_registry.py (ALL_TOOLS, built once at import)
 - Tool handlers: mybb_mcp/handlers/ (modularized by category)
 - Dispatcher: mybb_mcp/handlers/dispatcher.py (central routing)
 """
 
 import asyncio
+import atexit
 import logging
-from pathlib import Path
+import threading
+import time
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-from .config import load_config, MyBBConfig
+from .config import load_config, DatabaseConfig, MyBBConfig
 from .db import MyBBDatabase
 from .tools_registry import ALL_TOOLS
 from .handlers import dispatch_tool, HANDLER_REGISTRY
 
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs strftime at most once per second.
+
+    Output matches logging.Formatter's default asctime ("2024-01-01 12:00:00,123");
+    only the milliseconds are formatted per record.
+    """
+
+    _cached: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, stamp = self._cached
+        if second != cached_second:
+            stamp = time.strftime(self.default_time_format, self.converter(second))
+            self._cached = (second, stamp)
+        return self.default_msec_format % (stamp, record.msecs)
+
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(_CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
 logger = logging.getLogger("mybb-mcp")
 
 
-def create_server(config: MyBBConfig) -> Server:
+# Databases shared across create_server calls, keyed by connection identity
+_DB_CACHE: dict[tuple, MyBBDatabase] = {}
+
+
+def _get_database(db_config: DatabaseConfig) -> MyBBDatabase:
+    """Return the shared MyBBDatabase for this connection, creating it once.
+
+    Restarting the server (or building several in one process) then reuses the
+    existing connection pool instead of opening a new one.
+    """
+    key = (db_config.host, db_config.port, db_config.user, db_config.database, db_config.pool_name)
+    db = _DB_CACHE.get(key)
+    if db is None:
+        db = _DB_CACHE.setdefault(key, MyBBDatabase(db_config))
+    return db
+
+
+@atexit.register
+def _close_cached_databases() -> None:
+    """Drain every cached connection pool at interpreter exit."""
+    while _DB_CACHE:
+        _, db = _DB_CACHE.popitem()
+        db.close_pool()
+
+
+def _required_arguments(tools: list[Tool]) -> dict[str, tuple[str, ...]]:
+    """Map each tool name to the argument names its input schema requires."""
+    return {tool.name: tuple(tool.inputSchema.get("required", ())) for tool in tools}
+
+
+def _missing_arguments(required: tuple[str, ...], arguments: dict | None) -> list[str]:
+    """Return the required argument names absent from a tool call."""
+    if not required:
+        return []
+    arguments = arguments or {}
+    return [key for key in required if key not in arguments]
+
+
+async def create_server(config: MyBBConfig) -> Server:
     """Create and configure the MCP server with all tools.
 
     This function initializes:
-    - Database connection pool
+    - Database connection pool (shared across calls with the same connection)
     - Disk sync service with file watcher
     - Tool registration with MCP server
 
@@ -46,26 +106,38 @@ def create_server(config: MyBBConfig) -> Server:
     Returns:
         Configured MCP Server instance
     """
-    from .sync import DiskSyncService, SyncConfig
-
     server = Server("mybb-mcp")
 
-    # Initialize database connection
-    db = MyBBDatabase(config.db)
+    # Initialize database connection (pool shared with earlier servers)
+    db = _get_database(config.db)
+
+    # Open DB connections in the background while the watcher starts
+    threading.Thread(target=db.prewarm, name="mybb-db-prewarm", daemon=True).start()
+
+    sync_service = None
+    if config.sync_enabled:
+        # Imported here so servers without sync never load watchdog
+        from .sync import DiskSyncService, SyncConfig
 
-    # Initialize DiskSync service
-    # Use mybb_root's parent (repo root) for sync directory
-    sync_root = config.mybb_root.parent / "mybb_sync"
-    sync_root.mkdir(parents=True, exist_ok=True)
-    sync_config = SyncConfig(sync_root=sync_root)
-    sync_service = DiskSyncService(db, sync_config, config.mybb_url, mybb_root=config.mybb_root)
+        # Initialize DiskSync service
+        # Use mybb_root's parent (repo root) for sync directory
+        sync_root = config.mybb_root.parent / "mybb_sync"
+        await asyncio.to_thread(sync_root.mkdir, parents=True, exist_ok=True)
+        sync_config = SyncConfig(sync_root=sync_root)
+        sync_service = DiskSyncService(db, sync_config, config.mybb_url, mybb_root=config.mybb_root)
 
-    # Auto-start file watcher (dev server - always want sync on)
-    sync_service.start_watcher()
-    logger.info(f"File watcher started: {sync_root}")
+        # Auto-start file watcher (dev server - always want sync on)
+        started = time.monotonic()
+        await sync_service.start_watcher_async()
+        logger.info("File watcher started in %.2fs: %s", time.monotonic() - started, sync_root)
+    else:
+        logger.info("Disk sync disabled (MYBB_SYNC_ENABLED=false)")
 
     # Log handler registry status
-    logger.info(f"Handler registry loaded: {len(HANDLER_REGISTRY)} handlers")
+    logger.info("Handler registry loaded: %s handlers", len(HANDLER_REGISTRY))
+
+    # Read each schema's required list once instead of on every call
+    required_arguments = _required_arguments(ALL_TOOLS)
 
     @server.list_tools()
     async def list_tools() -> list[Tool]:
@@ -80,14 +152,24 @@ def create_server(config: MyBBConfig) -> Server:
             name: Tool name (e.g., "mybb_list_templates")
             arguments: Tool arguments dict
 
+        Calls missing a required argument are rejected before dispatch.
+        Handlers still check for empty values themselves.
+
         Returns:
             List containing TextContent with handler response
         """
+        missing = _missing_arguments(required_arguments.get(name, ()), arguments)
+        if missing:
+            return [TextContent(
+                type="text",
+                text=f"Error: {name} is missing required argument(s): {', '.join(missing)}",
+            )]
+
         try:
             result = await dispatch_tool(name, arguments, db, config, sync_service)
             return [TextContent(type="text", text=result)]
         except Exception as e:
-            logger.exception(f"Error in tool {name}")
+            logger.exception("Error in tool %s", name)
             return [TextContent(type="text", text=f"Error: {e}")]
 
     return server
@@ -96,12 +178,12 @@ def create_server(config: MyBBConfig) -> Server:
 async def run_server():
     """Run the MCP server with stdio transport."""
     config = load_config()
-    logger.info(f"Starting MyBB MCP Server")
-    logger.info(f"MyBB root: {config.mybb_root}")
-    logger.info(f"Database: {config.db.database}")
-    logger.info(f"Tools registered: {len(ALL_TOOLS)}")
+    logger.info("Starting MyBB MCP Server")
+    logger.info("MyBB root: %s", config.mybb_root)
+    logger.info("Database: %s", config.db.database)
+    logger.info("Tools registered: %s", len(ALL_TOOLS))
 
-    server = create_server(config)
+    server = await create_server(config)
 
     async with stdio_server() as (read_stream, write_stream):
         await server.run(read_stream, write_stream, server.create_initialization_options())
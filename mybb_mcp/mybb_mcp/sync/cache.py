@@ -8,7 +8,11 @@ from typing import Any
 
 
 class CacheRefresher:
-    """Triggers MyBB stylesheet cache regeneration via HTTP POST."""
+    """Triggers MyBB stylesheet cache regeneration via HTTP POST.
+
+    One keep-alive client is reused across refreshes, so a burst of
+    stylesheet saves does not open a new connection per request.
+    """
 
     def __init__(self, mybb_url: str, token: str = ""):
         """Initialize cache refresher.
@@ -20,6 +24,25 @@ class CacheRefresher:
         self.mybb_url = mybb_url.rstrip('/')
         self.endpoint = f"{self.mybb_url}/cachecss.php"
         self.token = token
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        Created lazily so it binds to the event loop that processes sync work.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if one was opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def refresh_stylesheet(self, theme_name: str, stylesheet_name: str) -> bool:
         """Trigger cache refresh for a specific stylesheet.
@@ -34,30 +57,29 @@ class CacheRefresher:
             True if cache refresh succeeded, False otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    self.endpoint,
-                    data={
-                        'theme_name': theme_name,
-                        'stylesheet': stylesheet_name,
-                        'token': self.token
-                    },
-                    headers={
-                        'Content-Type': 'application/x-www-form-urlencoded'
-                    }
-                )
-
-                # Check if request succeeded
-                if response.status_code != 200:
-                    return False
-
-                # Parse JSON response
-                try:
-                    result = response.json()
-                    return result.get('success', False)
-                except Exception:
-                    # Non-JSON response or malformed JSON
-                    return False
+            response = await self._get_client().post(
+                self.endpoint,
+                data={
+                    'theme_name': theme_name,
+                    'stylesheet': stylesheet_name,
+                    'token': self.token
+                },
+                headers={
+                    'Content-Type': 'application/x-www-form-urlencoded'
+                }
+            )
+
+            # Check if request succeeded
+            if response.status_code != 200:
+                return False
+
+            # Parse JSON response
+            try:
+                result = response.json()
+                return result.get('success', False)
+            except Exception:
+                # Non-JSON response or malformed JSON
+                return False
 
         except httpx.TimeoutException:
             # Timeout - log but don't crash
@@ -13,10 +13,12 @@ class SyncConfig:
         sync_root: Root directory for synced files
         auto_upload: Enable automatic file watching and sync
         cache_token: Optional authentication token for cache refresh
+        debounce_ms: Window in which repeat changes to one file are coalesced
     """
     sync_root: Path
     auto_upload: bool = True
     cache_token: str = ""
+    debounce_ms: int = 500
 
     @classmethod
     def from_env(cls) -> "SyncConfig":
@@ -26,6 +28,7 @@ class SyncConfig:
             MYBB_SYNC_ROOT: Root directory for synced files (default: ./mybb_sync)
             MYBB_AUTO_UPLOAD: Enable auto-sync (default: true)
             MYBB_CACHE_TOKEN: Optional auth token for cache refresh
+            MYBB_SYNC_DEBOUNCE_MS: Debounce window in milliseconds (default: 500)
 
         Returns:
             SyncConfig instance with values from environment
@@ -39,9 +42,11 @@ class SyncConfig:
 
         auto_upload = os.getenv("MYBB_AUTO_UPLOAD", "true").lower() in ("true", "1", "yes")
         cache_token = os.getenv("MYBB_CACHE_TOKEN", "")
+        debounce_ms = int(os.getenv("MYBB_SYNC_DEBOUNCE_MS", "500"))
 
         return cls(
             sync_root=sync_root,
             auto_upload=auto_upload,
             cache_token=cache_token,
+            debounce_ms=debounce_ms,
         )
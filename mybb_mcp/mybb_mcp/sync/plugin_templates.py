@@ -53,11 +53,11 @@ class PluginTemplateImporter:
         """
         # Skip cache if disabled
         if self._cache_disabled:
-            logger.debug(f"Template set cache DISABLED - querying database for: {theme_name}")
+            logger.debug("Template set cache DISABLED - querying database for: %s", theme_name)
             template_set = self.db.get_template_set_by_name(theme_name)
             if template_set:
                 return template_set['sid']
-            logger.warning(f"Template set not found: '{theme_name}', falling back to sid=-2")
+            logger.warning("Template set not found: '%s', falling back to sid=-2", theme_name)
             return None
 
         # Check cache first
@@ -68,11 +68,11 @@ class PluginTemplateImporter:
         template_set = self.db.get_template_set_by_name(theme_name)
         if template_set:
             sid = template_set['sid']
-            logger.debug(f"Template set lookup: '{theme_name}' -> sid={sid}")
+            logger.debug("Template set lookup: '%s' -> sid=%s", theme_name, sid)
             self._template_set_cache[theme_name] = sid
             return sid
         else:
-            logger.warning(f"Template set not found: '{theme_name}', falling back to sid=-2")
+            logger.warning("Template set not found: '%s', falling back to sid=-2", theme_name)
             self._template_set_cache[theme_name] = None
             return None
 
@@ -130,7 +130,7 @@ class PluginTemplateImporter:
             target_sid = self._get_template_set_sid(theme_name)
             if target_sid is None:
                 # Template set not found, fall back to master templates
-                logger.warning(f"Template set '{theme_name}' not found, using sid=-2 for {full_template_name}")
+                logger.warning("Template set '%s' not found, using sid=-2 for %s", theme_name, full_template_name)
                 target_sid = -2
         else:
             # Default to master templates
@@ -141,16 +141,16 @@ class PluginTemplateImporter:
 
         if existing:
             # Plugin template exists → UPDATE
-            logger.info(f"Updating plugin template: {full_template_name} (sid={target_sid})")
+            logger.info("Updating plugin template: %s (sid=%s)", full_template_name, target_sid)
             success = self.db.update_template(existing['tid'], content)
             if success:
-                logger.info(f"Successfully updated plugin template: {full_template_name}")
+                logger.info("Successfully updated plugin template: %s", full_template_name)
             else:
-                logger.error(f"Failed to update plugin template: {full_template_name}")
+                logger.error("Failed to update plugin template: %s", full_template_name)
             return success
         else:
             # Plugin template doesn't exist → INSERT
-            logger.info(f"Creating new plugin template: {full_template_name} (sid={target_sid})")
+            logger.info("Creating new plugin template: %s (sid=%s)", full_template_name, target_sid)
             tid = self.db.create_template(
                 title=full_template_name,
                 template=content,
@@ -158,8 +158,8 @@ class PluginTemplateImporter:
                 version="1800"  # Default MyBB version
             )
             if tid > 0:
-                logger.info(f"Successfully created plugin template: {full_template_name} (tid={tid}, sid={target_sid})")
+                logger.info("Successfully created plugin template: %s (tid=%s, sid=%s)", full_template_name, tid, target_sid)
                 return True
             else:
-                logger.error(f"Failed to create plugin template: {full_template_name}")
+                logger.error("Failed to create plugin template: %s", full_template_name)
                 return False
@@ -80,7 +80,8 @@ class DiskSyncService:
             self.plugin_template_importer,
             self.cache_refresher,
             self.router,
-            workspace_root=workspace_root
+            workspace_root=workspace_root,
+            debounce_seconds=config.debounce_ms / 1000
         )
 
     async def export_template_set(self, set_name: str) -> dict[str, Any]:
@@ -144,6 +145,18 @@ class DiskSyncService:
         self.watcher.start()
         return True
 
+    async def start_watcher_async(self) -> bool:
+        """Start the file watcher without blocking the event loop.
+
+        Returns:
+            True if watcher started successfully, False if already running
+        """
+        if self.watcher.is_running:
+            return False
+
+        await self.watcher.start_async()
+        return True
+
     def stop_watcher(self) -> bool:
         """Stop the file watcher.
 
@@ -206,7 +206,7 @@ class TemplateImporter:
         """
         # Skip cache if disabled
         if self._cache_disabled:
-            logger.debug(f"Template set cache DISABLED - querying database for: {set_name}")
+            logger.debug("Template set cache DISABLED - querying database for: %s", set_name)
             template_set = self.db.get_template_set_by_name(set_name)
             return template_set['sid'] if template_set else None
 
@@ -218,17 +218,17 @@ class TemplateImporter:
             if cache_age < self._cache_ttl:
                 # Cache hit - valid entry
                 logger.debug(
-                    f"Template set cache HIT: {set_name} (sid={self._set_cache[set_name]}, age={cache_age:.1f}s)"
+                    "Template set cache HIT: %s (sid=%s, age=%.1fs)", set_name, self._set_cache[set_name], cache_age
                 )
                 return self._set_cache[set_name]
             else:
                 # Cache expired
                 logger.debug(
-                    f"Template set cache EXPIRED: {set_name} (age={cache_age:.1f}s, ttl={self._cache_ttl}s)"
+                    "Template set cache EXPIRED: %s (age=%.1fs, ttl=%ss)", set_name, cache_age, self._cache_ttl
                 )
 
         # Cache miss or expired - query database
-        logger.debug(f"Template set cache MISS: {set_name} - querying database")
+        logger.debug("Template set cache MISS: %s - querying database", set_name)
         template_set = self.db.get_template_set_by_name(set_name)
 
         if template_set:
@@ -236,11 +236,11 @@ class TemplateImporter:
             # Store in cache with current timestamp
             self._set_cache[set_name] = sid
             self._cache_time[set_name] = current_time
-            logger.debug(f"Template set cached: {set_name} -> sid={sid}")
+            logger.debug("Template set cached: %s -> sid=%s", set_name, sid)
             return sid
         else:
             # Template set not found - do not cache negative results
-            logger.warning(f"Template set not found in database: {set_name}")
+            logger.warning("Template set not found in database: %s", set_name)
             return None
 
     async def import_template(self, set_name: str, template_name: str, content: str) -> bool:
@@ -285,7 +285,7 @@ class FileWatcher:
     """Watches sync directory for file changes."""
 
     # Batching configuration
-    BATCH_WINDOW_SECONDS = 0.1
+    DEFAULT_DEBOUNCE_SECONDS = 0.5
     MAX_BATCH_SIZE = 50
 
     def __init__(
@@ -296,7 +296,8 @@ class FileWatcher:
         plugin_template_importer: PluginTemplateImporter,
         cache_refresher: CacheRefresher,
         router: PathRouter,
-        workspace_root: Optional[Path] = None
+        workspace_root: Optional[Path] = None,
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS
     ):
         """Initialize file watcher.
 
@@ -308,8 +309,10 @@ class FileWatcher:
             cache_refresher: CacheRefresher instance
             router: PathRouter instance
             workspace_root: Optional workspace root to watch for plugin template changes
+            debounce_seconds: Window in which repeat changes to a file are coalesced
         """
         self.sync_root = sync_root
+        self.debounce_seconds = debounce_seconds
         self.workspace_root = workspace_root
         self.template_importer = template_importer
         self.stylesheet_importer = stylesheet_importer
@@ -401,70 +404,129 @@ class FileWatcher:
                 print(f"[disk-sync] Error processing {item.get('type', 'unknown')} item: {e}")
 
     async def _process_work_queue(self) -> None:
-        """Background task that processes queued file changes with batching.
+        """Background task that processes queued file changes with debouncing.
 
-        Collects items within BATCH_WINDOW_SECONDS using asyncio.wait_for(),
-        deduplicates by key, and processes in batches up to MAX_BATCH_SIZE.
+        The first change to a file is synced immediately. Further changes to
+        the same file within debounce_seconds are coalesced, and only the
+        latest is synced once the window closes. Items that are ready together
+        (up to MAX_BATCH_SIZE queued at once) are processed as one batch.
         """
-        pending: dict[str, dict] = {}
+        # dedup key -> monotonic time the key was last synced
+        last_sync: dict[str, float] = {}
+        # dedup key -> latest item waiting for its window to close
+        trailing: dict[str, dict] = {}
+        deadlines: dict[str, float] = {}
 
         while True:
             try:
-                # Wait for first item to start a new batch
-                item = await self.work_queue.get()
-                self.work_queue.task_done()
-                pending[self._make_dedup_key(item)] = item
-
-                # Collect more items within the batch window
-                deadline = time.monotonic() + self.BATCH_WINDOW_SECONDS
-                while len(pending) < self.MAX_BATCH_SIZE:
-                    remaining = deadline - time.monotonic()
-                    if remaining <= 0:
-                        break
-
-                    try:
-                        item = await asyncio.wait_for(
-                            self.work_queue.get(),
-                            timeout=remaining
-                        )
+                timeout = None
+                if deadlines:
+                    timeout = max(0.0, min(deadlines.values()) - time.monotonic())
+
+                items = []
+                try:
+                    items.append(await asyncio.wait_for(self.work_queue.get(), timeout))
+                    self.work_queue.task_done()
+                    while len(items) < self.MAX_BATCH_SIZE and not self.work_queue.empty():
+                        items.append(self.work_queue.get_nowait())
                         self.work_queue.task_done()
-                        pending[self._make_dedup_key(item)] = item
-                    except asyncio.TimeoutError:
-                        # Batch window expired, process what we have
-                        break
+                except asyncio.TimeoutError:
+                    # A trailing window closed
+                    pass
+
+                now = time.monotonic()
+                ready: dict[str, dict] = {}
+                for item in items:
+                    key = self._make_dedup_key(item)
+                    if key in trailing:
+                        trailing[key] = item
+                    elif now - last_sync.get(key, float('-inf')) >= self.debounce_seconds:
+                        ready[key] = item
+                    else:
+                        trailing[key] = item
+                        deadlines[key] = last_sync[key] + self.debounce_seconds
+
+                for key in [k for k, due in deadlines.items() if due <= now]:
+                    del deadlines[key]
+                    ready[key] = trailing.pop(key)
 
-                # Process the collected batch
-                await self._process_batch(list(pending.values()))
-                pending.clear()
+                if ready:
+                    await self._process_batch(list(ready.values()))
+                    for key in ready:
+                        last_sync[key] = now
+
+                # Forget keys whose window has long closed
+                if len(last_sync) > self.MAX_BATCH_SIZE * 20:
+                    last_sync = {
+                        k: t for k, t in last_sync.items()
+                        if now - t < self.debounce_seconds or k in deadlines
+                    }
 
             except asyncio.CancelledError:
                 # Task cancelled during shutdown
                 break
             except Exception as e:
                 print(f"[disk-sync] Processor error: {e}")
-                # Clear pending batch on error to avoid getting stuck
-                pending.clear()
+                # Drop waiting items on error to avoid getting stuck
+                trailing.clear()
+                deadlines.clear()
 
     def start(self) -> None:
         """Start watching the sync directory and optional workspace."""
-        # Start background processor task
+        self._start_processor()
+        self._start_observer()
+
+    async def start_async(self) -> None:
+        """Start watching without blocking the event loop.
+
+        The processor task is created on the loop; scheduling the recursive
+        watches and starting the observer run in a worker thread.
+        """
+        self._start_processor()
+        await asyncio.to_thread(self._start_observer)
+
+    def _start_processor(self) -> None:
+        """Start the background work queue processor (must run on the event loop)."""
         if self._processor_task is None or self._processor_task.done():
             self._processor_task = asyncio.create_task(self._process_work_queue())
 
+    def _start_observer(self) -> None:
+        """Schedule directory watches and start the watchdog observer."""
         # Create new observer if previous was stopped (observers cannot be restarted)
         if not self.observer.is_alive():
             self.observer = Observer()
 
-        # Start file system observer for sync directory
-        self.observer.schedule(self.handler, str(self.sync_root), recursive=True)
+        for path in self._watch_paths():
+            self.observer.schedule(self.handler, str(path), recursive=True)
 
-        # Also watch workspace if provided
         if self.workspace_root and self.workspace_root.exists():
-            self.observer.schedule(self.handler, str(self.workspace_root), recursive=True)
-            print(f"[disk-sync] Watching workspace: {self.workspace_root}")
+            print(f"[disk-sync] Watching workspace: {self.workspace_root / 'plugins'}")
 
         self.observer.start()
 
+    def _watch_paths(self) -> list[Path]:
+        """Directories that hold files the handler syncs.
+
+        Only these subtrees are watched, so writes elsewhere in the sync root
+        or workspace (plugin sources, themes, .git, ...) never reach Python.
+
+        Returns:
+            Existing directories to watch recursively
+        """
+        # template_sets/ and styles/ are the only synced trees under sync_root;
+        # create them so files exported later are picked up
+        paths = []
+        for name in ('template_sets', 'styles'):
+            path = self.sync_root / name
+            path.mkdir(parents=True, exist_ok=True)
+            paths.append(path)
+
+        # Plugin templates live under plugins/{visibility}/{codename}/templates*
+        if self.workspace_root and (self.workspace_root / 'plugins').is_dir():
+            paths.append(self.workspace_root / 'plugins')
+
+        return paths
+
     async def stop(self) -> None:
         """Stop watching the sync directory and wait for processor to finish."""
         # Stop file system observer
@@ -480,6 +542,9 @@ class FileWatcher:
                 # Expected when cancelling
                 pass
 
+        # Release the cache refresher's pooled HTTP connections
+        await self.cache_refresher.aclose()
+
     @property
     def is_running(self) -> bool:
         """Check if watcher is currently running.
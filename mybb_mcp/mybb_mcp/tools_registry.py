@@ -1,11 +1,14 @@
 """Tool definitions for MyBB MCP server.
 
-This module contains all 85+ tool definitions for the MyBB MCP server.
+This module contains all 121 tool definitions for the MyBB MCP server.
 Tools are organized by category and exported as ALL_TOOLS list.
 """
 
 from mcp.types import Tool
 
+# Shared input schema for tools that take no arguments (treat as read-only)
+_EMPTY_SCHEMA = {"type": "object", "properties": {}, "required": []}
+
 
 # ==================== Template Tools ====================
 
@@ -13,7 +16,7 @@ TEMPLATE_TOOLS = [
     Tool(
         name="mybb_list_template_sets",
         description="List all MyBB template sets. Template sets are collections of templates for a theme.",
-        inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema=_EMPTY_SCHEMA,
     ),
     Tool(
         name="mybb_list_templates",
@@ -54,7 +57,7 @@ TEMPLATE_TOOLS = [
     Tool(
         name="mybb_list_template_groups",
         description="List template groups for organization (calendar, forum, usercp, etc.).",
-        inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema=_EMPTY_SCHEMA,
     ),
     Tool(
         name="mybb_template_find_replace",
@@ -127,7 +130,7 @@ THEME_TOOLS = [
     Tool(
         name="mybb_list_themes",
         description="List all MyBB themes.",
-        inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema=_EMPTY_SCHEMA,
     ),
     Tool(
         name="mybb_list_stylesheets",
@@ -373,7 +376,7 @@ PLUGIN_TOOLS = [
     Tool(
         name="mybb_list_plugins",
         description="List plugins in the MyBB plugins directory.",
-        inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema=_EMPTY_SCHEMA,
     ),
     Tool(
         name="mybb_read_plugin",
@@ -467,7 +470,7 @@ PLUGIN_TOOLS = [
     Tool(
         name="mybb_plugin_list_installed",
         description="List installed/active plugins from datacache.",
-        inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema=_EMPTY_SCHEMA,
     ),
     Tool(
         name="mybb_plugin_info",
@@ -667,11 +670,7 @@ CONTENT_TOOLS = [
     Tool(
         name="mybb_forum_list",
         description="List all forums with hierarchy information.",
-        inputSchema={
-            "type": "object",
-            "properties": {},
-            "required": [],
-        },
+        inputSchema=_EMPTY_SCHEMA,
     ),
     Tool(
         name="mybb_forum_read",
@@ -913,29 +912,17 @@ SYNC_TOOLS = [
     Tool(
         name="mybb_sync_start_watcher",
         description="Start the file watcher to automatically sync template and stylesheet changes from disk to database.",
-        inputSchema={
-            "type": "object",
-            "properties": {},
-            "required": [],
-        },
+        inputSchema=_EMPTY_SCHEMA,
     ),
     Tool(
         name="mybb_sync_stop_watcher",
         description="Stop the file watcher.",
-        inputSchema={
-            "type": "object",
-            "properties": {},
-            "required": [],
-        },
+        inputSchema=_EMPTY_SCHEMA,
     ),
     Tool(
         name="mybb_sync_status",
         description="Get current sync service status (watcher state, sync directory, etc.).",
-        inputSchema={
-            "type": "object",
-            "properties": {},
-            "required": [],
-        },
+        inputSchema=_EMPTY_SCHEMA,
     ),
     Tool(
         name="mybb_workspace_sync",
@@ -1000,10 +987,7 @@ ORCHESTRATION_TOOLS = [
     Tool(
         name="mybb_server_status",
         description="Get the current status of the MyBB development server including port, PID, uptime, and MariaDB status.",
-        inputSchema={
-            "type": "object",
-            "properties": {}
-        }
+        inputSchema=_EMPTY_SCHEMA
     ),
     Tool(
         name="mybb_server_logs",
@@ -1026,8 +1010,11 @@ ORCHESTRATION_TOOLS = [
                     "description": "Only show entries from last N minutes"
                 },
                 "filter_keyword": {
-                    "type": "string",
-                    "description": "Filter logs by keyword (case-insensitive)"
+                    "anyOf": [
+                        {"type": "string"},
+                        {"type": "array", "items": {"type": "string"}}
+                    ],
+                    "description": "Filter logs by keyword (case-insensitive). Pass a list to match any of several keywords."
                 },
                 "limit": {
                     "type": "integer",
@@ -1043,6 +1030,11 @@ ORCHESTRATION_TOOLS = [
                     "type": "integer",
                     "description": "Pagination offset. Use with limit for paging through results.",
                     "default": 0
+                },
+                "parallel": {
+                    "type": "boolean",
+                    "description": "Parse large logs (>1MB) across all CPU cores. Gives exact match counts for selective filters on big logs.",
+                    "default": False
                 }
             }
         }
@@ -1182,6 +1174,8 @@ SEARCH_TOOLS = [
                 "date_to": {"type": "integer", "description": "Optional end timestamp (Unix epoch)."},
                 "limit": {"type": "integer", "description": "Maximum results (default 25, max 100).", "default": 25},
                 "offset": {"type": "integer", "description": "Pagination offset.", "default": 0},
+                "after_pid": {"type": "integer", "description": "Keyset cursor: list posts after this PID (faster than offset for deep pages; date order only, relevance pages use offset)."},
+                "sort_by": {"type": "string", "enum": ["date", "relevance"], "description": "Sort order. 'relevance' uses the FULLTEXT index (whole-word natural-language search) when the board has one.", "default": "date"},
             },
             "required": ["query"],
         },
@@ -1198,6 +1192,8 @@ SEARCH_TOOLS = [
                 "prefix": {"type": "integer", "description": "Optional thread prefix ID."},
                 "limit": {"type": "integer", "description": "Maximum results (default 25, max 100).", "default": 25},
                 "offset": {"type": "integer", "description": "Pagination offset.", "default": 0},
+                "after_tid": {"type": "integer", "description": "Keyset cursor: list threads after this TID (faster than offset for deep pages; date order only, relevance pages use offset)."},
+                "sort_by": {"type": "string", "enum": ["date", "relevance"], "description": "Sort order. 'relevance' uses the FULLTEXT index (whole-word natural-language search) when the board has one.", "default": "date"},
             },
             "required": ["query"],
         },
@@ -1212,6 +1208,7 @@ SEARCH_TOOLS = [
                 "field": {"type": "string", "description": "Field to search ('username' or 'email').", "default": "username"},
                 "limit": {"type": "integer", "description": "Maximum results (default 25, max 100).", "default": 25},
                 "offset": {"type": "integer", "description": "Pagination offset.", "default": 0},
+                "after_uid": {"type": "integer", "description": "Keyset cursor: list users after this UID (faster than offset for deep pages)."},
             },
             "required": ["query"],
         },
@@ -1227,9 +1224,11 @@ SEARCH_TOOLS = [
                 "forums": {"type": "array", "items": {"type": "integer"}, "description": "Optional list of forum IDs."},
                 "date_from": {"type": "integer", "description": "Optional start timestamp (Unix epoch)."},
                 "date_to": {"type": "integer", "description": "Optional end timestamp (Unix epoch)."},
-                "sort_by": {"type": "string", "description": "Sort order ('date' or 'relevance').", "default": "date"},
+                "sort_by": {"type": "string", "description": "Sort order ('date' or 'relevance'; relevance uses FULLTEXT indexes when present).", "default": "date"},
                 "limit": {"type": "integer", "description": "Maximum results per type (default 25, max 100).", "default": 25},
                 "offset": {"type": "integer", "description": "Pagination offset.", "default": 0},
+                "after_pid": {"type": "integer", "description": "Keyset cursor for posts: list posts after this PID."},
+                "after_tid": {"type": "integer", "description": "Keyset cursor for threads: list threads after this TID."},
             },
             "required": ["query"],
         },
@@ -1276,7 +1275,7 @@ ADMIN_TOOLS = [
     Tool(
         name="mybb_settinggroup_list",
         description="List all MyBB setting groups (categories for organizing settings).",
-        inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema=_EMPTY_SCHEMA,
     ),
     Tool(
         name="mybb_cache_read",
@@ -1302,7 +1301,7 @@ ADMIN_TOOLS = [
     Tool(
         name="mybb_cache_list",
         description="List all MyBB cache entries with their titles and sizes.",
-        inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema=_EMPTY_SCHEMA,
     ),
     Tool(
         name="mybb_cache_clear",
@@ -1317,12 +1316,12 @@ ADMIN_TOOLS = [
     Tool(
         name="mybb_stats_forum",
         description="Get forum statistics including total users, threads, posts, and newest member info.",
-        inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema=_EMPTY_SCHEMA,
     ),
     Tool(
         name="mybb_stats_board",
         description="Get comprehensive board statistics including forums, users, threads, posts, latest post, and most active forum.",
-        inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema=_EMPTY_SCHEMA,
     ),
     Tool(
         name="mybb_bridge_health_check",
@@ -1377,14 +1376,14 @@ MODERATION_TOOLS = [
     ),
     Tool(
         name="mybb_mod_approve_thread",
-        description="Approve or unapprove a thread (set visible=1 or visible=0).",
+        description="Approve or unapprove threads (set visible=1 or visible=0). Pass tids to moderate several threads in one call.",
         inputSchema={
             "type": "object",
             "properties": {
                 "tid": {"type": "integer", "description": "Thread ID"},
+                "tids": {"type": "array", "items": {"type": "integer"}, "description": "Thread IDs to moderate together (instead of tid)"},
                 "approve": {"type": "boolean", "description": "True to approve, False to unapprove", "default": True},
             },
-            "required": ["tid"],
         },
     ),
     Tool(
@@ -1401,14 +1400,14 @@ MODERATION_TOOLS = [
     ),
     Tool(
         name="mybb_mod_soft_delete_thread",
-        description="Soft delete or restore a thread (uses existing delete_thread method with soft=True).",
+        description="Soft delete or restore threads (uses existing delete_thread method with soft=True). Pass tids to moderate several threads in one call.",
         inputSchema={
             "type": "object",
             "properties": {
                 "tid": {"type": "integer", "description": "Thread ID"},
+                "tids": {"type": "array", "items": {"type": "integer"}, "description": "Thread IDs to moderate together (instead of tid)"},
                 "delete": {"type": "boolean", "description": "True to soft delete, False to restore", "default": True},
             },
-            "required": ["tid"],
         },
     ),
     Tool(
@@ -1453,6 +1452,33 @@ MODERATION_TOOLS = [
             "required": ["uid", "action"],
         },
     ),
+    Tool(
+        name="mybb_modlog_add_bulk",
+        description="Add several moderation log entries at once in a single bridge call (one multi-row INSERT; all or nothing).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entries": {
+                    "type": "array",
+                    "description": "Log entries to add",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "uid": {"type": "integer", "description": "User ID performing the action"},
+                            "fid": {"type": "integer", "description": "Forum ID (0 if not applicable)", "default": 0},
+                            "tid": {"type": "integer", "description": "Thread ID (0 if not applicable)", "default": 0},
+                            "pid": {"type": "integer", "description": "Post ID (0 if not applicable)", "default": 0},
+                            "action": {"type": "string", "description": "Action description"},
+                            "data": {"type": "string", "description": "Additional data (serialized)", "default": ""},
+                            "ipaddress": {"type": "string", "description": "IP address of moderator", "default": ""},
+                        },
+                        "required": ["uid", "action"],
+                    },
+                },
+            },
+            "required": ["entries"],
+        },
+    ),
 ]
 
 
@@ -1479,6 +1505,7 @@ USER_TOOLS = [
                 "usergroup": {"type": "integer", "description": "Filter by usergroup ID"},
                 "limit": {"type": "integer", "description": "Maximum number of users (1-100)", "default": 50},
                 "offset": {"type": "integer", "description": "Number of users to skip", "default": 0},
+                "after_uid": {"type": "integer", "description": "Keyset cursor: list users after this UID (faster than offset for deep pages)"},
             },
         },
     ),
@@ -1511,6 +1538,32 @@ USER_TOOLS = [
             "required": ["uid", "gid", "admin", "dateline"],
         },
     ),
+    Tool(
+        name="mybb_user_ban_bulk",
+        description="Ban several users at once after a single bridge capability check. A failed ban does not stop the rest.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "bans": {
+                    "type": "array",
+                    "description": "Bans to apply",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "uid": {"type": "integer", "description": "User ID to ban"},
+                            "gid": {"type": "integer", "description": "Banned usergroup ID"},
+                            "admin": {"type": "integer", "description": "Admin user ID performing the ban"},
+                            "dateline": {"type": "integer", "description": "Ban timestamp (Unix timestamp)"},
+                            "bantime": {"type": "string", "description": "Ban duration (e.g., 'perm', '---')", "default": "---"},
+                            "reason": {"type": "string", "description": "Ban reason", "default": ""},
+                        },
+                        "required": ["uid", "gid", "admin", "dateline"],
+                    },
+                },
+            },
+            "required": ["bans"],
+        },
+    ),
     Tool(
         name="mybb_user_unban",
         description="Remove user from banned list.",
@@ -1525,7 +1578,7 @@ USER_TOOLS = [
     Tool(
         name="mybb_usergroup_list",
         description="List all usergroups.",
-        inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema=_EMPTY_SCHEMA,
     ),
 ]
 
@@ -1648,5 +1701,5 @@ ALL_TOOLS = (
 )
 
 # Tool count verification
-EXPECTED_TOOL_COUNT = 119  # Was 118, added mybb_workspace_sync in workspace-sync-tool
+EXPECTED_TOOL_COUNT = 121  # Was 120, added mybb_modlog_add_bulk
 assert len(ALL_TOOLS) == EXPECTED_TOOL_COUNT, f"Expected {EXPECTED_TOOL_COUNT} tools, got {len(ALL_TOOLS)}"
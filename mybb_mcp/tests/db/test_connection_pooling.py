@@ -98,6 +98,101 @@ class TestConnectionPooling:
         assert pool1 == pool2
         mock_pool_class.assert_called_once()  # Only called once
 
+    @patch('mybb_mcp.db.connection.MySQLConnection')
+    @patch('mybb_mcp.db.connection.MySQLConnectionPool')
+    def test_prewarm_initializes_pool(self, mock_pool_class, mock_conn_class, db_config):
+        """Test that prewarm opens every pool connection ahead of the first query."""
+        db = MyBBDatabase(db_config, pool_size=3)
+
+        assert db.prewarm() is True
+        mock_pool_class.assert_called_once()
+        assert db._pool is not None
+        assert mock_conn_class.call_count == 3
+        assert mock_pool_class.return_value.add_connection.call_count == 3
+
+    @patch('mybb_mcp.db.connection.MySQLConnection')
+    @patch('mybb_mcp.db.connection.MySQLConnectionPool')
+    def test_prewarm_stamps_config_version_when_available(self, mock_pool_class, mock_conn_class, db_config):
+        """Test that prewarmed connections carry the pool's config version, if it has one."""
+        mock_pool_class.return_value._config_version = "v1"
+        db = MyBBDatabase(db_config, pool_size=2)
+
+        assert db.prewarm() is True
+        assert mock_conn_class.return_value.pool_config_version == "v1"
+
+    @patch('mybb_mcp.db.connection.MySQLConnection')
+    @patch('mybb_mcp.db.connection.MySQLConnectionPool')
+    def test_prewarm_without_config_version_uses_public_api(self, mock_pool_class, mock_conn_class, db_config):
+        """Test that connector releases lacking _config_version still get a prewarmed pool."""
+        mock_pool_class.return_value = Mock(spec=MySQLConnectionPool)
+        del mock_pool_class.return_value._config_version
+        opened = Mock(spec=["close"])
+        mock_conn_class.return_value = opened
+        db = MyBBDatabase(db_config, pool_size=2)
+
+        assert db.prewarm() is True
+        assert not hasattr(opened, "pool_config_version")
+        assert mock_pool_class.return_value.add_connection.call_count == 2
+
+    @patch('mybb_mcp.db.connection.MySQLConnection')
+    @patch('mybb_mcp.db.connection.MySQLConnectionPool')
+    def test_prewarm_failure_is_not_raised(self, mock_pool_class, mock_conn_class, db_config):
+        """Test that an unreachable database only makes prewarm return False."""
+        opened = Mock()
+        mock_conn_class.side_effect = [opened, MySQLError("Connection refused"), opened]
+        db = MyBBDatabase(db_config, pool_size=3)
+
+        assert db.prewarm() is False
+        assert db._pool is None
+        assert opened.close.call_count == 2
+        mock_pool_class.return_value.add_connection.assert_not_called()
+
+    @patch('mybb_mcp.db.connection.MySQLConnectionPool')
+    def test_close_pool_drains_and_resets(self, mock_pool_class, db_config):
+        """Test that close_pool drains idle connections and allows a fresh pool."""
+        db = MyBBDatabase(db_config, pool_size=3)
+        db._init_pool()
+
+        db.close_pool()
+
+        mock_pool_class.return_value._remove_connections.assert_called_once()
+        assert db._pool is None
+        db._init_pool()
+        assert mock_pool_class.call_count == 2
+
+    @patch('mybb_mcp.db.connection.MySQLConnectionPool')
+    def test_close_pool_drains_via_public_api(self, mock_pool_class, db_config):
+        """Test that close_pool still drains when the connector lacks _remove_connections."""
+        from mysql.connector.pooling import PoolError
+
+        pool = mock_pool_class.return_value = Mock(spec=MySQLConnectionPool)
+        del pool._remove_connections
+        idle = [Mock(), Mock()]
+        pool.get_connection.side_effect = [*idle, PoolError("Failed getting connection; pool exhausted")]
+        db = MyBBDatabase(db_config, pool_size=2)
+        db._init_pool()
+
+        db.close_pool()
+
+        assert pool.get_connection.call_count == 3
+        for cnx in idle:
+            cnx.disconnect.assert_called_once()
+            cnx.close.assert_not_called()
+        assert db._pool is None
+
+    def test_server_reuses_database_per_connection(self, db_config):
+        """Test that create_server's database cache returns one instance per connection."""
+        from dataclasses import replace
+        from mybb_mcp import server
+
+        server._DB_CACHE.clear()
+        try:
+            first = server._get_database(db_config)
+            assert server._get_database(replace(db_config)) is first
+            assert server._get_database(replace(db_config, database="other")) is not first
+        finally:
+            server._DB_CACHE.clear()
+
 
 class TestRetryLogic:
     """Test connection retry logic and exponential backoff."""
@@ -246,6 +341,22 @@ class TestCursorContextManager:
             # Verify connection was returned to pool
             mock_conn.close.assert_called_once()
 
+    def test_cursor_tracks_calling_function(self, db_config):
+        """Test that leak tracking records the code that opened the cursor."""
+        db = MyBBDatabase(db_config, pool_size=3)
+
+        with patch.object(MyBBDatabase, 'connect', return_value=Mock()), \
+                patch('mybb_mcp.db.connection._track_connection_acquired') as mock_track:
+            def open_cursor_here():
+                with db.cursor():
+                    pass
+
+            open_cursor_here()
+
+        caller = mock_track.call_args[0][1]
+        assert caller.splitlines()[0].endswith("in open_cursor_here")
+        assert "contextlib" not in caller
+
     @patch('mybb_mcp.db.connection.MySQLConnectionPool')
     @patch('mybb_mcp.db.connection.mysql.connector.connect')
     def test_cursor_commits_on_success(self, mock_connect, mock_pool_class, db_config_no_pool):
@@ -284,6 +395,25 @@ class TestCursorContextManager:
         mock_conn.rollback.assert_called_once()
         mock_conn.commit.assert_not_called()
 
+    @patch('mybb_mcp.db.connection.MySQLConnectionPool')
+    @patch('mybb_mcp.db.connection.mysql.connector.connect')
+    def test_streaming_cursor_is_unbuffered(self, mock_connect, mock_pool_class, db_config_no_pool):
+        """Test that streaming cursors skip client buffering and drain unread rows."""
+        mock_conn = Mock()
+        mock_conn.is_connected.return_value = True
+        mock_cursor = MagicMock()
+        mock_cursor.__iter__.return_value = iter([{'gid': 1}, {'gid': 2}])
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        db = MyBBDatabase(db_config_no_pool, pool_size=1)
+
+        with db.cursor(streaming=True) as cur:
+            assert next(iter(cur)) == {'gid': 1}
+
+        mock_conn.cursor.assert_called_once_with(dictionary=True, buffered=False)
+        mock_conn.consume_results.assert_called_once()
+
 
 class TestBackwardCompatibility:
     """Test backward compatibility with existing code."""
@@ -351,6 +481,50 @@ class TestConcurrentAccess:
         assert conn1 != conn2
         assert mock_pool.get_connection.call_count == 2
 
+    @patch('mybb_mcp.db.connection.mysql.connector.connect')
+    def test_cursor_slots_serialize_direct_connection(self, mock_connect, db_config_no_pool):
+        """Test that worker threads take turns on the single direct connection."""
+        import threading
+
+        mock_conn = Mock()
+        mock_conn.is_connected.return_value = True
+        mock_connect.return_value = mock_conn
+        db = MyBBDatabase(db_config_no_pool, pool_size=1)
+
+        active = []
+        overlaps = []
+
+        def worker():
+            with db.cursor():
+                active.append(1)
+                overlaps.append(len(active))
+                time.sleep(0.01)
+                active.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert overlaps == [1, 1, 1, 1]
+
+    @patch('mybb_mcp.db.connection.mysql.connector.connect')
+    def test_nested_cursor_reuses_slot(self, mock_connect, db_config_no_pool):
+        """Test that a nested cursor on the same thread does not wait on itself."""
+        mock_conn = Mock()
+        mock_conn.is_connected.return_value = True
+        mock_connect.return_value = mock_conn
+        db = MyBBDatabase(db_config_no_pool, pool_size=1)
+
+        with db.cursor():
+            with db.cursor():
+                pass
+
+        # Slot released afterwards
+        assert db._slots.acquire(timeout=0)
+        db._slots.release()
+
 
 class TestConfigurationOptions:
     """Test configuration options for pooling."""
@@ -0,0 +1,30 @@
+"""Tests for CacheRefresher HTTP client reuse."""
+
+import httpx
+import pytest
+
+from mybb_mcp.sync.cache import CacheRefresher
+
+
+@pytest.mark.asyncio
+async def test_refreshes_share_one_client():
+    """Consecutive refreshes reuse one client until it is closed."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"success": True})
+
+    refresher = CacheRefresher("http://localhost:8022/")
+    client = refresher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert await refresher.refresh_stylesheet("Default", "global.css") is True
+    assert await refresher.refresh_stylesheet("Default", "usercp.css") is True
+
+    assert refresher._get_client() is client
+    assert [str(r.url) for r in requests] == ["http://localhost:8022/cachecss.php"] * 2
+    assert b"stylesheet=usercp.css" in requests[1].content
+
+    await refresher.aclose()
+    assert client.is_closed
+    assert refresher._client is None
@@ -245,3 +245,28 @@ async def test_resume_on_export_error(file_watcher, mock_template_importer):
         await file_watcher._processor_task
     except asyncio.CancelledError:
         pass
+
+
+@pytest.mark.asyncio
+async def test_start_async_runs_observer(sync_root, mock_template_importer, mock_stylesheet_importer,
+                                         mock_cache_refresher, path_router):
+    """Test that start_async starts both the observer and the queue processor."""
+    file_watcher = FileWatcher(
+        sync_root=sync_root,
+        template_importer=mock_template_importer,
+        stylesheet_importer=mock_stylesheet_importer,
+        plugin_template_importer=Mock(),
+        cache_refresher=mock_cache_refresher,
+        router=path_router
+    )
+
+    await file_watcher.start_async()
+    try:
+        assert file_watcher.is_running is True
+        assert file_watcher._processor_task is not None
+        assert not file_watcher._processor_task.done()
+    finally:
+        await file_watcher.stop()
+
+    assert file_watcher.is_running is False
+    mock_cache_refresher.aclose.assert_awaited_once()
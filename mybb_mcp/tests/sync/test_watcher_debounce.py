@@ -0,0 +1,101 @@
+"""Tests for FileWatcher debouncing and watch scope."""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from mybb_mcp.sync.watcher import FileWatcher
+from mybb_mcp.sync.router import PathRouter
+
+
+@pytest.fixture
+def template_importer():
+    importer = Mock()
+    importer.import_template = AsyncMock()
+    return importer
+
+
+@pytest.fixture
+def file_watcher(tmp_path, template_importer):
+    """Create a FileWatcher with a short debounce window."""
+    return FileWatcher(
+        sync_root=tmp_path,
+        template_importer=template_importer,
+        stylesheet_importer=Mock(),
+        plugin_template_importer=Mock(),
+        cache_refresher=Mock(),
+        router=PathRouter(tmp_path),
+        debounce_seconds=0.2
+    )
+
+
+def _template_item(content):
+    return {
+        "type": "template",
+        "set_name": "Default Templates",
+        "template_name": "header",
+        "content": content
+    }
+
+
+@pytest.mark.asyncio
+async def test_first_change_syncs_immediately_and_burst_coalesces(file_watcher, template_importer):
+    """The first save syncs at once; a burst inside the window syncs only its last state."""
+    task = asyncio.create_task(file_watcher._process_work_queue())
+    try:
+        await file_watcher.work_queue.put(_template_item("v1"))
+        await asyncio.sleep(0.05)
+        assert template_importer.import_template.await_count == 1
+
+        for content in ("v2", "v3", "v4"):
+            await file_watcher.work_queue.put(_template_item(content))
+        await asyncio.sleep(0.05)
+        assert template_importer.import_template.await_count == 1
+
+        await asyncio.sleep(0.25)
+        assert template_importer.import_template.await_count == 2
+        template_importer.import_template.assert_awaited_with("Default Templates", "header", "v4")
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_different_files_are_not_delayed(file_watcher, template_importer):
+    """Changes to distinct files each sync immediately."""
+    task = asyncio.create_task(file_watcher._process_work_queue())
+    try:
+        await file_watcher.work_queue.put(_template_item("v1"))
+        other = _template_item("footer v1")
+        other["template_name"] = "footer"
+        await file_watcher.work_queue.put(other)
+        await asyncio.sleep(0.05)
+
+        assert template_importer.import_template.await_count == 2
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+def test_watch_paths_cover_only_synced_trees(tmp_path, template_importer):
+    """Only template_sets/, styles/ and the workspace plugins/ tree are watched."""
+    sync_root = tmp_path / "mybb_sync"
+    workspace = tmp_path / "plugin_manager"
+    (workspace / "plugins" / "public").mkdir(parents=True)
+    (workspace / "themes").mkdir()
+
+    watcher = FileWatcher(
+        sync_root=sync_root,
+        template_importer=template_importer,
+        stylesheet_importer=Mock(),
+        plugin_template_importer=Mock(),
+        cache_refresher=Mock(),
+        router=PathRouter(sync_root, workspace),
+        workspace_root=workspace
+    )
+
+    assert watcher._watch_paths() == [
+        sync_root / "template_sets",
+        sync_root / "styles",
+        workspace / "plugins",
+    ]
@@ -8,7 +8,7 @@ from unittest.mock import patch
 
 import pytest
 
-from mybb_mcp.bridge.client import MyBBBridgeClient
+from mybb_mcp.bridge.client import MyBBBridgeClient, get_bridge
 
 
 class DummyProc:
@@ -67,3 +67,46 @@ def test_call_missing_bridge_file(tmp_path: Path):
     assert result.success is False
     assert "MCP Bridge not found" in (result.error or "")
 
+
+def test_info_is_cached_until_invalidated(tmp_path: Path):
+    (tmp_path / "mcp_bridge.php").write_text("<?php", encoding="utf-8")
+    payload = {"success": True, "action": "info", "data": {"supported_actions": ["user:ban"]}}
+    with patch("subprocess.run", return_value=DummyProc(stdout=json.dumps(payload))) as run:
+        first = MyBBBridgeClient(tmp_path, timeout=1).info()
+        second = MyBBBridgeClient(tmp_path, timeout=1).info()
+        assert run.call_count == 1
+        assert second is first
+        assert second.data["supported_actions"] == ["user:ban"]
+
+        MyBBBridgeClient(tmp_path, timeout=1).invalidate_info()
+        MyBBBridgeClient(tmp_path, timeout=1).info()
+        assert run.call_count == 2
+
+
+def test_failed_info_is_not_cached(tmp_path: Path):
+    (tmp_path / "mcp_bridge.php").write_text("<?php", encoding="utf-8")
+    client = MyBBBridgeClient(tmp_path, timeout=1)
+    with patch("subprocess.run", return_value=DummyProc(stdout="{not json}")) as run:
+        assert client.info().success is False
+        assert client.info().success is False
+        assert run.call_count == 2
+
+
+def test_call_batch_runs_one_call_per_action(tmp_path: Path):
+    (tmp_path / "mcp_bridge.php").write_text("<?php", encoding="utf-8")
+    client = MyBBBridgeClient(tmp_path, timeout=1)
+    ban = {"success": True, "action": "user:ban", "data": {}}
+    denied = {"success": False, "action": "user:ban", "error": "Cannot ban a super admin"}
+    procs = [DummyProc(stdout=json.dumps(denied)), DummyProc(stdout=json.dumps(ban))]
+    with patch("subprocess.run", side_effect=procs) as run:
+        results = client.call_batch([("user:ban", {"uid": 1}), ("user:ban", {"uid": 3})])
+    assert [r.success for r in results] == [False, True]
+    assert results[0].error == "Cannot ban a super admin"
+    assert run.call_count == 2
+    assert "--uid=3" in run.call_args[0][0]
+
+
+def test_get_bridge_reuses_client_per_root(tmp_path: Path):
+    first = get_bridge(tmp_path)
+    assert get_bridge(str(tmp_path)) is first
+    assert get_bridge(tmp_path / "other") is not first
@@ -57,6 +57,14 @@ class TestConfigurationValidation:
                 assert config.db.database == "test_db"
                 assert config.db.user == "test_user"
 
+    def test_sync_can_be_disabled(self):
+        """Test that MYBB_SYNC_ENABLED=false turns off disk sync."""
+        with patch('mybb_mcp.config.load_dotenv'):
+            with patch.dict(os.environ, {"MYBB_DB_PASS": "pw"}, clear=True):
+                assert load_config().sync_enabled is True
+            with patch.dict(os.environ, {"MYBB_DB_PASS": "pw", "MYBB_SYNC_ENABLED": "false"}, clear=True):
+                assert load_config().sync_enabled is False
+
     def test_error_message_is_actionable(self):
         """Test that error message provides clear guidance."""
         # Mock load_dotenv to prevent .env file loading
@@ -342,3 +342,58 @@ class TestPhase6bListQueryTools:
         # Verification: Pattern detects mismatch
         assert sync_status == 'workspace_ahead'
         # Handler should generate warning in this case
+
+
+class TestSharedPluginManager:
+    """Test that handlers share one PluginManager instance."""
+
+    def test_plugin_manager_created_once(self, monkeypatch):
+        """Repeated lookups return the same manager without rebuilding it."""
+        from mybb_mcp.handlers import common
+
+        monkeypatch.setattr(common, "_plugin_manager", None)
+        common.ensure_repo_on_path()
+        with patch('plugin_manager.manager.PluginManager') as mock_cls:
+            first = common.get_plugin_manager()
+            second = common.get_plugin_manager()
+
+        assert first is second is mock_cls.return_value
+        mock_cls.assert_called_once_with()
+        assert (common.REPO_ROOT / "plugin_manager" / "manager.py").is_file()
+
+    def test_project_db_opened_once_when_present(self, monkeypatch, tmp_path):
+        """The plugin handlers' ProjectDatabase is opened once, and only if it exists."""
+        from mybb_mcp.handlers import common, plugins
+
+        common.ensure_repo_on_path()
+        db_path = tmp_path / "projects.db"
+        monkeypatch.setattr(plugins, "_project_db", None)
+        monkeypatch.setattr(plugins, "_project_db_path", db_path)
+
+        assert plugins._get_project_db() is None
+        assert not db_path.exists()
+
+        db_path.touch()
+        with patch('plugin_manager.database.ProjectDatabase') as mock_cls:
+            first = plugins._get_project_db()
+            second = plugins._get_project_db()
+
+        assert first is second is mock_cls.return_value
+        mock_cls.assert_called_once_with(db_path)
+
+    def test_repo_added_to_sys_path_once(self, monkeypatch):
+        """sys.path is scanned and edited only on the first call."""
+        import sys
+        from mybb_mcp.handlers import common
+
+        repo = str(common.REPO_ROOT)
+        monkeypatch.setattr(sys, "path", [p for p in sys.path if p != repo])
+        monkeypatch.setattr(common, "_repo_on_path", False)
+
+        common.ensure_repo_on_path()
+        common.ensure_repo_on_path()
+        assert sys.path.count(repo) == 1
+
+        sys.path.remove(repo)
+        common.ensure_repo_on_path()
+        assert repo not in sys.path
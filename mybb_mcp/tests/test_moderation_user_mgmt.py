@@ -10,7 +10,7 @@ Tests cover:
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 from mybb_mcp.db.connection import MyBBDatabase
 from mybb_mcp.config import DatabaseConfig
 
@@ -216,6 +216,22 @@ class TestUserManagementSecurity:
                 assert 'uid' in user
                 assert 'username' in user
 
+    def test_list_users_keyset_pagination(self, mock_db_config):
+        """Verify list_users seeks by UID instead of using OFFSET when after_uid is given."""
+        db = MyBBDatabase(mock_db_config)
+
+        with patch.object(db, 'cursor') as mock_cursor_ctx:
+            mock_cursor = MagicMock()
+            mock_cursor.fetchall.return_value = []
+            mock_cursor_ctx.return_value.__enter__.return_value = mock_cursor
+
+            db.list_users(usergroup=2, limit=20, after_uid=150)
+
+            query, params = mock_cursor.execute.call_args[0]
+            assert "usergroup = %s AND uid < %s" in query
+            assert "OFFSET" not in query
+            assert params == (2, 150, 20)
+
     def test_update_user_group_uses_parameterized_query(self, mock_db_config):
         """Verify update_user_group uses parameterized queries."""
         db = MyBBDatabase(mock_db_config)
@@ -338,7 +354,8 @@ class TestModerationLogging:
             assert 20 in params
 
 
-def test_moderation_and_user_tools_registered():
+@pytest.mark.asyncio
+async def test_moderation_and_user_tools_registered():
     """Verify all 14 moderation and user management tools are properly defined."""
     from mybb_mcp.config import load_config
     from mybb_mcp.server import create_server
@@ -348,9 +365,10 @@ def test_moderation_and_user_tools_registered():
     # Mock the sync service to prevent FileWatcher async event loop issues
     with patch('mybb_mcp.sync.DiskSyncService') as mock_sync:
         mock_sync_instance = MagicMock()
+        mock_sync_instance.start_watcher_async = AsyncMock(return_value=True)
         mock_sync.return_value = mock_sync_instance
 
-        server = create_server(config)
+        server = await create_server(config)
 
         # Get all tool names
         # Note: We need to extract tool names from the server
@@ -379,3 +397,66 @@ def test_moderation_and_user_tools_registered():
         # This test verifies imports work correctly
         # Full integration testing would require actual database setup
         assert server is not None
+
+
+class TestModerationHandlers:
+    """Test moderation handlers that go through the bridge."""
+
+    @pytest.fixture
+    def bridge(self):
+        from mybb_mcp.bridge import BridgeResult
+
+        bridge = MagicMock()
+        info = BridgeResult(success=True, action="info", data={
+            "supported_actions": ["mod:approve_thread", "mod:soft_delete_thread", "modlog:add", "modlog:add_bulk"]
+        })
+
+        async def call_async(action, **kwargs):
+            if action == "info":
+                return info
+            return BridgeResult(success=True, action=action)
+
+        bridge.call_async = AsyncMock(side_effect=call_async)
+        bridge.info_async = AsyncMock(return_value=info)
+        return bridge
+
+    @pytest.mark.asyncio
+    async def test_approve_threads_sends_one_bridge_call(self, bridge):
+        """Approving several threads passes all tids to a single bridge call."""
+        from mybb_mcp.handlers import moderation
+
+        with patch.object(moderation, "get_bridge", return_value=bridge):
+            result = await moderation.handle_mod_approve_thread({"tids": [3, 4, 5]}, None, MagicMock(), None)
+
+        bridge.call_async.assert_called_with("mod:approve_thread", tids="3,4,5", approve=1)
+        assert "Threads 3,4,5 have been approved" in result
+
+    @pytest.mark.asyncio
+    async def test_soft_delete_thread_requires_tid_or_tids(self, bridge):
+        """Without tid or tids the handler errors before touching the bridge."""
+        from mybb_mcp.handlers import moderation
+
+        with patch.object(moderation, "get_bridge", return_value=bridge):
+            result = await moderation.handle_mod_soft_delete_thread({"tids": []}, None, MagicMock(), None)
+
+        assert result == "Error: 'tid' or 'tids' is required."
+        bridge.call_async.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_modlog_add_bulk_sends_one_bridge_call(self, bridge):
+        """Bulk log entries go to modlog:add_bulk as one JSON payload."""
+        import json
+        from mybb_mcp.handlers import moderation
+
+        entries = [{"uid": 1, "action": "Thread approved", "tid": tid} for tid in (3, 4)]
+        with patch.object(moderation, "get_bridge", return_value=bridge):
+            result = await moderation.handle_modlog_add_bulk({"entries": entries}, None, MagicMock(), None)
+
+        bridge.call_async.assert_awaited_once()
+        action, kwargs = bridge.call_async.call_args.args[0], bridge.call_async.call_args.kwargs
+        assert action == "modlog:add_bulk"
+        sent = json.loads(kwargs["entries_json"])
+        assert [entry["tid"] for entry in sent] == [3, 4]
+        assert sent[1]["logaction"] == "Thread approved"
+        assert "2 entries added." in result
+        bridge.info_async.assert_awaited_once()
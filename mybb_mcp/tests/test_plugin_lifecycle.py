@@ -172,3 +172,178 @@ class TestPluginSecurity:
             call_args = mock_cursor.execute.call_args
             assert "%s" in call_args[0][0]  # SQL has placeholders
             assert isinstance(call_args[0][1], tuple)  # params is tuple
+
+
+class TestPluginReadHandlers:
+    """Test plugin list/read handlers against legacy (unmanaged) plugin files."""
+
+    @pytest.fixture
+    def legacy_config(self, tmp_path, monkeypatch):
+        """Point the handlers at a temp TestForum with no workspace database."""
+        from mybb_mcp.handlers import plugins
+
+        monkeypatch.setattr(plugins, "_get_project_db", lambda: None)
+        (tmp_path / "inc" / "plugins").mkdir(parents=True)
+        return MagicMock(mybb_root=tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_read_plugin_legacy_file(self, legacy_config):
+        """Test an existing legacy plugin is read and a missing one reported."""
+        from mybb_mcp.handlers.plugins import handle_read_plugin
+
+        (legacy_config.mybb_root / "inc" / "plugins" / "hello.php").write_text("<?php // hello")
+
+        result = await handle_read_plugin({"name": "hello"}, None, legacy_config, None)
+        assert "<?php // hello" in result
+        assert "Legacy:" in result
+
+        result = await handle_read_plugin({"name": "missing"}, None, legacy_config, None)
+        assert result == "Plugin 'missing' not found in workspace or TestForum."
+
+    @pytest.mark.asyncio
+    async def test_analyze_plugin_missing_file(self, legacy_config):
+        """Test analysis of a plugin with no file reports it as not found."""
+        from mybb_mcp.handlers.plugins import handle_analyze_plugin
+
+        result = await handle_analyze_plugin({"name": "missing"}, None, legacy_config, None)
+        assert result == "Plugin 'missing' not found."
+
+    @pytest.mark.asyncio
+    async def test_list_plugins_skips_index_and_workspace(self, legacy_config, monkeypatch):
+        """Test legacy listing skips index.php, non-PHP files and workspace plugins."""
+        from mybb_mcp.handlers import plugins
+
+        plugins_dir = legacy_config.mybb_root / "inc" / "plugins"
+        for name in ("index.php", "hello.php", "managed.php", "readme.txt"):
+            (plugins_dir / name).write_text("")
+        project_db = MagicMock()
+        project_db.list_projects.return_value = [
+            {"codename": codename, "display_name": codename.title(), "status": "development",
+             "visibility": "public", "version": "1.0.0"}
+            for codename in ("managed", "alpha")
+        ]
+        monkeypatch.setattr(plugins, "_get_project_db", lambda: project_db)
+
+        result = await plugins.handle_list_plugins({}, None, legacy_config, None)
+
+        assert "- `hello` (Not in workspace)" in result
+        assert result.index("(`alpha`)") < result.index("(`managed`)")
+        assert "`managed` (Not in workspace)" not in result
+        assert "index" not in result
+        assert "readme" not in result
+
+    @pytest.mark.asyncio
+    async def test_plugin_info_and_analysis_parse_source(self, legacy_config):
+        """Test _info() fields, hooks and prefixed functions are extracted."""
+        from mybb_mcp.handlers.plugins import handle_analyze_plugin, handle_plugin_info
+
+        (legacy_config.mybb_root / "inc" / "plugins" / "hello.php").write_text(
+            '<?php\n'
+            '$plugins->add_hook("index_start", "hello_index");\n'
+            'function hello_info()\n{\n    return array(\n'
+            '        "name" => "Hello",\n        "author" => "Dev",\n        "authorsite" => "https://example.com",\n'
+            '        "version" => "1.2",\n    );\n}\n'
+            'function hello_index() {}\n'
+            'function helloworld_other() {}\n'
+        )
+
+        info = await handle_plugin_info({"name": "hello"}, None, legacy_config, None)
+        assert info.splitlines()[1:] == [
+            "", "**Name**: Hello", "**Author**: Dev", "**Authorsite**: https://example.com", "**Version**: 1.2",
+        ]
+
+        analysis = await handle_analyze_plugin({"name": "hello"}, None, legacy_config, None)
+        assert "## Hooks (1)\n- `index_start`" in analysis
+        assert "## Functions (2)\n- `hello_info()`\n- `hello_index()`" in analysis
+        assert "- Database: No" in analysis
+
+        (legacy_config.mybb_root / "inc" / "plugins" / "hello.php").write_text(
+            '<?php\n$db->Create_Table("hello", "id INT");\n'
+        )
+        analysis = await handle_analyze_plugin({"name": "hello"}, None, legacy_config, None)
+        assert "- Database: Yes" in analysis
+
+    def test_meta_json_parsed_once_per_mtime(self, tmp_path):
+        """Test meta.json is re-parsed only when its mtime changes."""
+        import os
+        from mybb_mcp.handlers.plugins import _load_meta
+
+        meta_path = tmp_path / "meta.json"
+        meta_path.write_text('{"plugin": {"name": "Hello"}}')
+
+        first = _load_meta(meta_path)
+        assert _load_meta(meta_path) is first
+
+        meta_path.write_text('{"plugin": {"name": "Hello v2"}}')
+        stat = meta_path.stat()
+        os.utime(meta_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert _load_meta(meta_path)["plugin"]["name"] == "Hello v2"
+
+        with pytest.raises(FileNotFoundError):
+            _load_meta(tmp_path / "missing.json")
+
+    @pytest.mark.asyncio
+    async def test_analyze_plugin_without_plugin_manager(self, legacy_config, monkeypatch):
+        """Test the ImportError fallback gives the same legacy analysis."""
+        from mybb_mcp.handlers import plugins
+
+        (legacy_config.mybb_root / "inc" / "plugins" / "hello.php").write_text("<?php function hello_info() {}")
+        expected = await plugins.handle_analyze_plugin({"name": "hello"}, None, legacy_config, None)
+
+        def no_plugin_manager():
+            raise ImportError("plugin_manager")
+
+        monkeypatch.setattr(plugins, "_get_project_db", no_plugin_manager)
+        result = await plugins.handle_analyze_plugin({"name": "hello"}, None, legacy_config, None)
+
+        assert result == expected
+        assert "**Source:** Legacy (Unmanaged)" in result
+
+    @pytest.mark.asyncio
+    async def test_legacy_analysis_runs_in_worker_thread(self, legacy_config):
+        """Test the legacy read-and-scan analysis is handed to a worker thread."""
+        import threading
+        from mybb_mcp.handlers import plugins
+
+        threads = []
+        original = plugins._analyze_legacy_plugin
+
+        def record_thread(pname, plugins_dir):
+            threads.append(threading.current_thread())
+            return original(pname, plugins_dir)
+
+        with patch.object(plugins, "_analyze_legacy_plugin", record_thread):
+            result = await plugins.handle_analyze_plugin({"name": "missing"}, None, legacy_config, None)
+
+        assert result == "Plugin 'missing' not found."
+        assert threads and threads[0] is not threading.main_thread()
+
+
+class TestInstalledPluginsCache:
+    """Test mybb_plugin_list_installed reuses the plugins datacache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_plugins_cache(self):
+        from mybb_mcp.handlers import plugins
+        plugins.invalidate_plugins_cache()
+        yield
+        plugins.invalidate_plugins_cache()
+
+    @pytest.mark.asyncio
+    async def test_listing_cached_until_cache_rebuild(self):
+        """Test repeated listings query once until the plugins cache is rebuilt."""
+        from mybb_mcp.handlers.admin import handle_cache_rebuild
+        from mybb_mcp.handlers.plugins import handle_plugin_list_installed
+
+        db = MagicMock()
+        db.get_plugins_cache.return_value = {"plugins": ["hello"], "raw": 'a:1:{i:0;s:5:"hello";}'}
+        db.rebuild_cache.return_value = {"message": "Cache rebuilt", "rows_affected": 1}
+
+        result = await handle_plugin_list_installed({}, db, None, None)
+        await handle_plugin_list_installed({}, db, None, None)
+        assert "- `hello`" in result
+        assert db.get_plugins_cache.call_count == 1
+
+        await handle_cache_rebuild({"cache_type": "plugins"}, db, None, None)
+        await handle_plugin_list_installed({}, db, None, None)
+        assert db.get_plugins_cache.call_count == 2
@@ -156,6 +156,98 @@ class TestSearchPosts:
             # Verify malicious input is in params, not query string
             assert malicious_query not in call_args[0][0]
 
+    def test_search_posts_keyset_cursor(self, mock_db_config):
+        """Test that after_pid seeks past the cursor post instead of using OFFSET."""
+        db = MyBBDatabase(mock_db_config)
+
+        with patch.object(db, 'cursor') as mock_cursor:
+            mock_cursor.return_value.__enter__.return_value.fetchall.return_value = []
+
+            db.search_posts(query="test", limit=10, after_pid=42)
+
+            sql, params = mock_cursor.return_value.__enter__.return_value.execute.call_args[0]
+            assert 'OFFSET' not in sql
+            assert 'p.dateline < (SELECT dateline FROM mybb_posts WHERE pid = %s)' in sql
+            assert sql.rstrip().endswith('ORDER BY p.dateline DESC, p.pid DESC LIMIT %s')
+            assert params[-4:] == [42, 42, 42, 10]
+
+    def test_search_posts_peek_fetches_one_extra_row(self, mock_db_config):
+        """Test that peek asks for limit + 1 rows instead of counting matches."""
+        db = MyBBDatabase(mock_db_config)
+
+        with patch.object(db, 'cursor') as mock_cursor:
+            mock_cursor.return_value.__enter__.return_value.fetchall.return_value = []
+
+            db.search_posts(query="test", limit=100, after_pid=42, peek=True)
+
+            sql, params = mock_cursor.return_value.__enter__.return_value.execute.call_args[0]
+            assert 'COUNT(' not in sql
+            assert params[-1] == 101
+
+
+    def test_search_posts_relevance_uses_fulltext(self, mock_db_config):
+        """Test that relevance sorting uses MATCH ... AGAINST when the index exists."""
+        db = MyBBDatabase(mock_db_config)
+        db._fulltext_cache[('posts', 'message')] = True
+
+        with patch.object(db, 'cursor') as mock_cursor:
+            mock_cursor.return_value.__enter__.return_value.fetchall.return_value = []
+
+            db.search_posts(query="python", sort_by="relevance")
+
+            sql, params = mock_cursor.return_value.__enter__.return_value.execute.call_args[0]
+            assert 'LIKE' not in sql
+            assert 'AND MATCH(p.message) AGAINST(%s IN NATURAL LANGUAGE MODE)' in sql
+            assert 'ORDER BY MATCH(p.message) AGAINST(%s IN NATURAL LANGUAGE MODE) DESC' in sql
+            assert params == ["python", "python", 25, 0]
+
+    def test_search_posts_relevance_treats_operators_as_text(self, mock_db_config):
+        """Test that a hyphenated query is not run as boolean-mode operators."""
+        db = MyBBDatabase(mock_db_config)
+        db._fulltext_cache[('posts', 'message')] = True
+
+        with patch.object(db, 'cursor') as mock_cursor:
+            mock_cursor.return_value.__enter__.return_value.fetchall.return_value = []
+
+            db.search_posts(query="pre-release", sort_by="relevance")
+
+            sql, params = mock_cursor.return_value.__enter__.return_value.execute.call_args[0]
+            assert 'BOOLEAN MODE' not in sql
+            assert sql.count('AGAINST(%s IN NATURAL LANGUAGE MODE)') == 2
+            assert params[:2] == ["pre-release", "pre-release"]
+
+    def test_search_posts_relevance_ignores_keyset_cursor(self, mock_db_config):
+        """Test that relevance pages stay in score order and page by offset."""
+        db = MyBBDatabase(mock_db_config)
+        db._fulltext_cache[('posts', 'message')] = True
+
+        with patch.object(db, 'cursor') as mock_cursor:
+            mock_cursor.return_value.__enter__.return_value.fetchall.return_value = []
+
+            db.search_posts(query="python", sort_by="relevance", offset=25, after_pid=42)
+
+            sql, params = mock_cursor.return_value.__enter__.return_value.execute.call_args[0]
+            assert 'SELECT dateline' not in sql
+            assert 'ORDER BY MATCH(p.message) AGAINST(%s IN NATURAL LANGUAGE MODE) DESC' in sql
+            assert params == ["python", "python", 25, 25]
+
+    def test_search_posts_relevance_without_index_falls_back(self, mock_db_config):
+        """Test that relevance sorting keeps the LIKE search when no FULLTEXT index exists."""
+        db = MyBBDatabase(mock_db_config)
+
+        with patch.object(db, 'cursor') as mock_cursor:
+            mock_cursor.return_value.__enter__.return_value.fetchone.return_value = None
+            mock_cursor.return_value.__enter__.return_value.fetchall.return_value = []
+
+            db.search_posts(query="python", sort_by="relevance")
+            db.search_posts(query="python", sort_by="relevance")
+
+            sql = mock_cursor.return_value.__enter__.return_value.execute.call_args[0][0]
+            assert 'p.message LIKE %s' in sql
+            assert 'MATCH' not in sql
+            # Index lookup is cached: 1 information_schema query + 2 searches
+            assert mock_cursor.return_value.__enter__.return_value.execute.call_count == 3
+
 
 class TestSearchThreads:
     """Test search_threads functionality."""
@@ -301,6 +393,29 @@ class TestSearchUsers:
         with pytest.raises(ValueError, match="field must be 'username' or 'email'"):
             db.search_users(query="test", field="invalid")
 
+    def test_search_users_keyset_cursor(self):
+        """Test that after_uid pages forward by username without OFFSET."""
+        config = DatabaseConfig(
+            host="localhost",
+            port=3306,
+            database="test_mybb",
+            user="test",
+            password="test",
+            prefix="mybb_"
+        )
+        db = MyBBDatabase(config)
+
+        with patch.object(db, 'cursor') as mock_cursor:
+            mock_cursor.return_value.__enter__.return_value.fetchall.return_value = []
+
+            db.search_users(query="adm", after_uid=7)
+
+            sql, params = mock_cursor.return_value.__enter__.return_value.execute.call_args[0]
+            assert 'OFFSET' not in sql
+            assert 'username > (SELECT username FROM mybb_users WHERE uid = %s)' in sql
+            assert params[1:] == [7, 7, 7, 25]
+
+
 
 class TestSearchAdvanced:
     """Test search_advanced functionality."""
@@ -434,3 +549,69 @@ class TestSecurityValidation:
             query = call_args[0][0]
             # Verify visible=1 filter is in query
             assert 'visible = 1' in query or 'visible=1' in query
+
+
+class TestSearchHandlers:
+    """Test the async search handlers."""
+
+    @pytest.mark.asyncio
+    async def test_search_runs_off_event_loop_thread(self):
+        """Test that the blocking database search runs on a worker thread."""
+        import threading
+        from mybb_mcp.handlers.search import handle_search_threads
+
+        loop_thread = threading.get_ident()
+        seen = {}
+
+        def search_threads(**kwargs):
+            seen['thread'] = threading.get_ident()
+            return [{'tid': 5, 'subject': 'Python', 'username': 'admin',
+                     'replies': 0, 'views': 1, 'lastpost': 1705500000}]
+
+        db = MagicMock()
+        db.search_threads.side_effect = search_threads
+
+        result = await handle_search_threads({'query': 'Python'}, db, None, None)
+
+        assert seen['thread'] != loop_thread
+        assert '(1 found)' in result
+        assert 'Next page' not in result
+
+    @pytest.mark.asyncio
+    async def test_search_peeks_one_row_for_next_page(self):
+        """Test that an extra fetched row marks more results without a COUNT."""
+        from mybb_mcp.handlers.search import handle_search_users
+
+        db = MagicMock()
+        db.search_users.return_value = [
+            {'uid': uid, 'username': f'user{uid}', 'usergroup': 2,
+             'postnum': 0, 'threadnum': 0, 'regdate': 1705500000}
+            for uid in (3, 4, 5)
+        ]
+
+        result = await handle_search_users({'query': 'user', 'limit': 2}, db, None, None)
+
+        assert db.search_users.call_args.kwargs['limit'] == 2
+        assert db.search_users.call_args.kwargs['peek'] is True
+        assert '(2 found, more available)' in result
+        assert '| 5 |' not in result
+        assert '*Next page: `after_uid=4`*' in result
+
+    @pytest.mark.asyncio
+    async def test_relevance_search_hints_offset_page(self):
+        """Test that relevance-ranked results point at the next offset, not a cursor."""
+        from mybb_mcp.handlers.search import handle_search_posts
+
+        db = MagicMock()
+        db.search_posts.return_value = [
+            {'pid': pid, 'thread_subject': 'Python', 'username': 'admin',
+             'dateline': 1705500000, 'message': 'python tips'}
+            for pid in (9, 3, 7)
+        ]
+
+        result = await handle_search_posts(
+            {'query': 'python', 'limit': 2, 'offset': 4, 'sort_by': 'relevance'}, db, None, None
+        )
+
+        assert '*Next page: `offset=6`*' in result
+        assert 'after_pid' not in result
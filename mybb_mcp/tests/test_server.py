@@ -0,0 +1,27 @@
+"""Tests for server-level argument checks."""
+
+from types import SimpleNamespace
+
+from mybb_mcp import server
+
+
+def test_required_arguments_read_from_schemas():
+    """Test that required names are collected once per tool."""
+    tools = [
+        SimpleNamespace(name="mybb_read_template", inputSchema={"type": "object", "required": ["title"]}),
+        SimpleNamespace(name="mybb_list_templates", inputSchema={"type": "object", "properties": {}}),
+    ]
+
+    assert server._required_arguments(tools) == {
+        "mybb_read_template": ("title",),
+        "mybb_list_templates": (),
+    }
+
+
+def test_missing_arguments_reported_in_schema_order():
+    """Test that absent required arguments are listed, present ones are not."""
+    required = ("title", "find", "replace")
+
+    assert server._missing_arguments(required, {"find": "a", "replace": ""}) == ["title"]
+    assert server._missing_arguments(required, None) == ["title", "find", "replace"]
+    assert server._missing_arguments((), None) == []
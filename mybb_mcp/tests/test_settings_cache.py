@@ -426,3 +426,103 @@ class TestSecurity:
             # Verify both values are parameterized
             call_args = mock_cursor.execute.call_args
             assert call_args[0][1] == (malicious_value, malicious_name)
+
+
+class TestSettingAndCacheHandlers:
+    """Test the read caches in front of mybb_setting_get and mybb_cache_read."""
+
+    @pytest.fixture(autouse=True)
+    def clear_read_caches(self):
+        from mybb_mcp.handlers import admin
+
+        admin._setting_cache.clear()
+        admin._datacache_cache.clear()
+        yield
+        admin._setting_cache.clear()
+        admin._datacache_cache.clear()
+
+    @pytest.fixture
+    def mock_db(self):
+        db = MagicMock()
+        db.get_setting.return_value = {
+            "name": "bbname", "title": "Board Name", "value": "My Forum",
+            "description": "Name of your board", "gid": 1, "disporder": 1, "optionscode": "text",
+        }
+        db.read_cache.return_value = 'a:1:{s:3:"foo";s:3:"bar";}'
+        db.rebuild_cache.return_value = {"message": "Cache rebuilt", "rows_affected": 1}
+        return db
+
+    @pytest.mark.asyncio
+    async def test_setting_get_cached_until_setting_set(self, mock_db):
+        """Repeated reads hit the database once; setting_set drops the entry."""
+        from mybb_mcp.bridge import BridgeResult
+        from mybb_mcp.handlers import admin
+
+        await admin.handle_setting_get({"name": "bbname"}, mock_db, None, None)
+        result = await admin.handle_setting_get({"name": "bbname"}, mock_db, None, None)
+        assert "`My Forum`" in result
+        assert mock_db.get_setting.call_count == 1
+
+        bridge = MagicMock()
+
+        async def call_async(action, **kwargs):
+            return BridgeResult(success=True, action=action, data={"supported_actions": ["setting:set"]})
+
+        bridge.call_async = call_async
+        with patch.object(admin, "get_bridge", return_value=bridge):
+            await admin.handle_setting_set({"name": "bbname", "value": "New"}, mock_db, MagicMock(), None)
+
+        await admin.handle_setting_get({"name": "bbname"}, mock_db, None, None)
+        assert mock_db.get_setting.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_read_cached_until_rebuild(self, mock_db):
+        """Datacache reads are reused until the entry is rebuilt or cleared."""
+        from mybb_mcp.handlers import admin
+
+        await admin.handle_cache_read({"title": "foo"}, mock_db, None, None)
+        await admin.handle_cache_read({"title": "foo"}, mock_db, None, None)
+        assert mock_db.read_cache.call_count == 1
+
+        await admin.handle_cache_rebuild({"cache_type": "all"}, mock_db, None, None)
+        await admin.handle_cache_read({"title": "foo"}, mock_db, None, None)
+        assert mock_db.read_cache.call_count == 2
+
+        await admin.handle_cache_clear({"title": "foo"}, mock_db, None, None)
+        await admin.handle_cache_read({"title": "foo"}, mock_db, None, None)
+        assert mock_db.read_cache.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_plugin_lifecycle_drops_setting_and_datacache_entries(self, mock_db):
+        """Plugin lifecycle writes rewrite the plugins datacache and settings."""
+        from mybb_mcp.bridge import BridgeResult
+        from mybb_mcp.handlers import admin, plugins
+
+        await admin.handle_setting_get({"name": "bbname"}, mock_db, None, None)
+        await admin.handle_cache_read({"title": "plugins"}, mock_db, None, None)
+
+        manager = MagicMock()
+        manager.db.get_project.return_value = None
+        manager._get_lifecycle.return_value.deactivate.return_value = BridgeResult(
+            success=True, action="plugin:deactivate", data={"actions_taken": ["deactivate"]}
+        )
+        with patch.object(plugins, "get_plugin_manager", return_value=manager):
+            await plugins.handle_plugin_deactivate({"name": "hello"}, mock_db, MagicMock(), None)
+
+        await admin.handle_setting_get({"name": "bbname"}, mock_db, None, None)
+        await admin.handle_cache_read({"title": "plugins"}, mock_db, None, None)
+        assert mock_db.get_setting.call_count == 2
+        assert mock_db.read_cache.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_setting_drops_stale_entry(self, mock_db):
+        """A setting that disappears is not served from an expired entry later."""
+        from mybb_mcp.handlers import admin
+
+        await admin.handle_setting_get({"name": "bbname"}, mock_db, None, None)
+        admin._setting_cache["bbname"] = (0.0, admin._setting_cache["bbname"][1])
+        mock_db.get_setting.return_value = None
+
+        result = await admin.handle_setting_get({"name": "bbname"}, mock_db, None, None)
+        assert result == "Setting 'bbname' not found."
+        assert "bbname" not in admin._setting_cache
@@ -215,6 +215,75 @@ class TestTemplateBatchRead:
             assert len(not_found) == 1
             assert 'footer' in not_found
 
+    def test_get_templates_bulk_single_query(self, mock_db_config):
+        """Test that bulk read fetches all titles with one IN query."""
+        db = MyBBDatabase(mock_db_config)
+
+        with patch.object(db, 'cursor') as mock_cursor:
+            cur = mock_cursor.return_value.__enter__.return_value
+            cur.fetchall.return_value = [
+                {'tid': 1, 'title': 'header', 'template': '<header>content</header>'},
+            ]
+
+            found = db.get_templates_bulk(['header', 'footer', 'header'], -2)
+
+            assert cur.execute.call_count == 1
+            sql, params = cur.execute.call_args[0]
+            assert 'title IN (%s,%s)' in sql
+            assert params == (-2, 'header', 'footer')
+            assert list(found) == ['header']
+
+    @pytest.mark.asyncio
+    async def test_batch_read_handler_uses_bulk_lookup(self):
+        """Test that the batch read handler reports found and missing titles."""
+        from mybb_mcp.handlers.templates import handle_template_batch_read
+
+        db = MagicMock()
+        db.get_templates_bulk.return_value = {
+            'header': {'tid': 1, 'title': 'header', 'template': '<header>content</header>'},
+        }
+
+        result = await handle_template_batch_read({'templates': ['header', 'footer']}, db, None, None)
+
+        db.get_templates_bulk.assert_called_once_with(['header', 'footer'], -2)
+        db.get_template.assert_not_called()
+        assert '<header>content</header>' in result
+        assert '- footer' in result
+
+    @pytest.mark.asyncio
+    async def test_batch_read_matches_titles_case_insensitively(self):
+        """Test that a title found by MySQL's case-insensitive match is not reported missing."""
+        from mybb_mcp.handlers.templates import handle_template_batch_read
+
+        db = MyBBDatabase(DatabaseConfig(host="localhost", port=3306, database="test_mybb",
+                                         user="test_user", password="test_pass", prefix="mybb_"))
+        with patch.object(db, 'cursor') as mock_cursor:
+            mock_cursor.return_value.__enter__.return_value.fetchall.return_value = [
+                {'tid': 1, 'title': 'header', 'template': '<header>content</header>'},
+            ]
+            result = await handle_template_batch_read({'templates': ['Header']}, db, None, None)
+
+        assert '## Header\n```html\n<header>content</header>' in result
+        assert 'Not found' not in result
+
+    @pytest.mark.asyncio
+    async def test_read_template_fetches_master_and_custom_together(self):
+        """Test that reading a custom template looks up both sets in one call."""
+        from mybb_mcp.handlers.templates import handle_read_template
+
+        db = MagicMock()
+        db.get_templates_for_title.return_value = {
+            -2: {'tid': 1, 'sid': -2, 'version': 1839, 'template': '<master/>'},
+            3: {'tid': 9, 'sid': 3, 'version': 1839, 'template': '<custom/>'},
+        }
+
+        result = await handle_read_template({'title': 'header', 'sid': 3}, db, None, None)
+
+        db.get_templates_for_title.assert_called_once_with('header', [-2, 3])
+        db.get_template.assert_not_called()
+        assert '## Custom Template (sid=3)' in result
+        assert '<master/>' in result and '<custom/>' in result
+
 
 class TestTemplateBatchWrite:
     """Test mybb_template_batch_write functionality."""
@@ -448,3 +517,36 @@ class TestTemplateToolsIntegration:
                     db.update_template(existing['tid'], content)
 
                 assert mock_update.call_count == 2
+
+
+class TestTemplateGroupHandler:
+    """Test the streamed template group listing."""
+
+    @pytest.mark.asyncio
+    async def test_template_groups_rendered_from_stream(self):
+        """Rows from iter_template_groups go straight into the markdown table."""
+        from mybb_mcp.handlers.admin import handle_list_template_groups
+
+        db = MagicMock()
+        db.iter_template_groups.return_value = iter([
+            {'gid': 1, 'prefix': 'header', 'title': 'Header'},
+            {'gid': 2, 'prefix': 'index', 'title': 'Index'},
+        ])
+
+        result = await handle_list_template_groups({}, db, None, None)
+
+        assert result == (
+            "# Template Groups\n\n| Prefix | Title |\n|--------|-------|\n"
+            "| header | Header |\n| index | Index |"
+        )
+        db.list_template_groups.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_template_groups_empty(self):
+        """An empty stream reports no groups."""
+        from mybb_mcp.handlers.admin import handle_list_template_groups
+
+        db = MagicMock()
+        db.iter_template_groups.return_value = iter([])
+
+        assert await handle_list_template_groups({}, db, None, None) == "No template groups found."
@@ -31,6 +31,13 @@ class TestThemeCodenameNormalization:
             codename = theme_name.lower().replace(' ', '_').strip('_')
             assert codename == expected_codename, f"Failed for {theme_name}"
 
+    def test_handler_codename_helper(self):
+        """Test the handlers' cached codename helper keeps hyphens"""
+        from mybb_mcp.handlers.themes import _theme_codename
+
+        assert _theme_codename('My Custom Theme') == 'my_custom_theme'
+        assert _theme_codename('Theme-With-Dashes') == 'theme-with-dashes'
+
 
 class TestWorkspaceThemeDetection:
     """Tests for workspace theme detection logic"""
@@ -64,6 +71,23 @@ class TestWorkspaceThemeDetection:
         assert is_managed is False
 
 
+    def test_managed_theme_keyed_lookup(self):
+        """Test handlers look up one theme by codename instead of listing all"""
+        from unittest.mock import MagicMock
+        from mybb_mcp.handlers.themes import _managed_theme
+
+        manager = MagicMock()
+        manager.db.get_project.side_effect = lambda codename: {
+            'custom_theme': {'codename': 'custom_theme', 'type': 'theme'},
+            'some_plugin': {'codename': 'some_plugin', 'type': 'plugin'},
+        }.get(codename)
+
+        assert _managed_theme(manager, 'custom_theme')['codename'] == 'custom_theme'
+        assert _managed_theme(manager, 'some_plugin') is None
+        assert _managed_theme(manager, 'missing') is None
+        manager.db.list_projects.assert_not_called()
+
+
 class TestWorkspacePathConstruction:
     """Tests for workspace path construction and file operations"""
 
@@ -216,5 +240,168 @@ class TestThemeListMerging:
         assert marked_themes[1]['managed'] is False  # Another Theme not in workspace
 
 
+class TestStylesheetRowCache:
+    """Tests for the cached theme/stylesheet lookups in the stylesheet tools"""
+
+    @pytest.fixture(autouse=True)
+    def clear_row_caches(self):
+        from mybb_mcp.handlers import themes
+        themes._theme_cache.clear()
+        themes._stylesheet_cache.clear()
+        yield
+        themes._theme_cache.clear()
+        themes._stylesheet_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_rows_reused_until_stylesheet_write(self):
+        """Test metadata lookups are reused and a write drops the stylesheet entry"""
+        from unittest.mock import MagicMock, patch
+        from mybb_mcp.bridge import BridgeResult
+        from mybb_mcp.handlers import themes
+
+        db = MagicMock()
+        db.get_stylesheet.return_value = {
+            'sid': 5, 'tid': 2, 'name': 'global.css', 'attachedto': '', 'stylesheet': 'a {}'
+        }
+        db.get_theme.return_value = {'tid': 2, 'name': 'Unmanaged Theme'}
+        manager = MagicMock()
+        manager.db.get_project.return_value = None
+
+        bridge = MagicMock()
+
+        async def call_async(action, **kwargs):
+            if action == "info":
+                return BridgeResult(success=True, action=action,
+                                    data={"supported_actions": ["stylesheet:write"]})
+            return BridgeResult(success=True, action=action)
+
+        bridge.call_async = call_async
+
+        with patch.object(themes, "get_plugin_manager", return_value=manager), \
+                patch.object(themes, "get_bridge", return_value=bridge):
+            await themes.handle_read_stylesheet({"sid": 5}, db, None, None)
+            await themes.handle_write_stylesheet({"sid": 5, "stylesheet": "b {}"}, db, MagicMock(), None)
+            assert db.get_stylesheet.call_count == 2
+            assert db.get_theme.call_count == 1
+
+            await themes.handle_write_stylesheet({"sid": 5, "stylesheet": "c {}"}, db, MagicMock(), None)
+
+        assert db.get_stylesheet.call_count == 3
+        assert db.get_theme.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stylesheet_body_never_cached(self):
+        """Test a body changed by another writer (e.g. disk sync) is read fresh"""
+        from unittest.mock import MagicMock, patch
+        from mybb_mcp.handlers import themes
+
+        row = {'sid': 5, 'tid': 2, 'name': 'global.css', 'attachedto': '', 'stylesheet': 'a {}'}
+        db = MagicMock()
+        db.get_stylesheet.side_effect = lambda sid: dict(row)
+        db.get_theme.return_value = {'tid': 2, 'name': 'Unmanaged Theme'}
+        manager = MagicMock()
+        manager.db.get_project.return_value = None
+
+        with patch.object(themes, "get_plugin_manager", return_value=manager):
+            assert "a {}" in await themes.handle_read_stylesheet({"sid": 5}, db, None, None)
+            row['stylesheet'] = 'synced {}'
+            result = await themes.handle_read_stylesheet({"sid": 5}, db, None, None)
+
+        assert "synced {}" in result
+        assert 'stylesheet' not in themes._stylesheet_cache[5][1]
+        assert db.get_theme.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_workspace_stylesheet_decoded_once(self, tmp_path):
+        """Test a managed theme's stylesheet is served from disk with bad bytes replaced"""
+        from unittest.mock import MagicMock, patch
+        from mybb_mcp.handlers import themes
+
+        (tmp_path / "stylesheets").mkdir()
+        (tmp_path / "stylesheets" / "global.css").write_bytes(b"a { content: '\xff'; }")
+        db = MagicMock()
+        db.get_stylesheet.return_value = {
+            'sid': 6, 'tid': 3, 'name': 'global.css', 'attachedto': '', 'stylesheet': 'stale {}'
+        }
+        db.get_theme.return_value = {'tid': 3, 'name': 'Dark Theme'}
+        manager = MagicMock()
+        manager.db.get_project.return_value = {'type': 'theme', 'workspace_path': str(tmp_path)}
+
+        with patch.object(themes, "get_plugin_manager", return_value=manager):
+            result = await themes.handle_read_stylesheet({"sid": 6}, db, None, None)
+
+        manager.db.get_project.assert_called_once_with('dark_theme')
+        assert "(WORKSPACE)" in result
+        assert "```css\na { content: '\ufffd'; }\n```" in result
+
+    @pytest.mark.asyncio
+    async def test_list_themes_marks_managed(self):
+        """Test installed themes are marked managed via the workspace codename set"""
+        from unittest.mock import MagicMock, patch
+        from mybb_mcp.handlers import themes
+
+        db = MagicMock()
+        db.list_themes.return_value = [{'tid': 1, 'name': 'Default'}, {'tid': 2, 'name': 'Another Theme'}]
+        manager = MagicMock()
+        manager.db.list_projects.return_value = [
+            {'codename': 'default', 'visibility': 'public', 'status': 'installed'}
+        ]
+
+        with patch.object(themes, "get_plugin_manager", return_value=manager):
+            result = await themes.handle_list_themes({}, db, None, None)
+
+        assert "- **Default** (tid: 1) (managed)" in result
+        assert "- **Another Theme** (tid: 2)\n" in result + "\n"
+
+    @pytest.mark.asyncio
+    async def test_list_themes_overlaps_both_queries(self):
+        """Test the workspace query runs while the MySQL theme query is in flight"""
+        import threading
+        from unittest.mock import MagicMock, patch
+        from mybb_mcp.handlers import themes
+
+        mysql_started = threading.Event()
+        db = MagicMock()
+
+        def list_themes():
+            mysql_started.set()
+            return [{'tid': 1, 'name': 'Default'}]
+
+        db.list_themes.side_effect = list_themes
+        manager = MagicMock()
+        manager.db.list_projects.side_effect = lambda type: (
+            [{'codename': 'default', 'visibility': 'public', 'status': 'installed'}]
+            if mysql_started.wait(1) else []
+        )
+
+        with patch.object(themes, "get_plugin_manager", return_value=manager):
+            result = await themes.handle_list_themes({}, db, None, None)
+
+        assert "- **Default** (tid: 1) (managed)" in result
+
+
+class TestCreateThemeHandler:
+    """Tests for the mybb_create_theme response"""
+
+    @pytest.mark.asyncio
+    async def test_success_lists_created_files(self):
+        """Test the success message lists each created file before next steps"""
+        from unittest.mock import MagicMock, patch
+        from mybb_mcp.handlers import themes
+
+        manager = MagicMock()
+        manager.create_theme.return_value = {
+            'success': True, 'codename': 'dark', 'workspace_path': 'plugin_manager/themes/public/dark',
+            'project_id': 7, 'files_created': ['meta.json', 'stylesheets/global.css'],
+        }
+
+        with patch.object(themes, "get_plugin_manager", return_value=manager):
+            result = await themes.handle_create_theme({'codename': 'dark', 'name': 'Dark'}, None, None, None)
+
+        assert result.startswith("# Theme Created: Dark\n\n**Codename:** `dark`\n")
+        assert "## Files Created\n- `meta.json`\n- `stylesheets/global.css`\n\n**Next Steps:**\n" in result
+        assert result.endswith("3. Export for distribution: Use export workflow")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
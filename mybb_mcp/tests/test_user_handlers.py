@@ -0,0 +1,112 @@
+"""Tests for user management handlers."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from mybb_mcp.bridge import BridgeResult
+from mybb_mcp.handlers import users
+from mybb_mcp.handlers.admin import handle_cache_rebuild
+from mybb_mcp.handlers.users import handle_user_get, handle_user_unban, handle_usergroup_list
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    """Start each test with empty user and usergroup caches."""
+    users._user_cache.clear()
+    users.invalidate_usergroups()
+    yield
+    users._user_cache.clear()
+    users.invalidate_usergroups()
+
+
+@pytest.fixture
+def mock_db():
+    db = MagicMock()
+    db.get_user.return_value = {"uid": 2, "username": "Tester", "usergroup": 2}
+    return db
+
+
+@pytest.mark.asyncio
+async def test_user_get_reuses_cached_lookup(mock_db):
+    """Repeated lookups of the same user hit the database once."""
+    await handle_user_get({"uid": 2}, mock_db, None, None)
+    result = await handle_user_get({"uid": 2}, mock_db, None, None)
+
+    assert "**Username:** Tester" in result
+    assert mock_db.get_user.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_user_unban_invalidates_cached_user(mock_db):
+    """A successful unban drops cached entries for that user."""
+    await handle_user_get({"username": "Tester"}, mock_db, None, None)
+
+    bridge = MagicMock()
+
+    async def info_async():
+        return BridgeResult(success=True, action="info", data={"supported_actions": ["user:unban"]})
+
+    async def call_async(action, **kwargs):
+        return BridgeResult(success=True, action=action)
+
+    bridge.info_async = info_async
+    bridge.call_async = call_async
+    config = MagicMock()
+
+    with patch.object(users, "get_bridge", return_value=bridge):
+        result = await handle_user_unban({"uid": 2}, mock_db, config, None)
+
+    assert "has been unbanned" in result
+    await handle_user_get({"username": "tester"}, mock_db, None, None)
+    assert mock_db.get_user.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_user_unban_succeeds_when_info_fails(mock_db):
+    """A failed capability check does not hide an unban that went through."""
+    await handle_user_get({"uid": 2}, mock_db, None, None)
+
+    bridge = MagicMock()
+
+    async def info_async():
+        return BridgeResult(success=False, action="info", error="bridge timed out")
+
+    async def call_async(action, **kwargs):
+        return BridgeResult(success=True, action=action)
+
+    bridge.info_async = info_async
+    bridge.call_async = call_async
+
+    with patch.object(users, "get_bridge", return_value=bridge):
+        result = await handle_user_unban({"uid": 2}, mock_db, MagicMock(), None)
+
+    assert "has been unbanned" in result
+    await handle_user_get({"uid": 2}, mock_db, None, None)
+    assert mock_db.get_user.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_usergroup_list_cached_until_cache_rebuild(mock_db):
+    """Usergroups are listed from cache until MyBB's usergroups cache is rebuilt."""
+    mock_db.list_usergroups.return_value = [
+        {"gid": 4, "title": "Administrators", "cancp": 1},
+        {"gid": 2, "title": "Registered", "cancp": 0, "canmodcp": 0},
+    ]
+    mock_db.rebuild_cache.return_value = {"message": "Cache rebuilt", "rows_affected": 1}
+
+    result = await handle_usergroup_list({}, mock_db, None, None)
+    await handle_usergroup_list({}, mock_db, None, None)
+    assert "| 4 | Administrators | Admin |" in result
+    assert mock_db.list_usergroups.call_count == 1
+
+    await handle_cache_rebuild({"cache_type": "usergroups"}, mock_db, None, None)
+    await handle_usergroup_list({}, mock_db, None, None)
+    assert mock_db.list_usergroups.call_count == 2
+
+
+def test_format_table_cell_escapes_markdown():
+    """Pipes and line breaks cannot break table rows."""
+    from mybb_mcp.handlers.common import format_table_cell
+
+    assert format_table_cell("a|b\r\nc") == "a\\|b c"
+    assert format_table_cell(42) == "42"
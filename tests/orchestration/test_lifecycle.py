@@ -19,6 +19,16 @@ class TestCheckMariaDB:
         assert isinstance(result, bool)
         # We can't assert True/False without knowing if MariaDB is actually running
 
+    def test_check_mariadb_result_is_cached(self, temp_service, monkeypatch):
+        """Test that repeated checks within the TTL don't rescan /proc."""
+        from mybb_mcp.orchestration import server_service
+        calls = []
+        monkeypatch.setattr(server_service, '_proc_has', lambda *names: calls.append(names) or True)
+
+        assert temp_service._check_mariadb() is True
+        assert temp_service._check_mariadb() is True
+        assert len(calls) == 1
+
 
 class TestGetStatus:
     """Tests for get_status method."""
@@ -78,6 +88,46 @@ class TestGetStatus:
         assert not temp_service.state_file.exists()
 
 
+    def test_get_status_checks_pid_and_mariadb_in_one_scan(self, temp_service, monkeypatch):
+        """Test a cold get_status answers both process checks with one /proc pass."""
+        from mybb_mcp.orchestration import server_service
+        scans = []
+        real_snapshot = server_service._snapshot_procs
+        monkeypatch.setattr(server_service, '_snapshot_procs',
+                            lambda pid, names: scans.append(pid) or real_snapshot(pid, names))
+        temp_service._write_state({
+            'port': 8022,
+            'pid': os.getpid(),
+            'started_at': datetime.now(timezone.utc).isoformat(),
+            'log_file': str(temp_service.log_file)
+        })
+
+        status = temp_service.get_status()
+
+        assert status.running is True
+        assert isinstance(status.mariadb_running, bool)
+        assert scans == [os.getpid()]
+
+    def test_get_status_cached_until_state_changes(self, temp_service, monkeypatch):
+        """Test repeated get_status calls reuse the result until state is written."""
+        calls = []
+        real_check = temp_service._check_port_available
+        monkeypatch.setattr(temp_service, '_check_port_available',
+                            lambda port: calls.append(port) or real_check(58022))
+
+        first = temp_service.get_status()
+        assert temp_service.get_status() is first
+        assert len(calls) == 1
+
+        temp_service._write_state({
+            'port': 8022,
+            'pid': os.getpid(),
+            'started_at': datetime.now(timezone.utc).isoformat(),
+            'log_file': str(temp_service.log_file)
+        })
+        assert temp_service.get_status().running is True
+
+
 class TestCheckPortAvailable:
     """Tests for _check_port_available helper method."""
 
@@ -89,6 +139,20 @@ class TestCheckPortAvailable:
         assert available is True
         assert pid is None
 
+    def test_check_port_available_finds_listener_pid(self, temp_service):
+        """Test _check_port_available reports our own listening socket."""
+        import socket
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(('127.0.0.1', 0))
+        sock.listen()
+        try:
+            available, pid = temp_service._check_port_available(sock.getsockname()[1])
+        finally:
+            sock.close()
+
+        assert available is False
+        assert pid == os.getpid()
+
     def test_check_port_available_on_used_port(self, temp_service):
         """Test _check_port_available returns False for used port."""
         # Port 22 (SSH) is almost always in use on dev systems
@@ -148,6 +212,59 @@ class TestRotateLog:
 class TestStop:
     """Tests for stop method."""
 
+    def test_stop_terminates_process(self, temp_service):
+        """Test stop() returns once the server process exits."""
+        import subprocess
+        proc = subprocess.Popen(['sleep', '30'])
+        temp_service._write_state({
+            'port': 58022,
+            'pid': proc.pid,
+            'started_at': datetime.now(timezone.utc).isoformat(),
+            'log_file': str(temp_service.log_file)
+        })
+
+        started = time.monotonic()
+        result = temp_service.stop()
+
+        assert result.success is True
+        assert proc.wait(timeout=1) is not None
+        assert time.monotonic() - started < 1.0
+        assert not temp_service.state_file.exists()
+
+    def test_start_and_stop_spawned_server(self, temp_service, monkeypatch):
+        """Test start() spawns the server without a shell and stop() reaps it."""
+        import socket
+        import subprocess
+        import sys
+        from mybb_mcp.orchestration import server_service
+
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+
+        real_popen = subprocess.Popen
+        spawned = []
+
+        def fake_popen(args, **kwargs):
+            # Stand in for `php -S` with a Python HTTP server on the same port
+            assert args[:2] == ['php', '-S']
+            proc = real_popen([sys.executable, '-m', 'http.server', str(port),
+                               '--bind', '127.0.0.1'], **kwargs)
+            spawned.append(proc)
+            return proc
+
+        monkeypatch.setattr(server_service.subprocess, 'Popen', fake_popen)
+        monkeypatch.setattr(temp_service, '_check_mariadb', lambda: True)
+
+        result = temp_service.start(port=port)
+        assert result.success is True
+        assert result.pid == spawned[0].pid
+
+        result = temp_service.stop()
+        assert result.success is True
+        assert spawned[0].returncode is not None
+        assert not temp_service.state_file.exists()
+
     def test_stop_when_not_running(self, temp_service):
         """Test stop returns error when server is not running."""
         result = temp_service.stop()
@@ -1,6 +1,7 @@
 """Unit tests for log_parser module."""
 
 import pytest
+from datetime import datetime, timezone
 from mybb_mcp.orchestration.log_parser import (
     LogEntry, parse_log_line, is_static_request, is_error_entry,
     STATIC_PATTERNS, ERROR_PATTERNS
@@ -20,6 +21,24 @@ class TestParseLogLine:
         assert entry.path == "/usercp.php"
         assert entry.entry_type == "request"
 
+    def test_parse_request_line_fields(self):
+        """Request lines populate timestamp, IP and static flag."""
+        line = "[Mon Jan 20 01:32:55 2026] 192.168.1.5:47778 [200]: GET /images/logo.png"
+        entry = parse_log_line(line)
+        assert entry.timestamp == datetime(2026, 1, 20, 1, 32, 55, tzinfo=timezone.utc)
+        assert entry.ip == "192.168.1.5"
+        assert entry.is_static == True
+        assert entry.is_error == False
+
+    def test_parse_ipv6_request_line(self):
+        """Request lines from IPv6 clients are still parsed."""
+        line = "[Mon Jan 20 01:32:55 2026] [::1]:47778 [404]: POST /missing.php"
+        entry = parse_log_line(line)
+        assert entry.entry_type == "request"
+        assert entry.status_code == 404
+        assert entry.method == "POST"
+        assert entry.error_category == "http_4xx"
+
     def test_parse_error_request(self):
         """Test parsing 500 error request."""
         line = "[Mon Jan 20 01:32:55 2026] 127.0.0.1:47778 [500]: GET /broken.php"
@@ -50,6 +69,33 @@ class TestParseLogLine:
         assert entry is not None
         assert entry.entry_type == "connection"
 
+    def test_parse_timestamp(self):
+        """Timestamps are parsed as UTC datetimes."""
+        entry = parse_log_line("[Tue Feb 03 09:05:07 2026] 127.0.0.1:47778 Accepted")
+        assert entry.timestamp == datetime(2026, 2, 3, 9, 5, 7, tzinfo=timezone.utc)
+
+    def test_parse_invalid_timestamp(self):
+        """Malformed timestamps leave timestamp unset."""
+        entry = parse_log_line("[Mon Foo 20 01:32:55 2026] PHP Warning: oops")
+        assert entry.timestamp is None
+        assert entry.is_error == True
+
+    def test_parse_stack_trace_line(self):
+        """Stack trace lines are errors without a timestamp."""
+        entry = parse_log_line("#1 /var/www/inc/class_core.php(42): foo()")
+        assert entry.entry_type == "error"
+        assert entry.is_error == True
+        assert entry.timestamp is None
+
+    def test_parse_untimestamped_lines(self):
+        """Lines without a [timestamp] prefix are still checked for errors."""
+        entry = parse_log_line("PHP Notice:  Undefined index: foo in /var/www/index.php")
+        assert entry.entry_type == "error"
+        assert entry.error_category == "notice"
+        entry = parse_log_line("Listening on http://localhost:8022")
+        assert entry.entry_type == "other"
+        assert entry.is_error == False
+
     def test_parse_empty_line(self):
         """Empty lines return None."""
         assert parse_log_line("") is None
@@ -63,6 +109,13 @@ class TestParseLogLine:
         assert entry.status_code == 404
         assert entry.is_error == True
 
+    def test_parse_error_request_category(self):
+        """HTTP error requests are categorized from the status code."""
+        entry = parse_log_line("[Mon Jan 20 01:32:55 2026] 127.0.0.1:47778 [502]: GET /Warning:.php")
+        assert entry.error_category == "http_5xx"
+        entry = parse_log_line("[Mon Jan 20 01:32:55 2026] 127.0.0.1:47778 [403]: GET /admin/")
+        assert entry.error_category == "http_4xx"
+
     def test_parse_php_warning(self):
         """Test parsing PHP Warning."""
         line = "[Mon Jan 20 01:32:55 2026] PHP Warning: Division by zero"
@@ -169,6 +222,16 @@ class TestIsErrorEntry:
         )
         assert is_error_entry(entry) == False
 
+    def test_successful_request_path_not_scanned(self):
+        """Error-like text in a successful request's path is not an error."""
+        entry = LogEntry(
+            timestamp=None,
+            raw_line="[200]: GET /docs/Fatal error:.php",
+            entry_type="request",
+            status_code=200
+        )
+        assert is_error_entry(entry) == False
+
     def test_php_fatal_is_error(self):
         """PHP Fatal error is an error."""
         entry = LogEntry(
@@ -205,3 +268,21 @@ class TestIsErrorEntry:
             entry_type="connection"
         )
         assert is_error_entry(entry) == False
+
+    def test_uncaught_error_is_error(self):
+        """Uncaught Error lines are categorized as exceptions."""
+        entry = LogEntry(
+            timestamp=None,
+            raw_line="PHP Uncaught Error: Call to undefined function foo()",
+            entry_type="other"
+        )
+        assert is_error_entry(entry) == True
+
+    def test_stack_trace_is_error(self):
+        """Stack trace lines are errors."""
+        entry = LogEntry(
+            timestamp=None,
+            raw_line="#0 /var/www/index.php(12): main()",
+            entry_type="other"
+        )
+        assert is_error_entry(entry) == True
@@ -6,7 +6,9 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from mybb_mcp.orchestration.server_service import (
-    ServerOrchestrationService, ServerResult, ServerStatus, LogQueryOptions
+    ServerOrchestrationService, ServerResult, ServerStatus, LogQueryOptions,
+    _compile_filter, _format_log_entry, _iter_lines_reverse, _keyword_pattern, _port_in_use,
+    _wait_for_exit,
 )
 
 
@@ -77,6 +79,18 @@ class TestStateFileManagement:
         assert service.state_file.exists()
         assert service.state_file.parent.exists()
 
+    def test_read_state_reparses_after_external_change(self, tmp_path):
+        """Cached state is dropped when the file changes on disk."""
+        config = MagicMock()
+        config.mybb_root = str(tmp_path / "TestForum")
+        service = ServerOrchestrationService(config)
+
+        service._write_state({'port': 8022, 'pid': 1})
+        assert service._read_state()['port'] == 8022
+
+        service.state_file.write_text(json.dumps({'port': 9000, 'pid': 12}))
+        assert service._read_state()['port'] == 9000
+
     def test_read_malformed_json(self, tmp_path):
         """Malformed JSON returns None."""
         config = MagicMock()
@@ -212,3 +226,289 @@ class TestServiceInitialization:
         # Path normalization should handle trailing slash
         assert service.mybb_root == testforum
         assert service.repo_root == tmp_path
+
+
+class TestLogTail:
+    """Test reverse tail reading of the server log."""
+
+    def test_iter_lines_reverse_newest_first(self):
+        """Lines come back whole, newest first."""
+        lines = list(_iter_lines_reverse(b"first line\nsecond line\nthird line\n", 1024))
+
+        assert lines == ["", "third line", "second line", "first line"]
+
+    def test_iter_lines_reverse_drops_partial_line_at_cap(self):
+        """A line cut by the byte cap is not yielded."""
+        lines = list(_iter_lines_reverse(b"aaaa\nbbbb\ncccc", 7))
+
+        assert lines == ["cccc"]
+
+    def test_query_logs_empty_file(self, tmp_path):
+        """An empty log is reported without trying to map it."""
+        config = MagicMock()
+        testforum = tmp_path / "TestForum"
+        testforum.mkdir()
+        config.mybb_root = str(testforum)
+        service = ServerOrchestrationService(config)
+        service.log_dir.mkdir()
+        (service.log_dir / "server.log").write_text("")
+
+        result = service.query_logs(LogQueryOptions())
+        assert "**Showing:** 0 of 0 matching" in result
+
+    def test_query_logs_tail_pages(self, tmp_path):
+        """Tail mode returns the newest page in chronological order."""
+        config = MagicMock()
+        testforum = tmp_path / "TestForum"
+        testforum.mkdir()
+        config.mybb_root = str(testforum)
+        service = ServerOrchestrationService(config)
+        service.log_dir.mkdir()
+        (service.log_dir / "server.log").write_text(
+            "".join(f"plain message {i}\n" for i in range(10))
+        )
+
+        result = service.query_logs(LogQueryOptions(limit=3))
+        assert result.index("message 7") < result.index("message 8") < result.index("message 9")
+        assert "plain message 6" not in result
+        assert "of 4+ matching" in result
+
+        result = service.query_logs(LogQueryOptions(limit=3, offset=3))
+        assert result.index("message 4") < result.index("message 5") < result.index("message 6")
+        assert "plain message 7" not in result
+
+    def test_query_logs_parallel_matches_serial(self, tmp_path, monkeypatch):
+        """Parallel scans return the same page as the serial path, with exact counts."""
+        from mybb_mcp.orchestration import server_service
+
+        config = MagicMock()
+        testforum = tmp_path / "TestForum"
+        testforum.mkdir()
+        config.mybb_root = str(testforum)
+        service = ServerOrchestrationService(config)
+        service.log_dir.mkdir()
+        (service.log_dir / "server.log").write_text("".join(
+            f"PHP Warning: thing {i} in /x.php on line 1\n" if i % 3 == 0 else f"plain message {i}\n"
+            for i in range(300)
+        ))
+        monkeypatch.setattr(server_service, "PARALLEL_MIN_BYTES", 0)
+        start_methods = []
+        real_pool = server_service.ProcessPoolExecutor
+
+        def pool(*args, mp_context=None, **kwargs):
+            start_methods.append(mp_context.get_start_method())
+            return real_pool(*args, mp_context=mp_context, **kwargs)
+
+        monkeypatch.setattr(server_service, "ProcessPoolExecutor", pool)
+
+        for tail in (True, False):
+            serial = service.query_logs(LogQueryOptions(errors_only=True, limit=5, offset=5, tail=tail))
+            parallel = service.query_logs(LogQueryOptions(errors_only=True, limit=5, offset=5, tail=tail,
+                                                          parallel=True))
+            assert parallel.split("```")[1] == serial.split("```")[1]
+            assert "of 100 matching" in parallel
+
+        # Never fork the (multithreaded) server process for scan workers
+        assert start_methods and "fork" not in start_methods
+
+    def test_query_logs_keyword_skips_parsing_other_lines(self, tmp_path):
+        """Lines without the keyword are never parsed but still counted."""
+        from mybb_mcp.orchestration import server_service
+
+        config = MagicMock()
+        testforum = tmp_path / "TestForum"
+        testforum.mkdir()
+        config.mybb_root = str(testforum)
+        service = ServerOrchestrationService(config)
+        service.log_dir.mkdir()
+        (service.log_dir / "server.log").write_text(
+            "".join(f"plain message {i}\n" for i in range(9)) + "PHP Fatal error: boom\n"
+        )
+
+        parsed = []
+        real_parse = server_service.parse_log_line
+        with patch.object(server_service, "parse_log_line",
+                          side_effect=lambda line: parsed.append(line) or real_parse(line)):
+            result = service.query_logs(LogQueryOptions(filter_keyword="FATAL"))
+
+        assert "boom" in result
+        assert "(from 11 lines read)" in result
+        assert len(parsed) == 1
+
+    def test_query_logs_any_of_several_keywords(self, tmp_path):
+        """A list of keywords keeps lines matching any of them."""
+        config = MagicMock()
+        testforum = tmp_path / "TestForum"
+        testforum.mkdir()
+        config.mybb_root = str(testforum)
+        service = ServerOrchestrationService(config)
+        service.log_dir.mkdir()
+        (service.log_dir / "server.log").write_text(
+            "alpha one\nbeta two\ngamma three\nALPHA (four)\n"
+        )
+
+        result = service.query_logs(LogQueryOptions(filter_keyword=["alpha", "gamma", "(x"]))
+        assert "of 3 matching" in result
+        assert "beta" not in result
+        assert "keyword='alpha|gamma|(x'" in result
+
+    def test_query_logs_head_pages(self, tmp_path):
+        """Head mode returns the requested page from the start of the log."""
+        config = MagicMock()
+        testforum = tmp_path / "TestForum"
+        testforum.mkdir()
+        config.mybb_root = str(testforum)
+        service = ServerOrchestrationService(config)
+        service.log_dir.mkdir()
+        (service.log_dir / "server.log").write_text(
+            "".join(f"plain message {i}\n" for i in range(10))
+        )
+
+        result = service.query_logs(LogQueryOptions(limit=3, offset=3, tail=False))
+        assert result.index("message 3") < result.index("message 4") < result.index("message 5")
+        assert "plain message 2" not in result
+        assert "plain message 6" not in result
+        assert "of 7+ matching" in result
+
+
+class TestCompileFilter:
+    """Test log filter predicate composition."""
+
+    def test_no_filters_keeps_everything(self):
+        """With no active filters every entry passes."""
+        from mybb_mcp.orchestration.log_parser import parse_log_line
+
+        keep = _compile_filter(False, False, None, None)
+        assert keep(parse_log_line("anything at all"))
+
+    def test_filters_combine(self):
+        """All active filters must pass."""
+        from mybb_mcp.orchestration.log_parser import parse_log_line
+
+        keep = _compile_filter(True, False, _keyword_pattern("fatal"), None)
+        assert keep(parse_log_line("PHP Fatal error: boom in /x.php on line 3"))
+        assert not keep(parse_log_line("PHP Warning: careful in /x.php on line 3"))
+        assert not keep(parse_log_line("a fatal mistake, but only a plain line"))
+
+
+class TestFormatLogEntry:
+    """Test rendering of log entries for query_logs output."""
+
+    def test_request_error_is_bold(self):
+        """Failed requests are emphasised and tagged with their category."""
+        from mybb_mcp.orchestration.log_parser import parse_log_line
+
+        entry = parse_log_line("[Mon Jan 20 14:30:45 2025] 127.0.0.1:54321 [500]: GET /index.php")
+        assert _format_log_entry(entry) == "**[14:30:45] [http_5xx] [500] GET /index.php**\n"
+
+    def test_long_other_line_is_truncated(self):
+        """Plain lines are cut at 150 characters."""
+        from mybb_mcp.orchestration.log_parser import parse_log_line
+
+        entry = parse_log_line("x" * 200)
+        assert _format_log_entry(entry) == "[??:??:??] " + "x" * 150 + "...\n"
+
+
+class TestPortProbe:
+    """Test the port-in-use probe across a server stop/restart."""
+
+    @staticmethod
+    def _listen(port=0):
+        """Listen on loopback the way PHP's dev server does (SO_REUSEADDR set)."""
+        import socket
+        srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        srv.bind(('127.0.0.1', port))
+        srv.listen()
+        return srv
+
+    def test_port_free_after_stop_and_taken_after_restart(self, tmp_path):
+        """TIME_WAIT sockets left by a stopped server do not block a restart."""
+        import socket
+        srv = self._listen()
+        port = srv.getsockname()[1]
+
+        # Serve one request and close server-side first, leaving TIME_WAIT
+        client = socket.create_connection(('127.0.0.1', port))
+        conn, _ = srv.accept()
+        assert _port_in_use(port)
+        conn.close()
+        client.close()
+        srv.close()
+
+        config = MagicMock()
+        config.mybb_root = str(tmp_path)
+        service = ServerOrchestrationService(config)
+        assert not _port_in_use(port)
+        assert service._check_port_available(port) == (True, None)
+
+        restarted = self._listen(port)
+        try:
+            assert _port_in_use(port)
+        finally:
+            restarted.close()
+
+
+class TestNoProcFallback:
+    """Test the process checks on systems without /proc (e.g. macOS)."""
+
+    @pytest.fixture
+    def no_proc(self, monkeypatch):
+        from mybb_mcp.orchestration import server_service
+
+        def scandir(path):
+            raise FileNotFoundError(path)
+
+        monkeypatch.setattr(server_service.os, "scandir", scandir)
+        monkeypatch.setattr(server_service, "_PROC_NET_TCP", ("/nonexistent/tcp",))
+        return server_service
+
+    def test_mariadb_check_uses_pgrep(self, no_proc):
+        """The MariaDB check asks pgrep when /proc can't be scanned."""
+        with patch.object(no_proc.subprocess, "run",
+                          side_effect=[MagicMock(returncode=1), MagicMock(returncode=0)]) as run:
+            assert no_proc._proc_has("mariadbd", "mysqld") is True
+
+        assert [c.args[0] for c in run.call_args_list] == [["pgrep", "-x", "mariadbd"],
+                                                             ["pgrep", "-x", "mysqld"]]
+
+    def test_tracked_pid_checked_with_signal_zero(self, no_proc):
+        """A running tracked PID is not reported dead when /proc is missing."""
+        import os
+
+        with patch.object(no_proc.subprocess, "run", return_value=MagicMock(returncode=1)):
+            assert no_proc._snapshot_procs(os.getpid(), ("mariadbd",)) == (True, False)
+            assert no_proc._snapshot_procs(2 ** 22 + 1, ("mariadbd",)) == (False, False)
+
+    def test_port_owner_uses_lsof(self, no_proc):
+        """The port-owner lookup asks lsof when /proc/net/tcp is missing."""
+        with patch.object(no_proc.subprocess, "run",
+                          return_value=MagicMock(returncode=0, stdout="4321\n4322\n")) as run:
+            assert no_proc._find_listening_pid(8022) == 4321
+
+        assert run.call_args.args[0] == ["lsof", "-ti", ":8022"]
+
+
+class TestWaitForExit:
+    """Test waiting for the server process to exit."""
+
+    def test_fallback_reaps_exited_child(self, monkeypatch):
+        """Without pidfd, a terminated child is reaped instead of waited on as a zombie."""
+        import os
+        import signal
+        import subprocess
+        import sys
+        import time
+        from mybb_mcp.orchestration import server_service
+
+        monkeypatch.delattr(server_service.os, "pidfd_open", raising=False)
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            os.kill(proc.pid, signal.SIGTERM)
+            started = time.monotonic()
+            assert _wait_for_exit(proc.pid, 5.0) is True
+            assert time.monotonic() - started < 2.0
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()